@@ -11,7 +11,7 @@ import shutil
 import tempfile
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, UploadFile, File, Request
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi.responses import StreamingResponse, FileResponse, Response
 from loguru import logger
 
 from backend.api.schemas import (
@@ -53,12 +53,13 @@ from backend.core.video import extract_clip, get_video_info
 from backend.processing.clips import ClipExporter
 from backend.detection.pipeline import ShotDetectionPipeline
 from backend.models.job import (
-    create_feedback,
+    create_feedback_bulk,
     create_job,
     create_shots,
     delete_job,
     get_all_feedback,
     get_all_jobs,
+    get_existing_job_ids,
     get_feedback_for_job,
     get_feedback_stats,
     get_job,
@@ -74,7 +75,7 @@ from backend.models.trajectory import (
     get_origin_feedback_stats,
     get_tracer_feedback_for_job,
     get_trajectory,
-    get_trajectories_for_job,
+    get_trajectories_json,
     update_trajectory as update_trajectory_db,
 )
 
@@ -89,6 +90,11 @@ def sse_event(event_type: str, data: dict) -> str:
 # This provides fast access during processing while database provides persistence
 _job_cache: dict[str, dict] = {}
 
+# IDs of cached jobs that may still be pending or processing. A superset of
+# the truly active jobs (callers re-check status), so scans over active jobs
+# don't have to walk every finished job in the cache.
+_active_job_ids: set[str] = set()
+
 # Event queues for SSE streaming per job
 _progress_queues: dict[str, asyncio.Queue] = {}
 
@@ -104,11 +110,29 @@ def _get_cached_job(job_id: str) -> Optional[dict]:
 def _cache_job(job_id: str, job: dict) -> None:
     """Add or update a job in the in-memory cache."""
     _job_cache[job_id] = job
+    if job["status"] in ("pending", "processing"):
+        _active_job_ids.add(job_id)
 
 
 def _remove_from_cache(job_id: str) -> None:
     """Remove a job from the in-memory cache."""
     _job_cache.pop(job_id, None)
+    _active_job_ids.discard(job_id)
+
+
+def _close_progress_queues() -> None:
+    """Drop all SSE progress queues and wake their streams so they end.
+
+    The mapping is emptied before the queues are signalled, so nothing new
+    is put into a queue that is being shut down. Each stream gets a None
+    sentinel; a full queue loses its oldest event to make room for it.
+    """
+    queues = list(_progress_queues.values())
+    _progress_queues.clear()
+    for queue in queues:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(None)
 
 
 async def _emit_progress(job_id: str, step: str, progress: float, details: Optional[str] = None):
@@ -487,6 +511,9 @@ async def run_detection_pipeline(job_id: str):
         await _emit_progress(job_id, "Error", job.get("progress", 0), details=str(e))
 
     finally:
+        if job["status"] not in ("pending", "processing"):
+            _active_job_ids.discard(job_id)
+
         # Clean up SSE queue after a delay (allow clients to receive final events)
         async def cleanup_queue():
             await asyncio.sleep(30)
@@ -556,6 +583,9 @@ async def stream_progress(job_id: str):
         while True:
             try:
                 event = await asyncio.wait_for(queue.get(), timeout=30.0)
+                if event is None:
+                    # Server is shutting down
+                    break
                 yield f"data: {event.model_dump_json()}\n\n"
 
                 # Check if job is complete (from cache or database)
@@ -1017,7 +1047,7 @@ async def stream_video(path: str, request: Request, download: bool = False):
 async def list_jobs(limit: int = 50, status: Optional[str] = None):
     """List all processing jobs with optional status filter."""
     # Get from database (source of truth for listing)
-    jobs = await get_all_jobs(limit=limit, status=status, include_shots=False)
+    jobs = await get_all_jobs(limit=limit, status=status, include_shots=False, light=True)
 
     job_list = [
         {
@@ -1115,10 +1145,9 @@ async def purge_old_jobs(days: int = 30):
     deleted_count = await db_purge_old_jobs(days=days)
 
     # Also remove deleted jobs from cache
-    for job_id in list(_job_cache.keys()):
-        job = await get_job(job_id)
-        if not job:
-            _remove_from_cache(job_id)
+    existing = await get_existing_job_ids(list(_job_cache))
+    for job_id in _job_cache.keys() - existing:
+        _remove_from_cache(job_id)
 
     stats = await get_database_stats()
 
@@ -1156,13 +1185,22 @@ async def export_all_jobs():
 
 
 @router.get("/feedback/export", response_model=FeedbackExportResponse)
-async def export_feedback(limit: int = 10000, offset: int = 0, feedback_type: Optional[str] = None):
+async def export_feedback(
+    limit: int = 10000,
+    offset: int = 0,
+    feedback_type: Optional[str] = None,
+    before_created_at: Optional[str] = None,
+    before_id: Optional[int] = None,
+):
     """Export all feedback data for analysis and model training.
 
     Args:
         limit: Maximum records to return (default 10000).
         offset: Number of records to skip for pagination.
         feedback_type: Filter by 'true_positive' or 'false_positive'.
+        before_created_at: With before_id, return only records older than this
+            cursor (the next_before_* values of the previous page).
+        before_id: See before_created_at.
 
     Returns:
         All feedback records with full detection feature snapshots.
@@ -1172,13 +1210,24 @@ async def export_feedback(limit: int = 10000, offset: int = 0, feedback_type: Op
             status_code=400,
             detail="feedback_type must be 'true_positive' or 'false_positive'"
         )
+    if (before_created_at is None) != (before_id is None):
+        raise HTTPException(
+            status_code=400,
+            detail="before_created_at and before_id must be given together"
+        )
 
-    records = await get_all_feedback(limit=limit, offset=offset, feedback_type=feedback_type)
+    before = (before_created_at, before_id) if before_id is not None else None
+    records = await get_all_feedback(
+        limit=limit, offset=offset, feedback_type=feedback_type, before=before
+    )
 
+    last = records[-1] if records and len(records) == limit else None
     return FeedbackExportResponse(
         exported_at=datetime.utcnow().isoformat(),
         total_records=len(records),
         records=records,
+        next_before_created_at=last["created_at"] if last else None,
+        next_before_id=last["id"] if last else None,
     )
 
 
@@ -1215,7 +1264,7 @@ async def submit_feedback(job_id: str, request: ShotFeedbackRequest):
     # Build shot lookup for snapshotting
     shots_by_id = {shot["id"]: shot for shot in job.get("shots", [])}
 
-    created_feedback = []
+    items = []
     for item in request.feedback:
         shot = shots_by_id.get(item.shot_id)
         if not shot:
@@ -1225,19 +1274,21 @@ async def submit_feedback(job_id: str, request: ShotFeedbackRequest):
             )
 
         # Snapshot detection features at feedback time
-        feedback_record = await create_feedback(
-            job_id=job_id,
-            shot_id=item.shot_id,
-            feedback_type=item.feedback_type.value,
-            notes=item.notes,
-            confidence_snapshot=shot.get("confidence"),
-            audio_confidence_snapshot=shot.get("audio_confidence"),
-            visual_confidence_snapshot=shot.get("visual_confidence"),
-            detection_features=shot.get("confidence_reasons"),
-            environment=get_environment(),
-        )
-
-        created_feedback.append(ShotFeedbackResponse(
+        items.append({
+            "job_id": job_id,
+            "shot_id": item.shot_id,
+            "feedback_type": item.feedback_type.value,
+            "notes": item.notes,
+            "confidence_snapshot": shot.get("confidence"),
+            "audio_confidence_snapshot": shot.get("audio_confidence"),
+            "visual_confidence_snapshot": shot.get("visual_confidence"),
+            "detection_features": shot.get("confidence_reasons"),
+            "environment": get_environment(),
+        })
+
+    # All items are stored in one transaction
+    created_feedback = [
+        ShotFeedbackResponse(
             id=feedback_record["id"],
             job_id=feedback_record["job_id"],
             shot_id=feedback_record["shot_id"],
@@ -1248,7 +1299,9 @@ async def submit_feedback(job_id: str, request: ShotFeedbackRequest):
             visual_confidence_snapshot=feedback_record["visual_confidence_snapshot"],
             created_at=feedback_record["created_at"],
             environment=feedback_record["environment"],
-        ))
+        )
+        for feedback_record in await create_feedback_bulk(items)
+    ]
 
     return created_feedback
 
@@ -1339,52 +1392,14 @@ async def get_shot_trajectory(job_id: str, shot_id: int):
 @router.get("/trajectories/{job_id}")
 async def get_job_trajectories(job_id: str):
     """Get all trajectories for a job."""
-    trajectories = await get_trajectories_for_job(job_id)
-
-    if not trajectories:
-        return {"job_id": job_id, "trajectories": []}
-
-    result = []
-    for t in trajectories:
-        points = [
-            TrajectoryPoint(
-                timestamp=p["timestamp"],
-                x=p["x"],
-                y=p["y"],
-                confidence=p.get("confidence", 0),
-                interpolated=p.get("interpolated", False),
-            )
-            for p in t["points"]
-        ]
-
-        apex = None
-        if t["apex_point"]:
-            ap = t["apex_point"]
-            apex = TrajectoryPoint(
-                timestamp=ap.get("timestamp", 0),
-                x=ap["x"],
-                y=ap["y"],
-                confidence=1.0,
-                interpolated=False,
-            )
+    # SQLite builds the trajectory list JSON directly; only the envelope is
+    # assembled here
+    trajectories = await get_trajectories_json(job_id)
 
-        result.append(TrajectoryData(
-            shot_id=t["shot_id"],
-            points=points,
-            confidence=t["confidence"],
-            smoothness_score=t["smoothness_score"],
-            physics_plausibility=t["physics_plausibility"],
-            apex_point=apex,
-            launch_angle=t["launch_angle"],
-            flight_duration=t["flight_duration"],
-            has_gaps=t["has_gaps"],
-            gap_count=t["gap_count"],
-            is_manual_override=t["is_manual_override"],
-            frame_width=t["frame_width"],
-            frame_height=t["frame_height"],
-        ))
-
-    return {"job_id": job_id, "trajectories": result}
+    return Response(
+        content=f'{{"job_id": {json.dumps(job_id)}, "trajectories": {trajectories}}}',
+        media_type="application/json",
+    )
 
 
 @router.put("/trajectory/{job_id}/{shot_id}")
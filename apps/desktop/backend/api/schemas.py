@@ -262,6 +262,9 @@ class FeedbackExportResponse(BaseModel):
     exported_at: str
     total_records: int
     records: list[dict[str, Any]]
+    # Pass back as before_created_at/before_id to get the next page; None on the last page
+    next_before_created_at: Optional[str] = None
+    next_before_id: Optional[int] = None
 
 
 # === TRAJECTORY SCHEMAS (Phase 2) ===
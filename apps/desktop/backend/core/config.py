@@ -11,6 +11,10 @@ class Settings(BaseSettings):
     host: str = "127.0.0.1"
     port: int = 8420
     debug: bool = True
+    # Connections served at once before new ones get 503, and the listen
+    # socket's pending-connection queue
+    limit_concurrency: int = 1024
+    backlog: int = 2048
 
     # Paths
     temp_dir: Path = Path.home() / ".golfclip" / "temp"
@@ -27,6 +31,13 @@ class Settings(BaseSettings):
     # COCO's "sports ball" class is trained on larger balls (soccer, basketball)
     # so golf balls score much lower. Size filtering handles false positives.
     yolo_confidence: float = 0.03
+    # Frames per YOLO inference call when scanning video segments
+    yolo_batch_size: int = 16
+    # Export and cache a compiled inference engine (TensorRT, CoreML, OpenVINO
+    # or TorchScript) next to the weights; disable to always run eager PyTorch
+    yolo_engine_cache: bool = True
+    # Run eager PyTorch weights in FP16 on CUDA and MPS
+    yolo_half: bool = True
     audio_sample_rate: int = 44100
 
     # Audio detection sensitivity (0-1, higher = more sensitive, more detections)
@@ -1,6 +1,10 @@
 """SQLite database setup and connection management for GolfClip."""
 
+import asyncio
 import json
+import math
+import os
+import struct
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -9,31 +13,74 @@ from typing import Any, AsyncGenerator, Optional
 import aiosqlite
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Database path in user's home directory
 DB_PATH = Path.home() / ".golfclip" / "golfclip.db"
 
 # Current schema version - increment when making schema changes
-SCHEMA_VERSION = 7
+SCHEMA_VERSION = 11
 
-# Global connection pool (single connection for SQLite)
+# Global writer connection (SQLite allows a single writer at a time)
 _db_connection: Optional[aiosqlite.Connection] = None
 
+# Held for every transaction on the writer connection (see get_writer()), so
+# one caller's commit or rollback never ends another's statements
+_writer_lock: Optional[asyncio.Lock] = None
+
+# Read-only connections, checked out by get_reader(). In WAL mode each reads
+# its own snapshot concurrently with the writer and with each other.
+_READER_POOL_SIZE = min(os.cpu_count() or 1, 4)
+_STATEMENT_CACHE_SIZE = 256
+_readers: list[aiosqlite.Connection] = []
+_reader_pool: Optional[asyncio.Queue[aiosqlite.Connection]] = None
+
+
+async def _connect(query_only: bool = False) -> aiosqlite.Connection:
+    """Open a connection to DB_PATH with the shared per-connection pragmas."""
+    # sqlite3 keeps compiled statements in a per-connection LRU keyed by SQL
+    # text; the default 128 slots is less than the distinct queries we run
+    conn = await aiosqlite.connect(str(DB_PATH), cached_statements=_STATEMENT_CACHE_SIZE)
+    conn.row_factory = aiosqlite.Row
+
+    # Keep temp tables/indices in memory, use a 64 MB page cache and
+    # memory-map up to 256 MB of the file for reads
+    await conn.execute("PRAGMA temp_store=MEMORY")
+    await conn.execute("PRAGMA cache_size=-64000")
+    await conn.execute("PRAGMA mmap_size=268435456")
+
+    # Wait for a competing writer (e.g. the ML CLI) instead of failing
+    # immediately with "database is locked"
+    await conn.execute("PRAGMA busy_timeout=5000")
+
+    if query_only:
+        await conn.execute("PRAGMA query_only=1")
+
+    return conn
+
 
 async def init_db() -> None:
     """Initialize the database, creating tables if they don't exist."""
-    global _db_connection
+    global _db_connection, _reader_pool, _writer_lock
 
     # Ensure directory exists
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     logger.info(f"Initializing database at {DB_PATH}")
 
-    _db_connection = await aiosqlite.connect(str(DB_PATH))
-    _db_connection.row_factory = aiosqlite.Row
+    _db_connection = await _connect()
+    _writer_lock = asyncio.Lock()
 
     # Enable WAL mode for better concurrent read performance
     await _db_connection.execute("PRAGMA journal_mode=WAL")
 
+    # In WAL mode NORMAL only syncs at checkpoints, which is still safe
+    # against corruption and avoids an fsync on every commit
+    await _db_connection.execute("PRAGMA synchronous=NORMAL")
+
     # Enable foreign keys
     await _db_connection.execute("PRAGMA foreign_keys = ON")
 
@@ -60,6 +107,13 @@ async def init_db() -> None:
 
     await _db_connection.commit()
 
+    # Open readers only once the schema is current
+    await _close_readers()
+    _readers[:] = [await _connect(query_only=True) for _ in range(_READER_POOL_SIZE)]
+    _reader_pool = asyncio.Queue()
+    for reader in _readers:
+        _reader_pool.put_nowait(reader)
+
     logger.info(f"Database initialized successfully (schema version {SCHEMA_VERSION})")
 
 
@@ -79,6 +133,14 @@ async def _apply_migrations(current_version: int) -> None:
         await _migrate_v6()
     if current_version < 7:
         await _migrate_v7()
+    if current_version < 8:
+        await _migrate_v8()
+    if current_version < 9:
+        await _migrate_v9()
+    if current_version < 10:
+        await _migrate_v10()
+    if current_version < 11:
+        await _migrate_v11()
 
 
 async def _migrate_v1() -> None:
@@ -338,17 +400,154 @@ async def _migrate_v7() -> None:
     logger.info("Migration v7 applied successfully")
 
 
+async def _migrate_v8() -> None:
+    """Add packed detection feature vectors to shot_feedback."""
+    logger.info("Applying migration v8: Packed detection features on shot_feedback")
+
+    await _db_connection.execute(
+        "ALTER TABLE shot_feedback ADD COLUMN detection_features_blob BLOB"
+    )
+
+    # Backfill from the existing JSON so the ML stages can read vectors only
+    async with _db_connection.execute(
+        "SELECT id, detection_features_json FROM shot_feedback "
+        "WHERE detection_features_json IS NOT NULL"
+    ) as cursor:
+        rows = await cursor.fetchall()
+    packed = [
+        (blob, row["id"])
+        for row in rows
+        if (blob := pack_detection_features(deserialize_json(row["detection_features_json"])))
+    ]
+    if packed:
+        await _db_connection.executemany(
+            "UPDATE shot_feedback SET detection_features_blob = ? WHERE id = ?", packed
+        )
+
+    await _db_connection.execute(
+        "INSERT OR IGNORE INTO schema_version (version, applied_at, description) VALUES (?, ?, ?)",
+        (8, datetime.utcnow().isoformat(), "Packed detection feature vectors on shot_feedback"),
+    )
+
+    logger.info(f"Migration v8 applied successfully ({len(packed)} feature vectors backfilled)")
+
+
+async def _migrate_v9() -> None:
+    """Index shot_feedback by (created_at, id) for keyset pagination."""
+    logger.info("Applying migration v9: Feedback keyset pagination index")
+
+    await _db_connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_feedback_created_id ON shot_feedback(created_at, id)"
+    )
+
+    await _db_connection.execute(
+        "INSERT OR IGNORE INTO schema_version (version, applied_at, description) VALUES (?, ?, ?)",
+        (9, datetime.utcnow().isoformat(), "Feedback (created_at, id) index for keyset pagination"),
+    )
+
+    logger.info("Migration v9 applied successfully")
+
+
+async def _migrate_v10() -> None:
+    """Composite indexes matching the per-job and filtered-list query orders."""
+    logger.info("Applying migration v10: Composite lookup indexes")
+
+    # Each new index has the old single-column one as its prefix, so the old
+    # ones are dropped rather than maintained alongside. shot_trajectories
+    # already has UNIQUE(job_id, shot_id).
+    await _db_connection.executescript(
+        """
+        CREATE INDEX IF NOT EXISTS idx_shots_job_shot ON shots(job_id, shot_number);
+        DROP INDEX IF EXISTS idx_shots_job_id;
+
+        CREATE INDEX IF NOT EXISTS idx_feedback_job_shot ON shot_feedback(job_id, shot_id);
+        DROP INDEX IF EXISTS idx_feedback_job;
+
+        CREATE INDEX IF NOT EXISTS idx_feedback_type_created
+            ON shot_feedback(feedback_type, created_at, id);
+        DROP INDEX IF EXISTS idx_feedback_type;
+        """
+    )
+
+    await _db_connection.execute(
+        "INSERT OR IGNORE INTO schema_version (version, applied_at, description) VALUES (?, ?, ?)",
+        (10, datetime.utcnow().isoformat(), "Composite indexes for per-job and filtered feedback queries"),
+    )
+
+    logger.info("Migration v10 applied successfully")
+
+
+async def _migrate_v11() -> None:
+    """Per-type shot_feedback counts kept current by triggers."""
+    logger.info("Applying migration v11: Feedback counters")
+
+    await _db_connection.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS feedback_counters (
+            feedback_type TEXT PRIMARY KEY,
+            n INTEGER NOT NULL DEFAULT 0
+        );
+
+        CREATE TRIGGER IF NOT EXISTS trg_feedback_count_insert
+        AFTER INSERT ON shot_feedback
+        BEGIN
+            INSERT INTO feedback_counters (feedback_type, n) VALUES (NEW.feedback_type, 1)
+            ON CONFLICT(feedback_type) DO UPDATE SET n = n + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_feedback_count_delete
+        AFTER DELETE ON shot_feedback
+        BEGIN
+            UPDATE feedback_counters SET n = n - 1 WHERE feedback_type = OLD.feedback_type;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_feedback_count_update
+        AFTER UPDATE OF feedback_type ON shot_feedback
+        WHEN NEW.feedback_type IS NOT OLD.feedback_type
+        BEGIN
+            UPDATE feedback_counters SET n = n - 1 WHERE feedback_type = OLD.feedback_type;
+            INSERT INTO feedback_counters (feedback_type, n) VALUES (NEW.feedback_type, 1)
+            ON CONFLICT(feedback_type) DO UPDATE SET n = n + 1;
+        END;
+
+        DELETE FROM feedback_counters;
+        INSERT INTO feedback_counters (feedback_type, n)
+        SELECT feedback_type, COUNT(*) FROM shot_feedback GROUP BY feedback_type;
+        """
+    )
+
+    await _db_connection.execute(
+        "INSERT OR IGNORE INTO schema_version (version, applied_at, description) VALUES (?, ?, ?)",
+        (11, datetime.utcnow().isoformat(), "Trigger-maintained feedback counters"),
+    )
+
+    logger.info("Migration v11 applied successfully")
+
+
+async def _close_readers() -> None:
+    """Close and forget the read-only connections, if any are open."""
+    global _reader_pool
+    _reader_pool = None
+    for reader in _readers:
+        await reader.close()
+    _readers.clear()
+
+
 async def close_db() -> None:
-    """Close the database connection."""
+    """Close the database connections."""
     global _db_connection
+    await _close_readers()
     if _db_connection:
         await _db_connection.close()
         _db_connection = None
         logger.info("Database connection closed")
 
 
-async def get_db() -> aiosqlite.Connection:
-    """Get the database connection.
+def get_db_sync() -> aiosqlite.Connection:
+    """Get the database connection without awaiting.
+
+    The connection is opened once by init_db(), so model helpers can fetch
+    it without an extra suspension point per query.
 
     Returns:
         The active database connection.
@@ -361,6 +560,165 @@ async def get_db() -> aiosqlite.Connection:
     return _db_connection
 
 
+async def get_db() -> aiosqlite.Connection:
+    """Get the database connection.
+
+    Returns:
+        The active database connection.
+
+    Raises:
+        RuntimeError: If the database has not been initialized.
+    """
+    return get_db_sync()
+
+
+@asynccontextmanager
+async def get_writer() -> AsyncGenerator[aiosqlite.Connection, None]:
+    """Hold the writer connection for one transaction.
+
+    Every write goes through here (the WriteBatcher included), so the
+    transaction's statements, commit and any rollback can't interleave with
+    another writer's. Commit or roll back before leaving the block, and don't
+    call helpers that write from inside it.
+
+    Usage:
+        async with get_writer() as db:
+            await db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+            await db.commit()
+
+    Raises:
+        RuntimeError: If the database has not been initialized.
+    """
+    db = get_db_sync()
+    async with _writer_lock:
+        yield db
+
+
+class WriteBatcher:
+    """Coalesces writes submitted in the same event-loop tick into one commit.
+
+    The first submit() starts a flush task; anything submitted before it
+    runs joins the batch. The flush executes the statements in order on the
+    writer connection and commits once, so a burst of small updates (e.g.
+    job progress) costs one transaction instead of one each. Writes that
+    arrive while a batch is committing form the next batch of the same
+    task, so batches never interleave.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[tuple[str, Any, asyncio.Future]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, sql: str, params: Any = ()) -> int:
+        """Queue a write and wait until its batch is committed.
+
+        Returns:
+            The statement's rowcount.
+
+        Raises:
+            Whatever the statement or the commit raised; the whole batch is
+            rolled back in that case.
+        """
+        return await self.enqueue(sql, params)
+
+    def enqueue(self, sql: str, params: Any = ()) -> asyncio.Future:
+        """Queue a write without waiting for it.
+
+        Writes run in the order they are queued, so anything queued after
+        this call returns is written after it.
+
+        Returns:
+            Future resolving as submit() does.
+        """
+        loop = asyncio.get_running_loop()
+        if self._task is not None and self._task.get_loop() is not loop:
+            # Left behind by a closed loop; its task and waiters are gone
+            self._pending = [p for p in self._pending if p[2].get_loop() is loop]
+            self._task = None
+
+        future = loop.create_future()
+        self._pending.append((sql, params, future))
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._flush())
+        return future
+
+    async def _flush(self) -> None:
+        while self._pending:
+            batch, self._pending = self._pending, []
+            await self._commit(batch)
+
+    @staticmethod
+    async def _commit(batch: list[tuple[str, Any, asyncio.Future]]) -> None:
+        try:
+            async with get_writer() as db:
+                try:
+                    rowcounts = []
+                    for sql, params, _ in batch:
+                        cursor = await db.execute(sql, params)
+                        rowcounts.append(cursor.rowcount)
+                    await db.commit()
+                except Exception:
+                    try:
+                        await db.rollback()
+                    except Exception:
+                        logger.exception("Rollback after a failed write batch failed")
+                    raise
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), rowcount in zip(batch, rowcounts):
+            if not future.done():
+                future.set_result(rowcount)
+
+
+_write_batcher = WriteBatcher()
+
+
+async def submit_write(sql: str, params: Any = ()) -> int:
+    """Run a single-statement write through the shared WriteBatcher.
+
+    Returns:
+        The statement's rowcount, once its batch has been committed.
+    """
+    return await _write_batcher.submit(sql, params)
+
+
+def queue_write(sql: str, params: Any = ()) -> asyncio.Future:
+    """Queue a single-statement write on the shared WriteBatcher without waiting.
+
+    Returns:
+        Future resolving to the statement's rowcount once its batch is
+        committed; later writes are executed after this one.
+    """
+    return _write_batcher.enqueue(sql, params)
+
+
+@asynccontextmanager
+async def get_reader() -> AsyncGenerator[aiosqlite.Connection, None]:
+    """Check out a read-only connection for the duration of the block.
+
+    Falls back to the writer connection if no readers are open. Keep the
+    block to a single query: don't call other helpers that take a reader
+    while holding one.
+
+    Usage:
+        async with get_reader() as db, db.execute("SELECT * FROM jobs") as cursor:
+            rows = await cursor.fetchall()
+    """
+    pool = _reader_pool
+    if pool is None:
+        yield get_db_sync()
+        return
+    conn = await pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put_nowait(conn)
+
+
 @asynccontextmanager
 async def get_db_cursor() -> AsyncGenerator[aiosqlite.Cursor, None]:
     """Get a database cursor with automatic cleanup.
@@ -378,19 +736,102 @@ async def get_db_cursor() -> AsyncGenerator[aiosqlite.Cursor, None]:
         await cursor.close()
 
 
+def _json_default(data: Any) -> Any:
+    """Convert NumPy scalars and arrays for json.dumps, as orjson does."""
+    if hasattr(data, "tolist"):
+        return data.tolist()
+    raise TypeError(f"Object of type {type(data).__name__} is not JSON serializable")
+
+
+def _finite_json(data: Any) -> Any:
+    """Copy of JSON-ready data with NaN/Infinity floats replaced by None."""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _finite_json(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_finite_json(value) for value in data]
+    if hasattr(data, "tolist"):
+        return _finite_json(data.tolist())
+    return data
+
+
+def _json_dumps(data: dict | list) -> str:
+    # Written like orjson writes it: compact separators (trajectories are
+    # mostly punctuation), raw UTF-8 text and NumPy values as plain numbers.
+    # Non-finite floats are stored as null rather than as NaN/Infinity
+    # tokens that aren't JSON; the walk to replace them only runs when a
+    # dump hits one.
+    options = {"separators": (",", ":"), "ensure_ascii": False, "allow_nan": False}
+    try:
+        return json.dumps(data, default=_json_default, **options)
+    except ValueError:
+        return json.dumps(_finite_json(data), default=_json_default, **options)
+
+
+def _orjson_dumps(data: dict | list) -> str:
+    # Non-string keys are stringified, as json.dumps does
+    return orjson.dumps(
+        data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+def _orjson_loads(data: str) -> dict | list:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # Rows stored before non-finite values were written as null may
+        # hold NaN/Infinity tokens, which orjson rejects
+        return json.loads(data)
+
+
+# JSON codec, picked once at import: orjson when installed, else stdlib json.
+# Both write the same text for the same data, so the stored rows don't
+# depend on which one is installed.
+if orjson is not None:
+    _dumps = _orjson_dumps
+    _loads = _orjson_loads
+else:
+    _dumps = _json_dumps
+    _loads = json.loads
+
+
 # Helper functions for JSON serialization
 def serialize_json(data: Optional[dict | list]) -> Optional[str]:
     """Serialize a dict or list to JSON string for storage."""
     if data is None:
         return None
-    return json.dumps(data)
+    return _dumps(data)
 
 
 def deserialize_json(data: Optional[str]) -> Optional[dict | list]:
-    """Deserialize a JSON string from storage."""
-    if data is None:
+    """Deserialize a JSON string from storage; NULL or empty gives None."""
+    if not data:
+        return None
+    return _loads(data)
+
+
+# Order of the values in shot_feedback.detection_features_blob; must match
+# FEATURE_KEY_MAP in backend.ml.stages
+DETECTION_FEATURE_KEYS = (
+    "peak_height", "spectral_flatness", "frequency_centroid", "onset_strength",
+    "rise_time", "decay_ratio", "zero_crossing_rate",
+)
+_FEATURE_STRUCT = struct.Struct(f"<{len(DETECTION_FEATURE_KEYS)}d")
+
+
+def pack_detection_features(features: Any) -> Optional[bytes]:
+    """Pack a detection feature dict into little-endian float64 values.
+
+    Missing keys default to 0.5, as in weight training. Returns None for
+    anything that is not a non-empty dict of numbers.
+    """
+    if not features or not isinstance(features, dict):
+        return None
+    try:
+        return _FEATURE_STRUCT.pack(*[features.get(key, 0.5) for key in DETECTION_FEATURE_KEYS])
+    except struct.error:
         return None
-    return json.loads(data)
 
 
 async def get_schema_version() -> int:
@@ -414,20 +855,19 @@ async def purge_old_jobs(days: int = 30) -> int:
     Returns:
         Number of jobs deleted.
     """
-    db = await get_db()
-
     cutoff_date = (datetime.utcnow() - timedelta(days=days)).isoformat()
 
     # Only delete non-active jobs
-    cursor = await db.execute(
-        """
-        DELETE FROM jobs
-        WHERE status IN ('complete', 'cancelled', 'error')
-        AND created_at < ?
-        """,
-        (cutoff_date,),
-    )
-    await db.commit()
+    async with get_writer() as db:
+        cursor = await db.execute(
+            """
+            DELETE FROM jobs
+            WHERE status IN ('complete', 'cancelled', 'error')
+            AND created_at < ?
+            """,
+            (cutoff_date,),
+        )
+        await db.commit()
 
     deleted_count = cursor.rowcount
     if deleted_count > 0:
@@ -871,18 +871,18 @@ class BallOriginDetector:
             return None
 
         # Check if detection is within zone
-        ball_x, ball_y = detection["center"]
+        ball_x, ball_y = detection.center
         x1, y1, x2, y2 = zone
 
         if x1 <= ball_x <= x2 and y1 <= ball_y <= y2:
             logger.debug(
                 f"Ball detected in zone at ({ball_x:.0f},{ball_y:.0f}), "
-                f"conf={detection['confidence']:.3f}"
+                f"conf={detection.confidence:.3f}"
             )
             return {
                 "x": ball_x,
                 "y": ball_y,
-                "confidence": detection["confidence"],
+                "confidence": detection.confidence,
             }
 
         logger.debug(
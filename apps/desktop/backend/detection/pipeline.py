@@ -14,7 +14,7 @@ from backend.detection.classifier import ShotClassifier
 from backend.detection.origin import BallOriginDetector
 from backend.detection.tracker import ConstrainedBallTracker
 from backend.detection.visual import BallDetector
-from backend.models.trajectory import create_trajectory
+from backend.models.trajectory import create_trajectories_bulk
 
 
 class PipelineError(Exception):
@@ -195,6 +195,32 @@ class ShotDetectionPipeline:
             confirmed_shots = []
             total_strikes = len(audio_strikes)
 
+            # Look for the ball around every strike in one pass: the search
+            # windows (1 second before to 0.5 seconds after each audio strike)
+            # are decoded in parallel and share inference batches (40-60%)
+            search_windows = [
+                (
+                    max(0, strike["timestamp"] - 1.0),
+                    min(self.video_info.duration, strike["timestamp"] + 0.5),
+                )
+                for strike in audio_strikes
+            ]
+
+            def detection_progress(p: float):
+                report_progress("Analyzing video for ball detection", 40 + p * 0.2)
+
+            detection_error: Optional[Exception] = None
+            try:
+                strike_detections = self.ball_detector.detect_ball_in_segments(
+                    self.video_path,
+                    search_windows,
+                    sample_fps=30.0,  # Higher FPS for precision
+                    progress_callback=detection_progress,
+                )
+            except Exception as e:
+                detection_error = e
+                strike_detections = [None] * total_strikes
+
             for i, strike in enumerate(audio_strikes):
                 self._check_cancelled()
 
@@ -208,20 +234,13 @@ class ShotDetectionPipeline:
                     "confidence": audio_confidence,
                 }
 
-                # Look for ball in frames around the strike
-                # Check 1 second before and 0.5 seconds after the audio strike
-                search_start = max(0, strike_time - 1.0)
-                search_end = min(self.video_info.duration, strike_time + 0.5)
-
-                try:
-                    detections = self.ball_detector.detect_ball_in_video_segment(
-                        self.video_path,
-                        search_start,
-                        search_end,
-                        sample_fps=30.0,  # Higher FPS for precision
+                # Ball detections in the frames around the strike
+                detections = strike_detections[i]
+                if detections is None:
+                    logger.warning(
+                        f"Visual detection failed for strike at {strike_time:.2f}s: "
+                        f"{detection_error}"
                     )
-                except Exception as e:
-                    logger.warning(f"Visual detection failed for strike at {strike_time:.2f}s: {e}")
                     # Use audio-only for this strike
                     confirmed_shots.append({
                         "strike_time": strike_time,
@@ -369,9 +388,10 @@ class ShotDetectionPipeline:
                     })
 
                 # Report progress for visual analysis
-                progress = 40 + ((i + 1) / total_strikes) * 40
+                progress = 60 + ((i + 1) / total_strikes) * 20
                 report_progress("Analyzing video for ball detection", progress)
 
+            self.ball_detector.close_caches()
             logger.info(f"Confirmed {len(confirmed_shots)} shots after visual analysis")
 
             report_progress("Analyzing video for ball detection", 80)
@@ -380,78 +400,85 @@ class ShotDetectionPipeline:
             self._check_cancelled()
             report_progress("Estimating ball landing times", 80)
 
-            for i, shot in enumerate(confirmed_shots):
-                self._check_cancelled()
+            trajectories: list[dict] = []
+            # Trajectories already collected are stored even if the loop is
+            # cancelled or fails part way
+            try:
+                for i, shot in enumerate(confirmed_shots):
+                    self._check_cancelled()
 
-                landing_time, landing_confidence = await self._estimate_landing_time(
-                    shot["strike_time"]
-                )
+                    landing_time, landing_confidence = await self._estimate_landing_time(
+                        shot["strike_time"]
+                    )
 
-                # Calculate clip boundaries
-                clip_start = max(0, shot["strike_time"] - settings.clip_padding_before)
-                clip_end = min(
-                    self.video_info.duration,
-                    landing_time + settings.clip_padding_after if landing_time else shot["strike_time"] + 10.0,
-                )
+                    # Calculate clip boundaries
+                    clip_start = max(0, shot["strike_time"] - settings.clip_padding_before)
+                    clip_end = min(
+                        self.video_info.duration,
+                        landing_time + settings.clip_padding_after if landing_time else shot["strike_time"] + 10.0,
+                    )
 
-                # Classify shot type
-                clip_duration = (landing_time or shot["strike_time"] + 5.0) - shot["strike_time"]
-                shot_type, type_confidence = self.shot_classifier.classify(
-                    audio_features=shot.get("audio_features"),
-                    visual_features=shot.get("visual_features"),
-                    clip_duration=clip_duration,
-                )
+                    # Classify shot type
+                    clip_duration = (landing_time or shot["strike_time"] + 5.0) - shot["strike_time"]
+                    shot_type, type_confidence = self.shot_classifier.classify(
+                        audio_features=shot.get("audio_features"),
+                        visual_features=shot.get("visual_features"),
+                        clip_duration=clip_duration,
+                    )
+
+                    # Build confidence reasons
+                    reasons = []
+                    if shot["audio_confidence"] < 0.5:
+                        reasons.append("Audio strike unclear")
+                    if shot["visual_confidence"] < 0.5:
+                        reasons.append("Ball detection uncertain")
+                    if landing_confidence < 0.5:
+                        reasons.append("Landing time estimated")
+                    if type_confidence < 0.5:
+                        reasons.append(f"Shot type ({shot_type}) uncertain")
 
-                # Build confidence reasons
-                reasons = []
-                if shot["audio_confidence"] < 0.5:
-                    reasons.append("Audio strike unclear")
-                if shot["visual_confidence"] < 0.5:
-                    reasons.append("Ball detection uncertain")
-                if landing_confidence < 0.5:
-                    reasons.append("Landing time estimated")
-                if type_confidence < 0.5:
-                    reasons.append(f"Shot type ({shot_type}) uncertain")
-
-                shots.append(
-                    DetectedShot(
-                        id=i + 1,
-                        strike_time=shot["strike_time"],
-                        landing_time=landing_time,
-                        clip_start=clip_start,
-                        clip_end=clip_end,
-                        confidence=shot["combined_confidence"] * landing_confidence,
-                        confidence_reasons=reasons,
-                        shot_type=shot_type,
-                        audio_confidence=shot["audio_confidence"],
-                        visual_confidence=shot["visual_confidence"],
+                    shots.append(
+                        DetectedShot(
+                            id=i + 1,
+                            strike_time=shot["strike_time"],
+                            landing_time=landing_time,
+                            clip_start=clip_start,
+                            clip_end=clip_end,
+                            confidence=shot["combined_confidence"] * landing_confidence,
+                            confidence_reasons=reasons,
+                            shot_type=shot_type,
+                            audio_confidence=shot["audio_confidence"],
+                            visual_confidence=shot["visual_confidence"],
+                        )
                     )
-                )
 
-                # Store trajectory if available
-                if job_id and shot.get("visual_features") and shot["visual_features"].get("trajectory"):
-                    vf = shot["visual_features"]
+                    # Collect trajectory if available; stored together after the loop
+                    if job_id and shot.get("visual_features") and shot["visual_features"].get("trajectory"):
+                        vf = shot["visual_features"]
+                        trajectories.append({
+                            "job_id": job_id,
+                            "shot_id": i + 1,
+                            "trajectory_points": vf["trajectory"],
+                            "confidence": vf.get("trajectory_confidence", 0),
+                            "smoothness_score": vf.get("smoothness_score"),
+                            "physics_plausibility": vf.get("physics_plausibility"),
+                            "apex_point": vf.get("apex_point"),
+                            "launch_angle": vf.get("launch_angle"),
+                            "flight_duration": vf.get("flight_duration"),
+                            "has_gaps": vf.get("has_gaps", False),
+                            "gap_count": vf.get("gap_count", 0),
+                            "frame_width": self._frame_width or 1920,
+                            "frame_height": self._frame_height or 1080,
+                        })
+
+                    progress = 80 + ((i + 1) / max(1, len(confirmed_shots))) * 20
+                    report_progress("Estimating ball landing times", progress)
+            finally:
+                if trajectories:
                     try:
-                        await create_trajectory(
-                            job_id=job_id,
-                            shot_id=i + 1,
-                            trajectory_points=vf["trajectory"],
-                            confidence=vf.get("trajectory_confidence", 0),
-                            smoothness_score=vf.get("smoothness_score"),
-                            physics_plausibility=vf.get("physics_plausibility"),
-                            apex_point=vf.get("apex_point"),
-                            launch_angle=vf.get("launch_angle"),
-                            flight_duration=vf.get("flight_duration"),
-                            has_gaps=vf.get("has_gaps", False),
-                            gap_count=vf.get("gap_count", 0),
-                            frame_width=self._frame_width or 1920,
-                            frame_height=self._frame_height or 1080,
-                        )
+                        await create_trajectories_bulk(trajectories)
                     except Exception as e:
-                        logger.warning(f"Failed to store trajectory for shot {i+1}: {e}")
-
-                progress = 80 + ((i + 1) / max(1, len(confirmed_shots))) * 20
-                report_progress("Estimating ball landing times", progress)
+                        logger.warning(f"Failed to store {len(trajectories)} trajectories: {e}")
 
             report_progress("Detection complete", 100)
 
@@ -524,6 +551,7 @@ class ShotDetectionPipeline:
                     current_time,
                     search_end,
                     sample_fps=10.0,
+                    adaptive=True,  # A ball resting at address needs few samples
                 )
 
                 # Check if ball is in motion
@@ -585,6 +613,7 @@ class ShotDetectionPipeline:
             progress = start_progress + ((current_time / duration) * (100 - start_progress))
             report_progress("Visual-only detection", min(99, progress))
 
+        self.ball_detector.close_caches()
         report_progress("Detection complete", 100)
         logger.info(f"Visual-only detection found {len(shots)} potential shots")
 
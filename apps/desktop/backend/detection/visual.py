@@ -1,6 +1,10 @@
 """Visual analysis for detecting golf balls using YOLO."""
 
 import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Optional, Union, overload
@@ -8,19 +12,47 @@ from typing import Callable, Optional, Union, overload
 import cv2
 import numpy as np
 import torch
+from filelock import FileLock
 from loguru import logger
 from ultralytics import YOLO
 
+try:
+    from ultralytics.utils.nms import non_max_suppression
+except ImportError:  # Older ultralytics releases keep NMS in ops
+    from ultralytics.utils.ops import non_max_suppression
+
 from backend.core.config import settings
 
 # Global flag to track model download status
 _model_ready: bool = False
 
+# While the model is missing, is_model_ready() re-checks the filesystem at
+# most this often (monotonic seconds of the last check)
+_MODEL_CHECK_TTL = 2.0
+_model_checked_at: float = 0.0
+
+# Coalesces concurrent ensure_model_downloaded() calls in this process
+_download_lock = asyncio.Lock()
+
+# Loaded models shared by all BallDetector instances, keyed by (weights path,
+# device, batch size), as (model, primed predictor, backend name, FP16 weights
+# flag, lock held around inference); TensorRT engines only take batches up to
+# the size they were built for
+_shared_models: dict[
+    tuple[Path, str, int], tuple[YOLO, object, str, bool, threading.Lock]
+] = {}
+# Per key, the lock held while that model is built (loading, engine export
+# and warm-up can take minutes); _shared_models_lock only guards the dicts
+_shared_model_build_locks: dict[tuple[Path, str, int], threading.Lock] = {}
+_shared_models_lock = threading.Lock()
+
 
 def _download_model_sync() -> bool:
     """Synchronous implementation of model download.
 
-    Downloads the model to the configured models directory.
+    Downloads the model to the configured models directory. A lock file next
+    to the weights keeps several worker processes from downloading into the
+    same path at once; the others wait and then find the finished file.
 
     Returns:
         True if model is ready (exists or downloaded successfully),
@@ -30,26 +62,27 @@ def _download_model_sync() -> bool:
 
     model_path = settings.models_dir / settings.yolo_model
 
-    # Already downloaded
-    if model_path.exists():
-        logger.info(f"YOLO model already exists at {model_path}")
-        _model_ready = True
-        return True
-
     # Ensure models directory exists
     settings.models_dir.mkdir(parents=True, exist_ok=True)
 
-    try:
-        logger.info(f"Downloading YOLO model {settings.yolo_model} to {model_path}...")
-        # Pass full path to YOLO - it will download to this location
-        YOLO(str(model_path))
-        logger.info(f"YOLO model downloaded successfully to {model_path}")
-        _model_ready = True
-        return True
-    except Exception as e:
-        logger.warning(f"Failed to download YOLO model: {e}")
-        _model_ready = False
-        return False
+    with FileLock(f"{model_path}.lock"):
+        # Already downloaded
+        if model_path.exists():
+            logger.info(f"YOLO model already exists at {model_path}")
+            _model_ready = True
+            return True
+
+        try:
+            logger.info(f"Downloading YOLO model {settings.yolo_model} to {model_path}...")
+            # Pass full path to YOLO - it will download to this location
+            YOLO(str(model_path))
+            logger.info(f"YOLO model downloaded successfully to {model_path}")
+            _model_ready = True
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to download YOLO model: {e}")
+            _model_ready = False
+            return False
 
 
 async def ensure_model_downloaded() -> bool:
@@ -59,26 +92,38 @@ async def ensure_model_downloaded() -> bool:
     This should be called during app startup to avoid delays
     during first video processing.
 
-    Runs in a thread to avoid blocking the event loop.
+    Runs in a thread to avoid blocking the event loop. Concurrent callers
+    share one download instead of each queueing their own.
 
     Returns:
         True if model is ready (exists or downloaded successfully),
         False if download failed.
     """
-    return await asyncio.to_thread(_download_model_sync)
+    if _model_ready:
+        return True
+    async with _download_lock:
+        # Another caller may have finished the download while we waited
+        if _model_ready:
+            return True
+        return await asyncio.to_thread(_download_model_sync)
 
 
 def is_model_ready() -> bool:
     """Check if the YOLO model has been downloaded.
 
-    Uses cached value if available to avoid repeated filesystem checks.
+    Uses cached value if available to avoid repeated filesystem checks; a
+    missing model is re-checked at most every _MODEL_CHECK_TTL seconds.
 
     Returns:
         True if model file exists.
     """
-    global _model_ready
+    global _model_ready, _model_checked_at
     if _model_ready:
         return True
+    now = time.monotonic()
+    if _model_checked_at and now - _model_checked_at < _MODEL_CHECK_TTL:
+        return False
+    _model_checked_at = now
     _model_ready = (settings.models_dir / settings.yolo_model).exists()
     return _model_ready
 
@@ -106,9 +151,76 @@ def get_model_status() -> dict:
     return result
 
 
-@dataclass
+def _acceleration_variance_numpy(
+    timestamps: np.ndarray, x_coords: np.ndarray, y_coords: np.ndarray
+) -> tuple[float, float]:
+    """Variance of x/y acceleration along a trajectory (needs at least 3 points)."""
+    # Calculate velocities
+    dt = np.diff(timestamps)
+    dt = np.where(dt == 0, 1e-6, dt)  # Avoid division by zero
+
+    vx = np.diff(x_coords) / dt
+    vy = np.diff(y_coords) / dt
+
+    # Calculate accelerations
+    dt2 = dt[:-1]
+
+    ax = np.diff(vx) / dt2
+    ay = np.diff(vy) / dt2
+
+    return float(np.var(ax)), float(np.var(ay))
+
+
+try:
+    from numba import njit
+except ImportError:
+    logger.debug("numba not available, using NumPy trajectory smoothness")
+    _acceleration_variance = _acceleration_variance_numpy
+else:
+
+    @njit(cache=True)
+    def _acceleration_variance(timestamps, x_coords, y_coords):
+        """Compiled equivalent of _acceleration_variance_numpy.
+
+        Accelerations are folded into running (Welford) variances as they
+        are computed, so the whole trajectory is one pass with no arrays.
+        """
+        mean_ax = mean_ay = 0.0
+        m2_ax = m2_ay = 0.0
+
+        prev_dt = timestamps[1] - timestamps[0]
+        if prev_dt == 0:
+            prev_dt = 1e-6
+        prev_vx = (x_coords[1] - x_coords[0]) / prev_dt
+        prev_vy = (y_coords[1] - y_coords[0]) / prev_dt
+
+        n_acc = len(timestamps) - 2
+        for i in range(n_acc):
+            dt = timestamps[i + 2] - timestamps[i + 1]
+            if dt == 0:
+                dt = 1e-6
+            vx = (x_coords[i + 2] - x_coords[i + 1]) / dt
+            vy = (y_coords[i + 2] - y_coords[i + 1]) / dt
+            ax = (vx - prev_vx) / prev_dt
+            ay = (vy - prev_vy) / prev_dt
+            prev_dt, prev_vx, prev_vy = dt, vx, vy
+
+            delta_x = ax - mean_ax
+            mean_ax += delta_x / (i + 1)
+            m2_ax += delta_x * (ax - mean_ax)
+            delta_y = ay - mean_ay
+            mean_ay += delta_y / (i + 1)
+            m2_ay += delta_y * (ay - mean_ay)
+
+        return m2_ax / n_acc, m2_ay / n_acc
+
+
+@dataclass(slots=True)
 class BallDetection:
-    """Represents a detected golf ball in a frame."""
+    """Represents a detected golf ball in a frame.
+
+    Slotted, since one is kept per sampled frame over long videos.
+    """
 
     bbox: tuple[float, float, float, float]  # x1, y1, x2, y2
     confidence: float
@@ -151,6 +263,15 @@ class FlightAnalysis:
     gap_count: int
 
 
+@dataclass
+class DetectionSummary:
+    """Facts about a segment's detections shared by the trajectory steps."""
+
+    valid: list[dict]  # Inferred detections where a ball was found, in frame order
+    miss_timestamps: list[float]  # Sorted timestamps of frames without a ball
+    detection_ratio: float  # Fraction of sampled frames with a ball
+
+
 @dataclass
 class GolferDetection:
     """Detected golfer position in a frame."""
@@ -161,6 +282,26 @@ class GolferDetection:
     feet_position: tuple[float, float]  # Estimated ball strike zone
 
 
+class _SampleGap:
+    """Minimum frames between samples of one segment, for adaptive sampling.
+
+    Set from ball speed by the inference loop and read by the segment's
+    reader thread; each detection call makes its own.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._frames = 1
+
+    def get(self) -> int:
+        with self._lock:
+            return self._frames
+
+    def set(self, frames: int) -> None:
+        with self._lock:
+            self._frames = frames
+
+
 class TrajectoryFilter:
     """Filters and validates golf ball trajectories.
 
@@ -228,12 +369,12 @@ class TrajectoryFilter:
         # Find clusters by spatial proximity
         clusters: list[list[dict]] = []
         for det in valid_detections:
-            center = det["detection"]["center"]
+            center = det["detection"].center
             found_cluster = False
 
             for cluster in clusters:
                 # Check distance to first point in cluster
-                cluster_center = cluster[0]["detection"]["center"]
+                cluster_center = cluster[0]["detection"].center
                 dx = abs(center[0] - cluster_center[0])
                 dy = abs(center[1] - cluster_center[1])
                 dist = (dx ** 2 + dy ** 2) ** 0.5
@@ -259,8 +400,8 @@ class TrajectoryFilter:
                 continue
 
             # Check how tightly clustered these detections are spatially
-            xs = [d["detection"]["center"][0] for d in cluster]
-            ys = [d["detection"]["center"][1] for d in cluster]
+            xs = [d["detection"].center[0] for d in cluster]
+            ys = [d["detection"].center[1] for d in cluster]
             x_range = max(xs) - min(xs)
             y_range = max(ys) - min(ys)
 
@@ -274,8 +415,8 @@ class TrajectoryFilter:
         # Filter out detections in the stationary cluster
         if stationary_cluster:
             # Log the stationary cluster position
-            avg_x = sum(d["detection"]["center"][0] for d in stationary_cluster) / len(stationary_cluster)
-            avg_y = sum(d["detection"]["center"][1] for d in stationary_cluster) / len(stationary_cluster)
+            avg_x = sum(d["detection"].center[0] for d in stationary_cluster) / len(stationary_cluster)
+            avg_y = sum(d["detection"].center[1] for d in stationary_cluster) / len(stationary_cluster)
             stationary_set = set(id(d) for d in stationary_cluster)
             moving_detections = [d for d in valid_detections if id(d) not in stationary_set]
             logger.debug(
@@ -597,8 +738,8 @@ class TrajectoryFilter:
             time_gap = curr["timestamp"] - prev["timestamp"]
 
             # Check spatial jump
-            prev_center = prev["detection"]["center"]
-            curr_center = curr["detection"]["center"]
+            prev_center = prev["detection"].center
+            curr_center = curr["detection"].center
             spatial_jump = np.sqrt(
                 (curr_center[0] - prev_center[0]) ** 2 +
                 (curr_center[1] - prev_center[1]) ** 2
@@ -668,8 +809,8 @@ class TrajectoryFilter:
                 continue
 
             # Check spatial distance between endpoints
-            end_pos = current_end["detection"]["center"]
-            start_pos = next_start["detection"]["center"]
+            end_pos = current_end["detection"].center
+            start_pos = next_start["detection"].center
             distance = np.sqrt(
                 (start_pos[0] - end_pos[0]) ** 2 +
                 (start_pos[1] - end_pos[1]) ** 2
@@ -684,12 +825,12 @@ class TrajectoryFilter:
             # (ball should generally move in same X direction)
             if len(current) >= 2:
                 current_x_dir = np.sign(
-                    current[-1]["detection"]["center"][0] -
-                    current[0]["detection"]["center"][0]
+                    current[-1]["detection"].center[0] -
+                    current[0]["detection"].center[0]
                 )
                 next_x_dir = np.sign(
-                    next_seg[-1]["detection"]["center"][0] -
-                    next_seg[0]["detection"]["center"][0]
+                    next_seg[-1]["detection"].center[0] -
+                    next_seg[0]["detection"].center[0]
                 ) if len(next_seg) >= 2 else current_x_dir
 
                 # If both have clear direction and they match, or one is unclear, merge
@@ -732,21 +873,74 @@ class BallDetector:
     # Higher values make the smoothness calculation more lenient
     SMOOTHNESS_VARIANCE_SCALE = 10000
 
+    # Input size compiled inference engines are exported with
+    MODEL_IMGSZ = 640
+
+    # Backends that accept any batch size and input shape. The others
+    # (CoreML, OpenVINO, TorchScript) are exported for a single MODEL_IMGSZ
+    # frame per call.
+    DYNAMIC_SHAPE_BACKENDS = ("pytorch", "tensorrt")
+
+    # Motion gate: sampled frames are compared to the last inferred frame at
+    # this thumbnail size; if fewer than MOTION_MIN_PIXELS thumbnail pixels
+    # changed by more than MOTION_PIXEL_DELTA, the scene is static and the
+    # frame reuses the last inferred frame's result instead of running YOLO.
+    # The pixel count is the thumbnail area of the smallest ball we accept
+    # (about 8 pixels at this size), so a minimum-size ball moving into view
+    # passes the gate while a few pixels of sensor noise do not.
+    MOTION_GATE_SIZE = (640, 360)
+    MOTION_PIXEL_DELTA = 10
+    MOTION_MIN_PIXELS = int(np.pi / 4 * (MIN_BALL_SIZE_RATIO * MOTION_GATE_SIZE[0]) ** 2)
+
+    # Once the ball has been found, frames up to ROI_MAX_FRAME_GAP frames later
+    # are first searched in an ROI_SIZE window around the last hit
+    ROI_SIZE = 256
+    ROI_MAX_FRAME_GAP = 30
+
+    # Most segments detect_ball_in_segments() decodes at the same time, each
+    # on its own thread and capture
+    MAX_SEGMENT_READERS = 4
+
+    # Adaptive sampling: while the ball is tracked, sample roughly every
+    # ADAPTIVE_TARGET_PIXELS of ball travel, but never below ADAPTIVE_MIN_FPS
+    ADAPTIVE_TARGET_PIXELS = 20
+    ADAPTIVE_MIN_FPS = 2.0
+
     def __init__(
         self,
         model_path: Optional[Path] = None,
         confidence_threshold: Optional[float] = None,
+        batch_size: Optional[int] = None,
     ):
         """Initialize the YOLO model.
 
         Args:
             model_path: Optional path to custom YOLO model weights
             confidence_threshold: Detection confidence threshold (0-1)
+            batch_size: Frames per inference batch in segment detection, also
+                the max batch compiled engines are exported with
         """
         self.model: Optional[YOLO] = None
+        # Ultralytics predictor built once at load time and driven directly,
+        # and the lock serializing inference on it (shared with every detector
+        # using the same model once loaded)
+        self._predictor = None
+        self._predict_lock = threading.Lock()
         self.device = self._get_device()
+        # Inference backend actually in use ("pytorch" until an engine is loaded)
+        self.backend = "pytorch"
+        # Whether eager PyTorch weights were converted to FP16
+        self._half = False
+        # Non-CUDA only: reused host batch of resized BGR frames, per input size
+        self._input_bufs: dict[int, np.ndarray] = {}
+        # CUDA only: double-buffered pinned host batches (with the event marking
+        # each one's last upload) and the side stream uploads are issued on
+        self._pinned: dict[tuple[int, int], tuple[torch.Tensor, torch.cuda.Event]] = {}
+        self._pinned_slot = 0
+        self._upload_stream: Optional[torch.cuda.Stream] = None
         self._model_path = model_path
         self.confidence_threshold = confidence_threshold or settings.yolo_confidence
+        self.batch_size = max(1, batch_size or settings.yolo_batch_size)
 
         # Detection class IDs to look for
         self.target_classes = {self.SPORTS_BALL_CLASS}
@@ -755,6 +949,61 @@ class BallDetector:
         self._frame_width: Optional[int] = None
         self._frame_height: Optional[int] = None
 
+        # Open captures reused across segment calls on the same video
+        self._cap_cache: dict[Path, cv2.VideoCapture] = {}
+
+    def __del__(self) -> None:
+        self.close_caches()
+
+    def close_caches(self) -> None:
+        """Release any video captures kept open between segment calls."""
+        for cap in getattr(self, "_cap_cache", {}).values():
+            cap.release()
+        self._cap_cache = {}
+
+    @staticmethod
+    def _open_capture(video_path: Path) -> cv2.VideoCapture:
+        """Open a video for sequential decoding, hardware-accelerated if possible.
+
+        The FFmpeg backend is asked for any available hardware decoder
+        (VideoToolbox, NVDEC, VA-API, D3D11); OpenCV decodes in software when
+        none is usable. OpenCV builds without the acceleration API get a
+        plain capture.
+        """
+        hw_acceleration = getattr(cv2, "VIDEO_ACCELERATION_ANY", None)
+        if hw_acceleration is not None:
+            cap = cv2.VideoCapture(
+                str(video_path),
+                cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, hw_acceleration],
+            )
+            if cap.isOpened():
+                return cap
+            cap.release()
+        return cv2.VideoCapture(str(video_path))
+
+    def _get_capture(self, video_path: Path) -> Optional[cv2.VideoCapture]:
+        """Get an open capture for a video, reusing a cached one if available.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            Open VideoCapture, or None if the video could not be opened
+        """
+        key = Path(video_path)
+        cap = self._cap_cache.get(key)
+        if cap is not None and cap.isOpened():
+            return cap
+
+        cap = self._open_capture(video_path)
+        if not cap.isOpened():
+            cap.release()
+            return None
+
+        self._cap_cache[key] = cap
+        return cap
+
     def _get_device(self) -> str:
         """Get the best available device for inference."""
         if torch.backends.mps.is_available():
@@ -768,7 +1017,13 @@ class BallDetector:
             return "cpu"
 
     def load_model(self) -> None:
-        """Load the YOLO model."""
+        """Load the YOLO model.
+
+        The loaded and warmed-up model is shared with every other detector
+        using the same weights on the same device, so only the first one
+        pays for loading, engine export and the first inference. Inference
+        on a shared model is serialized by a lock that comes with it.
+        """
         if self.model is not None:
             return  # Already loaded
 
@@ -777,21 +1032,413 @@ class BallDetector:
         else:
             model_path = settings.models_dir / settings.yolo_model
 
+        key = (Path(model_path).resolve(), self.device, self.batch_size)
+        with _shared_models_lock:
+            shared = _shared_models.get(key)
+            build_lock = _shared_model_build_locks.setdefault(key, threading.Lock())
+
+        if shared is None:
+            # Only detectors waiting for this same model block on the build
+            with build_lock:
+                with _shared_models_lock:
+                    shared = _shared_models.get(key)
+                if shared is None:
+                    self._build_model(model_path)
+                    shared = (
+                        self.model, self._predictor, self.backend, self._half, threading.Lock()
+                    )
+                    with _shared_models_lock:
+                        _shared_models[key] = shared
+
+        (self.model, self._predictor, self.backend, self._half, self._predict_lock) = shared
+
+    def _build_model(self, model_path: Path) -> None:
+        """Load, compile and warm up the model for this detector's device."""
         # Ensure models directory exists
         model_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Load model (downloads to model_path if not exists)
+        # Prefer a compiled engine (TensorRT on CUDA, CoreML on MPS, OpenVINO INT8
+        # on CPU, else TorchScript) over eager PyTorch. A cached engine loads
+        # without the .pt weights ever being read.
+        exported = None
+        if settings.yolo_engine_cache:
+            exported = self._load_exported_model(model_path)
+        if exported is not None:
+            self.model = exported
+        else:
+            if self.model is None:
+                self.model = self._load_pytorch_model(model_path)
+            # Move to appropriate device
+            self.model.to(self.device)
+            if self.device == "cuda" and settings.yolo_half:
+                # Conv-heavy nets run fastest as FP16 channels-last on tensor cores
+                self.model.model = self.model.model.to(memory_format=torch.channels_last).half()
+                self._half = True
+            if self.device == "cuda":
+                # Inputs come in a handful of fixed shapes (full frame, ROI crop),
+                # so let cuDNN autotune and cache the fastest conv kernels
+                torch.backends.cudnn.benchmark = True
+            elif self.device == "mps" and settings.yolo_half:
+                # FP16 halves memory traffic on Apple GPUs; Metal kernels
+                # prefer the default NCHW layout
+                self.model.model = self.model.model.half()
+                self._half = True
+
+        # Build the predictor once on a dummy frame, which also warms up the
+        # device (kernel selection, engine context); inference then calls it
+        # directly instead of paying Ultralytics' per-call predict() setup
+        self.model.predict(
+            source=np.zeros((self.MODEL_IMGSZ, self.MODEL_IMGSZ, 3), dtype=np.uint8),
+            verbose=False,
+            conf=self.confidence_threshold,
+            half=self._half,
+        )
+        self._predictor = self.model.predictor
+        logger.info(f"YOLO model loaded successfully on {self.device} ({self.backend})")
+
+    def _load_pytorch_model(self, model_path: Path) -> YOLO:
+        """Load the eager PyTorch YOLO model, downloading the weights if needed."""
         if not model_path.exists():
             logger.info(f"Downloading YOLO model to {model_path}")
         else:
             logger.info(f"Loading YOLO model from {model_path}")
 
         # Pass full path - YOLO will download to this location if needed
-        self.model = YOLO(str(model_path))
+        return YOLO(str(model_path))
+
+    def _engine_path(self, model_path: Path) -> Path:
+        """Get the cache path for a TensorRT engine built from model_path.
+
+        TensorRT engines are only valid for the GPU, CUDA version and batch size
+        they were built with, so all three are part of the filename.
+        """
+        gpu_name = torch.cuda.get_device_name(0).replace(" ", "-")
+        cuda_version = torch.version.cuda or "unknown"
+        return model_path.with_name(
+            f"{model_path.stem}_{gpu_name}_cuda{cuda_version}_b{self.batch_size}.engine"
+        )
 
-        # Move to appropriate device
-        self.model.to(self.device)
-        logger.info(f"YOLO model loaded successfully on {self.device}")
+    def _export_targets(self, model_path: Path) -> list[tuple[str, Path, dict]]:
+        """List the engines to try for the current device, most preferred first.
+
+        Args:
+            model_path: Path to the .pt weights the engines are built from
+
+        Returns:
+            (backend name, cache path, export kwargs) per engine
+        """
+        if self.device == "cuda":
+            backend = "tensorrt"
+            export_path = self._engine_path(model_path)
+            # dynamic=True so single-frame calls still work on an engine built for batches
+            export_kwargs = {
+                "format": "engine",
+                "half": True,
+                "device": 0,
+                "imgsz": self.MODEL_IMGSZ,
+                "dynamic": True,
+                "batch": self.batch_size,
+            }
+        elif self.device == "mps":
+            backend = "coreml"
+            export_path = model_path.with_suffix(".mlpackage")
+            export_kwargs = {"format": "coreml", "half": True, "imgsz": self.MODEL_IMGSZ}
+        else:
+            backend = "openvino"
+            export_path = model_path.with_name(f"{model_path.stem}_int8_openvino_model")
+            # INT8 post-training quantization, calibrated on coco128 by NNCF
+            export_kwargs = {
+                "format": "openvino",
+                "int8": True,
+                "data": "coco128.yaml",
+                "imgsz": self.MODEL_IMGSZ,
+            }
+
+        # TorchScript needs no extra tooling, so it backs up the device engine;
+        # FP16 tracing is only supported on CUDA
+        torchscript_path = model_path.with_name(
+            f"{model_path.stem}_{self.device}.torchscript"
+        )
+        torchscript_kwargs = {
+            "format": "torchscript",
+            "half": self.device == "cuda",
+            "imgsz": self.MODEL_IMGSZ,
+        }
+        if self.device == "cuda":
+            torchscript_kwargs["device"] = 0
+
+        return [
+            (backend, export_path, export_kwargs),
+            ("torchscript", torchscript_path, torchscript_kwargs),
+        ]
+
+    def _load_exported_model(self, model_path: Path) -> Optional[YOLO]:
+        """Load a compiled inference engine for the current device.
+
+        Engines are exported from the PyTorch model on first use and cached
+        next to the weights; the PyTorch model is only loaded when an export
+        is needed. Export needs optional tooling (TensorRT, coremltools,
+        OpenVINO/NNCF), so a failure moves on to the next engine, and
+        ultimately to the PyTorch model.
+
+        Args:
+            model_path: Path to the .pt weights the engines are built from
+
+        Returns:
+            YOLO model wrapping the engine, or None to use the PyTorch model
+        """
+        for backend, export_path, export_kwargs in self._export_targets(model_path):
+            try:
+                if not export_path.exists():
+                    if self.model is None:
+                        self.model = self._load_pytorch_model(model_path)
+                    logger.info(f"Exporting YOLO model to {backend} engine at {export_path}")
+                    exported_path = Path(self.model.export(**export_kwargs))
+                    if exported_path != export_path:
+                        exported_path.rename(export_path)
+                exported = YOLO(str(export_path), task="detect")
+            except Exception as e:
+                logger.warning(f"Failed to load {backend} engine: {e}")
+                continue
+
+            self.backend = backend
+            return exported
+
+        logger.warning("No inference engine available, using PyTorch model")
+        return None
+
+    # Gray Ultralytics pads letterboxed inputs with
+    LETTERBOX_COLOR = 114
+
+    @staticmethod
+    def _letterbox_geometry(
+        height: int, width: int, imgsz: int
+    ) -> tuple[float, int, int, int, int]:
+        """Fit a height x width image into an imgsz square, keeping its aspect ratio.
+
+        Returns:
+            (gain, pad_x, pad_y, new_width, new_height): the resize factor, the
+            left/top padding and the size the image is resized to
+        """
+        gain = min(imgsz / width, imgsz / height)
+        new_width = min(imgsz, round(width * gain))
+        new_height = min(imgsz, round(height * gain))
+        return gain, (imgsz - new_width) // 2, (imgsz - new_height) // 2, new_width, new_height
+
+    def _resize(self, frame: np.ndarray, imgsz: int, dst: np.ndarray) -> None:
+        """Letterbox a BGR frame into the imgsz x imgsz buffer dst.
+
+        The frame is resized with its aspect ratio kept and centered, and the
+        borders are filled with LETTERBOX_COLOR, as Ultralytics does.
+        """
+        height, width = frame.shape[:2]
+        _, pad_x, pad_y, new_width, new_height = self._letterbox_geometry(height, width, imgsz)
+        bottom, right = pad_y + new_height, pad_x + new_width
+        cv2.resize(
+            frame,
+            (new_width, new_height),
+            dst=dst[pad_y:bottom, pad_x:right],
+            interpolation=cv2.INTER_LINEAR,
+        )
+        # Only the borders; the buffer is reused, so they may hold old pixels
+        dst[:pad_y] = self.LETTERBOX_COLOR
+        dst[bottom:] = self.LETTERBOX_COLOR
+        dst[pad_y:bottom, :pad_x] = self.LETTERBOX_COLOR
+        dst[pad_y:bottom, right:] = self.LETTERBOX_COLOR
+
+    def _host_batch(self, frames: list[np.ndarray], imgsz: int) -> torch.Tensor:
+        """Build a uint8 input batch in a reused host buffer.
+
+        Args:
+            frames: BGR images as numpy arrays
+            imgsz: Square model input size
+
+        Returns:
+            (N, imgsz, imgsz, 3) uint8 BGR tensor on self.device
+        """
+        host = self._input_bufs.get(imgsz)
+        if host is None or len(host) < len(frames):
+            host = np.empty((max(self.batch_size, len(frames)), imgsz, imgsz, 3), dtype=np.uint8)
+            self._input_bufs[imgsz] = host
+
+        for i, frame in enumerate(frames):
+            self._resize(frame, imgsz, host[i])
+
+        # Blocking copy on MPS; on CPU this shares the buffer, and the cast in
+        # _to_model_input() copies out of it before it is reused
+        return torch.from_numpy(host[: len(frames)]).to(self.device)
+
+    def _upload_batch(self, frames: list[np.ndarray], imgsz: int) -> torch.Tensor:
+        """Build a CUDA input batch through pinned host memory.
+
+        Frames are resized straight into a page-locked uint8 buffer and
+        copied on a side stream, so the transfer is a true async DMA and a
+        quarter the size of a float upload. Two buffers alternate; before one
+        is refilled we wait only for its own previous copy, letting the copy
+        of one batch overlap work on the other.
+
+        Args:
+            frames: BGR images as numpy arrays
+            imgsz: Square model input size
+
+        Returns:
+            (N, imgsz, imgsz, 3) uint8 BGR tensor on the GPU
+        """
+        if self._upload_stream is None:
+            self._upload_stream = torch.cuda.Stream()
+
+        self._pinned_slot = (self._pinned_slot + 1) % 2
+        key = (imgsz, self._pinned_slot)
+        pinned, uploaded = self._pinned.get(key, (None, None))
+        if pinned is None or len(pinned) < len(frames):
+            pinned = torch.empty(
+                (max(self.batch_size, len(frames)), imgsz, imgsz, 3),
+                dtype=torch.uint8,
+                pin_memory=True,
+            )
+            uploaded = torch.cuda.Event()
+            self._pinned[key] = (pinned, uploaded)
+        else:
+            # Don't overwrite the buffer while its last copy may still be running
+            uploaded.synchronize()
+
+        host = pinned.numpy()
+        for i, frame in enumerate(frames):
+            self._resize(frame, imgsz, host[i])
+
+        with torch.cuda.stream(self._upload_stream):
+            batch = pinned[: len(frames)].to(self.device, non_blocking=True)
+            uploaded.record()
+        compute_stream = torch.cuda.current_stream()
+        compute_stream.wait_stream(self._upload_stream)
+        batch.record_stream(compute_stream)
+        return batch
+
+    def _to_model_input(self, batch: torch.Tensor) -> torch.Tensor:
+        """Turn an uploaded uint8 BGR batch into normalized model input.
+
+        Color conversion, the NCHW transpose, the cast to the backend's input
+        precision and scaling all run on the device, so the host only
+        letterboxes and uploads uint8 pixels. The model receives a ready-made
+        tensor and skips Ultralytics' own preprocessing.
+
+        Args:
+            batch: (N, imgsz, imgsz, 3) uint8 BGR tensor on self.device
+
+        Returns:
+            (N, 3, imgsz, imgsz) RGB tensor scaled to 0-1; channels-last for
+            FP16 eager weights on CUDA, plain NCHW otherwise
+        """
+        dtype = torch.float16 if self._predictor.model.fp16 else torch.float32
+        # NHWC memory viewed as NCHW, i.e. channels-last
+        batch = batch.flip(-1).permute(0, 3, 1, 2).to(dtype).div_(255)
+        if self._half and self.device == "cuda":
+            return batch
+        # Compiled engines read the raw buffer, so hand them plain NCHW
+        return batch.contiguous()
+
+    def _predict(
+        self,
+        frames: list[np.ndarray],
+        conf: float,
+        classes: list[int],
+        imgsz: Optional[int] = None,
+    ) -> list[np.ndarray]:
+        """Run the model on a batch of frames.
+
+        The batch goes straight through the predictor built in load_model()
+        followed by NMS, bypassing predict()'s per-call setup and Results
+        wrapping. NMS also drops other classes on the device, so only wanted
+        boxes are copied to the host, in one transfer for the whole batch.
+        Engines outside DYNAMIC_SHAPE_BACKENDS get the frames one at a time.
+        Boxes are in model-input coordinates; use _input_transform() to map
+        them back to the source frame.
+
+        Args:
+            frames: BGR images as numpy arrays
+            conf: Minimum detection confidence
+            classes: COCO class IDs to keep
+            imgsz: Model input size (defaults to MODEL_IMGSZ)
+
+        Returns:
+            One (N, 6) array of x1, y1, x2, y2, conf, cls rows per frame,
+            highest confidence first
+        """
+        imgsz = imgsz or self.MODEL_IMGSZ
+        # Static-batch engines get one call per frame
+        step = len(frames) if self.backend in self.DYNAMIC_SHAPE_BACKENDS else 1
+        results: list[np.ndarray] = []
+        # The predictor (and a TensorRT execution context) is shared with
+        # detectors on other threads and isn't safe to drive concurrently
+        with self._predict_lock:
+            for start in range(0, len(frames), max(1, step)):
+                results.extend(
+                    self._run_model(frames[start : start + step], conf, classes, imgsz)
+                )
+        return results
+
+    def _run_model(
+        self, frames: list[np.ndarray], conf: float, classes: list[int], imgsz: int
+    ) -> list[np.ndarray]:
+        """Run one model call on frames; see _predict(). Hold _predict_lock."""
+        with torch.inference_mode():
+            if self.device == "cuda":
+                batch = self._upload_batch(frames, imgsz)
+            else:
+                batch = self._host_batch(frames, imgsz)
+            preds = self._predictor.inference(self._to_model_input(batch))
+            args = self._predictor.args
+            per_frame = non_max_suppression(
+                preds, conf, args.iou, classes=classes, max_det=args.max_det
+            )
+            # One device->host copy (and sync) per batch, split back per frame
+            counts = [len(boxes) for boxes in per_frame]
+            data = torch.cat(per_frame).cpu().numpy()
+        return np.split(data, np.cumsum(counts)[:-1])
+
+    def _input_transform(
+        self, frame: np.ndarray, imgsz: Optional[int] = None
+    ) -> tuple[float, float, float]:
+        """Get the letterbox mapping between frame pixels and model input.
+
+        Returns:
+            (gain, pad_x, pad_y), where model = frame * gain + pad; frame
+            coordinates are recovered as (model - pad) / gain
+        """
+        imgsz = imgsz or self.MODEL_IMGSZ
+        height, width = frame.shape[:2]
+        gain, pad_x, pad_y, _, _ = self._letterbox_geometry(height, width, imgsz)
+        return gain, pad_x, pad_y
+
+    def _roi_bounds(
+        self, center: tuple[float, float], frame: np.ndarray
+    ) -> tuple[int, int, int, int]:
+        """Get an ROI_SIZE window around a point, shifted to lie inside the frame.
+
+        Args:
+            center: (x, y) point to center the window on
+            frame: Frame the window is cut from
+
+        Returns:
+            Window bounds (x1, y1, x2, y2) in frame pixels
+        """
+        frame_height, frame_width = frame.shape[:2]
+        roi_width = min(self.ROI_SIZE, frame_width)
+        roi_height = min(self.ROI_SIZE, frame_height)
+        x0 = int(min(max(0, center[0] - roi_width / 2), frame_width - roi_width))
+        y0 = int(min(max(0, center[1] - roi_height / 2), frame_height - roi_height))
+        return x0, y0, x0 + roi_width, y0 + roi_height
+
+    @property
+    def _roi_imgsz(self) -> int:
+        """Model input size for ROI crops.
+
+        Backends with dynamic input shapes run crops at their native ROI size;
+        fixed-shape engines (CoreML, OpenVINO) need the full input size.
+        """
+        if self.backend in self.DYNAMIC_SHAPE_BACKENDS:
+            return self.ROI_SIZE
+        return self.MODEL_IMGSZ
 
     def detect_golfer_in_frame(
         self,
@@ -815,20 +1462,16 @@ class BallDetector:
         self._frame_height, self._frame_width = frame.shape[:2]
 
         # Run inference with higher confidence for person detection
-        results = self.model(frame, verbose=False, conf=0.3)
+        results = self._predict([frame], conf=0.3, classes=[self.PERSON_CLASS])
+        gain, pad_x, pad_y = self._input_transform(frame)
 
         persons = []
-        for result in results:
-            boxes = result.boxes
-            for box in boxes:
-                cls = int(box.cls[0])
-                conf = float(box.conf[0])
-
-                if cls != self.PERSON_CLASS:
-                    continue
-
-                x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
+        for data in results:
+            # Rows are x1, y1, x2, y2, conf, cls
+            data[:, :4] -= (pad_x, pad_y, pad_x, pad_y)
+            data[:, :4] /= gain
 
+            for x1, y1, x2, y2, conf, _ in data.tolist():
                 # Person should be reasonably sized (not too small/large)
                 person_height = y2 - y1
                 height_ratio = person_height / self._frame_height
@@ -843,10 +1486,10 @@ class BallDetector:
                 feet_y = y2  # Bottom of person bbox
 
                 persons.append(GolferDetection(
-                    bbox=(float(x1), float(y1), float(x2), float(y2)),
+                    bbox=(x1, y1, x2, y2),
                     confidence=conf,
-                    center=(float(center_x), float(center_y)),
-                    feet_position=(float(feet_x), float(feet_y)),
+                    center=(center_x, center_y),
+                    feet_position=(feet_x, feet_y),
                 ))
 
         if not persons:
@@ -890,60 +1533,128 @@ class BallDetector:
         finally:
             cap.release()
 
-    def _is_valid_ball_detection(
-        self,
-        bbox: tuple[float, float, float, float],
-        frame_width: int,
-        frame_height: int,
-    ) -> bool:
-        """Check if detection has valid golf ball characteristics.
+    def _valid_ball_mask(
+        self, widths: np.ndarray, heights: np.ndarray, frame_width: int
+    ) -> np.ndarray:
+        """Check which boxes have valid golf ball characteristics.
 
         Args:
-            bbox: Bounding box (x1, y1, x2, y2)
+            widths: Box widths in pixels
+            heights: Box heights in pixels
             frame_width: Frame width in pixels
-            frame_height: Frame height in pixels
 
         Returns:
-            True if detection could be a golf ball
+            Boolean mask, True where the detection could be a golf ball
         """
-        x1, y1, x2, y2 = bbox
-        width = x2 - x1
-        height = y2 - y1
-
-        # Check size relative to frame
-        size_ratio = max(width, height) / frame_width
-        if size_ratio < self.MIN_BALL_SIZE_RATIO:
-            return False  # Too small - likely noise
-        if size_ratio > self.MAX_BALL_SIZE_RATIO:
-            return False  # Too large - not a golf ball
-
-        # Check aspect ratio (golf balls should be roughly circular)
-        if width > 0 and height > 0:
-            aspect_ratio = width / height
-            if aspect_ratio < self.MIN_ASPECT_RATIO or aspect_ratio > self.MAX_ASPECT_RATIO:
-                return False  # Not circular enough
+        # Size relative to frame: too small is likely noise, too large is not
+        # a golf ball
+        size_ratio = np.maximum(widths, heights) / frame_width
+        valid = (size_ratio >= self.MIN_BALL_SIZE_RATIO) & (
+            size_ratio <= self.MAX_BALL_SIZE_RATIO
+        )
 
-        return True
+        # Aspect ratio (golf balls should be roughly circular), for boxes
+        # with a non-zero extent
+        sized = (widths > 0) & (heights > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            aspect_ratio = widths / heights
+        circular = (aspect_ratio >= self.MIN_ASPECT_RATIO) & (
+            aspect_ratio <= self.MAX_ASPECT_RATIO
+        )
+        return valid & (circular | ~sized)
+
+    def _ball_detections(
+        self,
+        boxes: np.ndarray,
+        frame: np.ndarray,
+        imgsz: Optional[int] = None,
+        roi: Optional[tuple[int, int, int, int]] = None,
+        best_only: bool = False,
+    ) -> list[BallDetection]:
+        """Extract valid ball detections from one inference result.
+
+        NMS returns boxes in descending confidence order, so detections come
+        out highest confidence first and best_only keeps the first box that
+        passes validation.
+
+        Args:
+            boxes: Box rows produced by _predict() for this frame, already
+                limited to target_classes
+            frame: The full BGR frame the result belongs to
+            imgsz: Model input size the result was produced at
+            roi: Window (x1, y1, x2, y2) of the frame that was run, if cropped
+            best_only: Return at most the single highest-confidence detection
+
+        Returns:
+            List of detections in frame pixels that pass the shape filters,
+            highest confidence first
+        """
+        frame_width = frame.shape[1]
+        offset_x, offset_y = 0, 0
+        if roi is None:
+            gain, pad_x, pad_y = self._input_transform(frame, imgsz)
+        else:
+            offset_x, offset_y = roi[0], roi[1]
+            gain, pad_x, pad_y = self._input_transform(
+                frame[roi[1] : roi[3], roi[0] : roi[2]], imgsz
+            )
+
+        # Rows are x1, y1, x2, y2, conf, cls; mapped in place, as each frame's
+        # rows are only used once: undo the letterbox, then the ROI crop
+        shift_x = offset_x - pad_x / gain
+        shift_y = offset_y - pad_y / gain
+        data = boxes
+        data[:, :4] /= gain
+        data[:, :4] += (shift_x, shift_y, shift_x, shift_y)
+
+        # Validate detection characteristics for all boxes at once
+        valid = self._valid_ball_mask(
+            data[:, 2] - data[:, 0], data[:, 3] - data[:, 1], frame_width
+        )
+        if not valid.all():
+            logger.debug(f"Rejected {int((~valid).sum())} detections by size/aspect ratio")
+        data = data[valid]
+        if best_only:
+            data = data[:1]
+
+        if not len(data):
+            return []
+
+        # Only the returned rows become objects; with best_only that is one
+        x1, y1, x2, y2, conf, _ = data[0].tolist()
+        logger.debug(
+            f"{len(data)} valid ball detection(s), best: conf={conf:.3f}, "
+            f"center=({(x1+x2)/2:.0f},{(y1+y2)/2:.0f})"
+        )
+        return [
+            BallDetection(
+                bbox=(x1, y1, x2, y2),
+                confidence=conf,
+                center=((x1 + x2) / 2, (y1 + y2) / 2),
+                size=(x2 - x1, y2 - y1),
+            )
+            for x1, y1, x2, y2, conf, _ in data.tolist()
+        ]
 
     @overload
     def detect_ball_in_frame(
         self,
         frame: np.ndarray,
         return_all: bool = False,
-    ) -> Optional[dict]: ...
+    ) -> Optional[BallDetection]: ...
 
     @overload
     def detect_ball_in_frame(
         self,
         frame: np.ndarray,
         return_all: bool = True,
-    ) -> list[dict]: ...
+    ) -> list[BallDetection]: ...
 
     def detect_ball_in_frame(
         self,
         frame: np.ndarray,
         return_all: bool = False,
-    ) -> Union[Optional[dict], list[dict]]:
+    ) -> Union[Optional[BallDetection], list[BallDetection]]:
         """Detect golf ball in a single frame.
 
         Args:
@@ -951,7 +1662,7 @@ class BallDetector:
             return_all: If True, return all valid detections; otherwise return best one
 
         Returns:
-            Dict with 'bbox', 'confidence', 'center', 'size' if ball found, else None
+            Best BallDetection if ball found, else None
             If return_all=True, returns list of all valid detections
         """
         if self.model is None:
@@ -961,61 +1672,288 @@ class BallDetector:
         self._frame_height, self._frame_width = frame.shape[:2]
 
         # Run inference
-        results = self.model(frame, verbose=False, conf=self.confidence_threshold)
+        results = self._predict(
+            [frame], conf=self.confidence_threshold, classes=list(self.target_classes)
+        )
+        valid_detections = self._ball_detections(
+            results[0], frame, best_only=not return_all
+        )
 
-        valid_detections: list[BallDetection] = []
+        if return_all:
+            return valid_detections
 
-        # Process detections
-        for result in results:
-            boxes = result.boxes
-            for box in boxes:
-                cls = int(box.cls[0])
-                conf = float(box.conf[0])
+        # Highest confidence detection
+        return valid_detections[0] if valid_detections else None
 
-                # Check if it's a potential ball class
-                if cls not in self.target_classes:
-                    continue
+    def _sample_frames(
+        self, fps: float, start_frame: int, end_frame: int, sample_fps: float
+    ) -> list[int]:
+        """Get the frame indices to analyze in [start_frame, end_frame).
 
-                x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                bbox = (float(x1), float(y1), float(x2), float(y2))
+        Stepping by the exact float ratio (rather than a truncated integer
+        interval) keeps the effective rate at sample_fps, e.g. 29.97fps
+        sampled at 10fps.
+        """
+        frame_step = max(1.0, fps / sample_fps)
+        n_samples = int(np.ceil((end_frame - start_frame) / frame_step))
+        sample_frames = np.round(
+            start_frame + np.arange(max(0, n_samples)) * frame_step
+        ).astype(np.int64)
+        return sample_frames[sample_frames < end_frame].tolist()
+
+    def _read_sampled_frames(
+        self,
+        cap: cv2.VideoCapture,
+        start_frame: int,
+        end_frame: int,
+        sample_frames: list[int],
+        emit: Callable[[int, int, Optional[np.ndarray]], None],
+        stop: threading.Event,
+        sample_gap: Optional[_SampleGap] = None,
+    ) -> None:
+        """Decode the sampled frames of a segment and hand them to emit().
+
+        Meant to run on a reader thread. The capture must already be
+        positioned at start_frame. Frames whose scene matches the last
+        frame passed on for inference are passed as None instead.
 
-                # Validate detection characteristics
-                if not self._is_valid_ball_detection(
-                    bbox, self._frame_width, self._frame_height
+        Args:
+            cap: Open capture positioned at start_frame
+            start_frame: First frame of the segment
+            end_frame: Frame the segment ends before
+            sample_frames: Sorted frame indices to decode
+            emit: Called with (frame_count, frame index, frame or None)
+            stop: Set to stop reading early
+            sample_gap: Minimum frames from one sample to the next, for
+                adaptive sampling; scheduled samples closer than that are skipped
+        """
+        # Ring of frame buffers that retrieve() decodes into, sized so a
+        # buffer is never rewritten while queued or in the batch on the model
+        frame_buffers: list[Optional[np.ndarray]] = [None] * (3 * self.batch_size + 2)
+
+        frame_count = 0
+        buffer_index = 0
+        next_sample = 0
+        reference_gray = None
+        while not stop.is_set():
+            current_frame = start_frame + frame_count
+            if current_frame >= end_frame:
+                break
+
+            # grab() alone skips pixel conversion for unsampled frames
+            if not cap.grab():
+                break
+
+            if (
+                next_sample < len(sample_frames)
+                and current_frame == sample_frames[next_sample]
+            ):
+                next_sample += 1
+                ret, frame = cap.retrieve(frame_buffers[buffer_index])
+                if not ret:
+                    break
+                frame_buffers[buffer_index] = frame
+                buffer_index = (buffer_index + 1) % len(frame_buffers)
+
+                if sample_gap is not None:
+                    min_next = current_frame + sample_gap.get()
+                    while (
+                        next_sample < len(sample_frames)
+                        and sample_frames[next_sample] < min_next
+                    ):
+                        next_sample += 1
+
+                gray = cv2.cvtColor(
+                    cv2.resize(frame, self.MOTION_GATE_SIZE, interpolation=cv2.INTER_AREA),
+                    cv2.COLOR_BGR2GRAY,
+                )
+                if reference_gray is not None and (
+                    np.count_nonzero(cv2.absdiff(gray, reference_gray) > self.MOTION_PIXEL_DELTA)
+                    < self.MOTION_MIN_PIXELS
                 ):
-                    logger.debug(
-                        f"Rejected detection: bbox=({x1:.0f},{y1:.0f},{x2:.0f},{y2:.0f}), "
-                        f"conf={conf:.3f}, size_ratio={(x2-x1)/self._frame_width:.4f}"
-                    )
-                    continue
+                    # Static scene: reuses the reference frame's result without inference
+                    emit(frame_count, current_frame, None)
+                else:
+                    reference_gray = gray
+                    emit(frame_count, current_frame, frame)
 
-                logger.debug(
-                    f"Valid ball detection: conf={conf:.3f}, "
-                    f"center=({(x1+x2)/2:.0f},{(y1+y2)/2:.0f})"
-                )
+            frame_count += 1
 
-                center_x = (x1 + x2) / 2
-                center_y = (y1 + y2) / 2
-                width = x2 - x1
-                height = y2 - y1
+    def _adaptive_gap(
+        self,
+        last_hit: Optional[tuple[int, tuple[float, float]]],
+        current_frame: int,
+        center: tuple[float, float],
+        fps: float,
+    ) -> int:
+        """Get the sample gap, in frames, for a ball moving from last_hit to center.
 
-                detection = BallDetection(
-                    bbox=bbox,
-                    confidence=conf,
-                    center=(float(center_x), float(center_y)),
-                    size=(float(width), float(height)),
+        Args:
+            last_hit: (frame index, center) of the previous detection, if any
+            current_frame: Frame index of the new detection
+            center: Center of the new detection
+            fps: Video frame rate
+
+        Returns:
+            Frames to wait before the next sample (1 when speed is unknown)
+        """
+        if last_hit is None or current_frame <= last_hit[0]:
+            return 1
+        px_per_frame = np.hypot(
+            center[0] - last_hit[1][0], center[1] - last_hit[1][1]
+        ) / (current_frame - last_hit[0])
+        max_gap = max(1, int(fps / self.ADAPTIVE_MIN_FPS))
+        return int(min(max(self.ADAPTIVE_TARGET_PIXELS / max(px_per_frame, 1.0), 1), max_gap))
+
+    def _detect_batch(
+        self,
+        batch: list[tuple[int, int, np.ndarray]],
+        last_hits: dict[int, tuple[int, tuple[float, float]]],
+    ) -> dict[tuple[int, int], Optional[BallDetection]]:
+        """Run ball detection on a batch of sampled frames.
+
+        Frames shortly after a hit in the same segment are searched in a small
+        window around it first; only misses run on the full frame.
+
+        Args:
+            batch: (segment key, frame index, frame) items
+            last_hits: Per segment key, (frame index, center) of the latest hit
+
+        Returns:
+            Highest-confidence valid detection (or None) per (segment key,
+            frame index)
+        """
+        roi_items = []
+        full_items = []
+        for item in batch:
+            key, current_frame, frame = item
+            last_hit = last_hits.get(key)
+            if last_hit is not None and current_frame - last_hit[0] <= self.ROI_MAX_FRAME_GAP:
+                roi_items.append((item, self._roi_bounds(last_hit[1], frame)))
+            else:
+                full_items.append(item)
+
+        classes = list(self.target_classes)
+        found: dict[tuple[int, int], Optional[BallDetection]] = {}
+        if roi_items:
+            roi_imgsz = self._roi_imgsz
+            crops = [frame[y0:y1, x0:x1] for (_, _, frame), (x0, y0, x1, y1) in roi_items]
+            results = self._predict(
+                crops, conf=self.confidence_threshold, classes=classes, imgsz=roi_imgsz
+            )
+            for (item, roi), boxes in zip(roi_items, results):
+                hits = self._ball_detections(boxes, item[2], roi_imgsz, roi, best_only=True)
+                if hits:
+                    found[item[:2]] = hits[0]
+                else:
+                    full_items.append(item)
+
+        if full_items:
+            frames = [frame for _, _, frame in full_items]
+            self._frame_height, self._frame_width = frames[0].shape[:2]
+            results = self._predict(frames, conf=self.confidence_threshold, classes=classes)
+            for (key, current_frame, frame), boxes in zip(full_items, results):
+                hits = self._ball_detections(boxes, frame, best_only=True)
+                found[(key, current_frame)] = hits[0] if hits else None
+
+        return found
+
+    def _detect_queued_frames(
+        self,
+        frame_queue: queue.Queue,
+        n_readers: int,
+        fps: float,
+        on_frame: Optional[Callable[[int, int], None]] = None,
+        sample_gaps: Optional[dict[int, _SampleGap]] = None,
+    ) -> dict[int, list[dict]]:
+        """Batch sampled frames from reader threads through the model.
+
+        Frames from every reader share batches; ROI tracking and motion-gate
+        results are kept per segment key.
+
+        Args:
+            frame_queue: Queue of (segment key, frame count, frame index,
+                frame or None) items, with one None per reader when it is done
+            n_readers: Number of readers feeding the queue
+            fps: Video frame rate
+            on_frame: Called with (segment key, frame count) after each frame
+            sample_gaps: Per segment key, the adaptive sample gap to update
+                from the tracked ball's speed
+
+        Returns:
+            Detections per segment key, in the format returned by
+            detect_ball_in_video_segment()
+        """
+        detections: dict[int, list[dict]] = {}
+        last_hits: dict[int, tuple[int, tuple[float, float]]] = {}
+        # Per segment, result of the last frame that ran inference, which
+        # gated frames show unchanged
+        reference_detections: dict[int, Optional[BallDetection]] = {}
+        readers_left = n_readers
+        while readers_left:
+            batch = []
+            while len(batch) < self.batch_size and readers_left:
+                item = frame_queue.get()
+                if item is None:
+                    readers_left -= 1
+                    continue
+                batch.append(item)
+
+            if not batch:
+                break
+
+            found = self._detect_batch(
+                [
+                    (key, current_frame, frame)
+                    for key, _, current_frame, frame in batch
+                    if frame is not None
+                ],
+                last_hits,
+            )
+
+            for key, frame_count, current_frame, frame in batch:
+                static = frame is None
+                if static:
+                    # Motion-gated frame: nothing moved since the last
+                    # inferred frame, so a ball seen there (e.g. at
+                    # address) is still present but not in flight
+                    detection = reference_detections.get(key)
+                else:
+                    detection = found[(key, current_frame)]
+                    reference_detections[key] = detection
+                    if sample_gaps is not None:
+                        sample_gaps[key].set(
+                            1
+                            if detection is None
+                            else self._adaptive_gap(
+                                last_hits.get(key), current_frame, detection.center, fps
+                            )
+                        )
+                    if detection is not None:
+                        last_hits[key] = (current_frame, detection.center)
+
+                detections.setdefault(key, []).append(
+                    {
+                        "timestamp": current_frame / fps,
+                        "frame": current_frame,
+                        "detection": detection,
+                        "static": static,
+                    }
                 )
-                valid_detections.append(detection)
 
-        if return_all:
-            return [d.to_dict() for d in valid_detections]
+                if on_frame:
+                    on_frame(key, frame_count)
 
-        if not valid_detections:
-            return None
+        return detections
 
-        # Return highest confidence detection
-        best = max(valid_detections, key=lambda d: d.confidence)
-        return best.to_dict()
+    @staticmethod
+    def _drain_readers(frame_queue: queue.Queue, readers_done: Callable[[], bool]) -> None:
+        """Unblock reader threads waiting on a full queue until they finish."""
+        while not readers_done():
+            try:
+                frame_queue.get_nowait()
+            except queue.Empty:
+                time.sleep(0.01)
 
     def detect_ball_in_video_segment(
         self,
@@ -1024,6 +1962,7 @@ class BallDetector:
         end_time: float,
         sample_fps: float = 10.0,
         progress_callback: Optional[Callable[[float], None]] = None,
+        adaptive: bool = False,
     ) -> list[dict]:
         """Detect ball positions in a video segment.
 
@@ -1033,66 +1972,194 @@ class BallDetector:
             end_time: End timestamp in seconds
             sample_fps: Frames per second to analyze (lower = faster)
             progress_callback: Optional callback for progress updates
+            adaptive: If True, treat sample_fps as the peak rate and sample a
+                slow-moving tracked ball less often (down to ADAPTIVE_MIN_FPS)
 
         Returns:
-            List of detections with 'timestamp', 'frame', 'detection' keys
+            List of dicts with 'timestamp', 'frame', 'detection' and 'static'
+            keys, where 'detection' is a BallDetection or None and 'static'
+            marks frames skipped by the motion gate, whose 'detection' is the
+            last inferred frame's (present, but not a new trajectory point)
         """
         if self.model is None:
             self.load_model()
 
-        cap = cv2.VideoCapture(str(video_path))
-        if not cap.isOpened():
+        cap = self._get_capture(video_path)
+        if cap is None:
             logger.error(f"Failed to open video: {video_path}")
             return []
 
+        # The capture stays cached for later segments; only drop it on failure
+        completed = False
         try:
             fps = cap.get(cv2.CAP_PROP_FPS)
             if fps <= 0:
                 logger.error(f"Invalid FPS from video: {fps}")
                 return []
 
-            # Calculate frame interval for sampling
-            frame_interval = max(1, int(fps / sample_fps))
-
-            detections = []
             start_frame = int(start_time * fps)
             end_frame = int(end_time * fps)
             total_frames = max(1, end_frame - start_frame)
+            sample_frames = self._sample_frames(fps, start_frame, end_frame, sample_fps)
+
+            # Skip the seek when the capture is already at the segment start
+            # (a fresh capture at frame 0, or a cached one that just finished
+            # the preceding segment)
+            if int(cap.get(cv2.CAP_PROP_POS_FRAMES)) != start_frame:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+
+            # Decode on a background thread so the next batch is being read
+            # while the current one is on the model
+            frame_queue: queue.Queue = queue.Queue(maxsize=2 * self.batch_size)
+            stop_reading = threading.Event()
+            sample_gap = _SampleGap() if adaptive else None
+
+            def _reader() -> None:
+                try:
+                    self._read_sampled_frames(
+                        cap,
+                        start_frame,
+                        end_frame,
+                        sample_frames,
+                        lambda *item: frame_queue.put((0, *item)),
+                        stop_reading,
+                        sample_gap,
+                    )
+                finally:
+                    frame_queue.put(None)
+
+            def _progress(_: int, frame_count: int) -> None:
+                progress_callback(min(100.0, (frame_count / total_frames) * 100))
+
+            reader = threading.Thread(target=_reader, name="ball-frame-reader", daemon=True)
+            reader.start()
+
+            try:
+                detections = self._detect_queued_frames(
+                    frame_queue,
+                    1,
+                    fps,
+                    _progress if progress_callback else None,
+                    {0: sample_gap} if adaptive else None,
+                ).get(0, [])
+            finally:
+                stop_reading.set()
+                self._drain_readers(frame_queue, lambda: not reader.is_alive())
+                reader.join()
+
+            completed = True
+            return detections
+        finally:
+            if not completed:
+                self._cap_cache.pop(Path(video_path), None)
+                cap.release()
 
-            cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+    def detect_ball_in_segments(
+        self,
+        video_path: Path,
+        segments: list[tuple[float, float]],
+        sample_fps: float = 10.0,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        adaptive: bool = False,
+    ) -> list[list[dict]]:
+        """Detect ball positions in several segments of a video at once.
 
-            frame_count = 0
-            while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
-                    break
+        Segments are decoded on up to MAX_SEGMENT_READERS threads, each with
+        its own capture, all feeding one queue, so inference batches mix
+        frames from every segment and the model stays busy while any decoder
+        is still producing. Results are the same as calling
+        detect_ball_in_video_segment() per segment.
 
-                current_frame = start_frame + frame_count
-                if current_frame >= end_frame:
-                    break
+        Args:
+            video_path: Path to video file
+            segments: (start_time, end_time) pairs in seconds
+            sample_fps: Frames per second to analyze (lower = faster)
+            progress_callback: Optional callback for overall progress updates
+            adaptive: Sample slow-moving tracked balls less often, as in
+                detect_ball_in_video_segment()
 
-                # Only process every Nth frame
-                if frame_count % frame_interval == 0:
-                    timestamp = current_frame / fps
-                    detection = self.detect_ball_in_frame(frame)
-
-                    detections.append(
-                        {
-                            "timestamp": timestamp,
-                            "frame": current_frame,
-                            "detection": detection,
-                        }
-                    )
+        Returns:
+            Detections per segment, in segment order and in the format
+            returned by detect_ball_in_video_segment()
+        """
+        if not segments:
+            return []
+
+        if self.model is None:
+            self.load_model()
+
+        probe = self._get_capture(video_path)
+        if probe is None:
+            logger.error(f"Failed to open video: {video_path}")
+            return [[] for _ in segments]
+        fps = probe.get(cv2.CAP_PROP_FPS)
+        if fps <= 0:
+            logger.error(f"Invalid FPS from video: {fps}")
+            return [[] for _ in segments]
+
+        frame_ranges = [(int(start * fps), int(end * fps)) for start, end in segments]
+        sample_frames = [
+            self._sample_frames(fps, start_frame, end_frame, sample_fps)
+            for start_frame, end_frame in frame_ranges
+        ]
+        total_frames = max(1, sum(end - start for start, end in frame_ranges))
+
+        frame_queue: queue.Queue = queue.Queue(maxsize=2 * self.batch_size)
+        stop_reading = threading.Event()
+        sample_gaps = {segment: _SampleGap() for segment in range(len(segments))}
+
+        def _reader(segment: int) -> None:
+            cap = None
+            try:
+                if stop_reading.is_set():
+                    return
+                cap = self._open_capture(video_path)
+                if not cap.isOpened():
+                    logger.error(f"Failed to open video: {video_path}")
+                    return
+                start_frame, end_frame = frame_ranges[segment]
+                if start_frame > 0:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+                self._read_sampled_frames(
+                    cap,
+                    start_frame,
+                    end_frame,
+                    sample_frames[segment],
+                    lambda *item: frame_queue.put((segment, *item)),
+                    stop_reading,
+                    sample_gaps[segment] if adaptive else None,
+                )
+            finally:
+                if cap is not None:
+                    cap.release()
+                frame_queue.put(None)
 
-                    if progress_callback:
-                        progress = (frame_count / total_frames) * 100
-                        progress_callback(min(100.0, progress))
+        # Per segment, frames read so far
+        frames_read = [0] * len(segments)
 
-                frame_count += 1
+        def _progress(segment: int, frame_count: int) -> None:
+            frames_read[segment] = frame_count + 1
+            progress_callback(min(100.0, sum(frames_read) / total_frames * 100))
 
-            return detections
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(segments), self.MAX_SEGMENT_READERS),
+            thread_name_prefix="ball-frame-reader",
+        )
+        readers = [executor.submit(_reader, segment) for segment in range(len(segments))]
+        try:
+            detections = self._detect_queued_frames(
+                frame_queue,
+                len(segments),
+                fps,
+                _progress if progress_callback else None,
+                sample_gaps if adaptive else None,
+            )
         finally:
-            cap.release()
+            stop_reading.set()
+            self._drain_readers(frame_queue, lambda: all(r.done() for r in readers))
+            executor.shutdown()
+
+        return [detections.get(segment, []) for segment in range(len(segments))]
 
     def track_ball_flight(
         self,
@@ -1110,21 +2177,20 @@ class BallDetector:
         Returns:
             Tuple of (trajectory points, confidence score)
         """
-        # Filter to frames where ball was detected
-        valid_detections = [d for d in detections if d["detection"] is not None]
+        summary = self._summarize_detections(detections)
 
-        if len(valid_detections) < 2:
+        if len(summary.valid) < 2:
             return [], 0.0
 
         # Build trajectory
         trajectory: list[TrajectoryPoint] = []
-        for det in valid_detections:
+        for det in summary.valid:
             trajectory.append(
                 TrajectoryPoint(
                     timestamp=det["timestamp"],
-                    x=det["detection"]["center"][0],
-                    y=det["detection"]["center"][1],
-                    confidence=det["detection"]["confidence"],
+                    x=det["detection"].center[0],
+                    y=det["detection"].center[1],
+                    confidence=det["detection"].confidence,
                     interpolated=False,
                 )
             )
@@ -1132,11 +2198,11 @@ class BallDetector:
         # Interpolate gaps if requested
         if interpolate_gaps and len(trajectory) >= 2:
             trajectory = self._interpolate_trajectory_gaps(
-                trajectory, detections, max_gap_frames
+                trajectory, summary, max_gap_frames
             )
 
         # Calculate trajectory confidence
-        analysis = self._analyze_trajectory(trajectory, detections)
+        analysis = self._analyze_trajectory(trajectory, summary)
 
         # Convert to dict format for backward compatibility
         trajectory_dicts = [
@@ -1152,17 +2218,47 @@ class BallDetector:
 
         return trajectory_dicts, analysis.confidence
 
+    @staticmethod
+    def _summarize_detections(detections: list[dict]) -> DetectionSummary:
+        """Split segment detections into hits and misses in one pass.
+
+        Args:
+            detections: Frame detections from detect_ball_in_video_segment
+
+        Returns:
+            DetectionSummary reused by the interpolation and scoring steps
+        """
+        valid: list[dict] = []
+        detection_frames: set[int] = set()
+        for d in detections:
+            if d["detection"] is not None:
+                detection_frames.add(d["frame"])
+                # Motion-gated frames repeat an earlier point: the ball was
+                # there, but they add nothing to the trajectory
+                if not d["static"]:
+                    valid.append(d)
+
+        # Misses are matched on integer frame indices rather than float timestamps
+        miss_timestamps = sorted(
+            d["timestamp"] for d in detections if d["frame"] not in detection_frames
+        )
+        return DetectionSummary(
+            valid=valid,
+            miss_timestamps=miss_timestamps,
+            detection_ratio=len(detection_frames) / max(1, len(detections)),
+        )
+
     def _interpolate_trajectory_gaps(
         self,
         trajectory: list[TrajectoryPoint],
-        all_detections: list[dict],
+        summary: DetectionSummary,
         max_gap_frames: int,
     ) -> list[TrajectoryPoint]:
         """Fill small gaps in trajectory with interpolated points.
 
         Args:
             trajectory: List of detected trajectory points
-            all_detections: All detection results (including misses)
+            summary: Summary of all detection results (including misses)
             max_gap_frames: Maximum gap size to interpolate
 
         Returns:
@@ -1171,24 +2267,28 @@ class BallDetector:
         if len(trajectory) < 2:
             return trajectory
 
-        # Build timestamp to detection mapping
-        detection_timestamps = {d["timestamp"] for d in all_detections if d["detection"]}
-        all_timestamps = sorted(d["timestamp"] for d in all_detections)
+        miss_timestamps = summary.miss_timestamps
 
         result: list[TrajectoryPoint] = []
 
+        # Trajectory points are in time order, so one cursor walks the misses
+        # once across all gaps
+        cursor = 0
         for i in range(len(trajectory) - 1):
             current = trajectory[i]
             next_point = trajectory[i + 1]
             result.append(current)
 
-            # Find timestamps between current and next detection
-            gap_timestamps = [
-                t
-                for t in all_timestamps
-                if current.timestamp < t < next_point.timestamp
-                and t not in detection_timestamps
-            ]
+            # Find missed timestamps between current and next detection
+            while cursor < len(miss_timestamps) and miss_timestamps[cursor] <= current.timestamp:
+                cursor += 1
+            gap_end = cursor
+            while (
+                gap_end < len(miss_timestamps)
+                and miss_timestamps[gap_end] < next_point.timestamp
+            ):
+                gap_end += 1
+            gap_timestamps = miss_timestamps[cursor:gap_end]
 
             # Only interpolate small gaps
             if 0 < len(gap_timestamps) <= max_gap_frames:
@@ -1224,13 +2324,13 @@ class BallDetector:
     def _analyze_trajectory(
         self,
         trajectory: list[TrajectoryPoint],
-        all_detections: list[dict],
+        summary: DetectionSummary,
     ) -> FlightAnalysis:
         """Perform comprehensive trajectory analysis.
 
         Args:
             trajectory: List of trajectory points
-            all_detections: All detection results
+            summary: Summary of all detection results
 
         Returns:
             FlightAnalysis with confidence scores and metrics
@@ -1248,27 +2348,27 @@ class BallDetector:
                 gap_count=0,
             )
 
-        # Detection ratio
-        detected_count = len([d for d in all_detections if d["detection"]])
-        detection_ratio = detected_count / max(1, len(all_detections))
+        detection_ratio = summary.detection_ratio
+
+        points = self._trajectory_array(trajectory)
 
         # Calculate smoothness
-        smoothness_score = self._calculate_smoothness(trajectory)
+        smoothness_score = self._calculate_smoothness(points)
 
         # Check physics plausibility (ball should follow parabolic arc)
-        physics_score = self._calculate_physics_plausibility(trajectory)
+        physics_score = self._calculate_physics_plausibility(points)
 
         # Find apex (highest point - remember Y increases downward in image coords)
-        apex_point = min(trajectory, key=lambda p: p.y)
+        apex_point = trajectory[int(np.argmin(points[2]))]
 
         # Estimate launch angle from first few points
-        launch_angle = self._estimate_launch_angle(trajectory)
+        launch_angle = self._estimate_launch_angle(points)
 
         # Flight duration
         flight_duration = trajectory[-1].timestamp - trajectory[0].timestamp
 
         # Count gaps
-        interpolated_count = sum(1 for p in trajectory if p.interpolated)
+        interpolated_count = int(np.count_nonzero(points[4]))
         has_gaps = interpolated_count > 0
 
         # Combined confidence
@@ -1290,45 +2390,43 @@ class BallDetector:
             gap_count=interpolated_count,
         )
 
-    def _calculate_smoothness(self, trajectory: list[TrajectoryPoint]) -> float:
-        """Calculate trajectory smoothness score.
+    @staticmethod
+    def _trajectory_array(trajectory: list[TrajectoryPoint]) -> np.ndarray:
+        """Pack trajectory points into one structure-of-arrays (5, N) array.
 
-        A smooth trajectory has consistent velocity changes (no sudden jumps).
+        Rows are timestamp, x, y, confidence and interpolated (0 or 1), built
+        in a single pass. Each field is a contiguous row, so the scoring
+        helpers and the numba kernel use views instead of per-field lists
+        or copies.
 
         Args:
             trajectory: List of trajectory points
 
         Returns:
-            Smoothness score between 0 and 1
+            Float array with one column per point
         """
-        if len(trajectory) < 3:
-            return 0.5  # Not enough points to judge
-
-        x_coords = np.array([p.x for p in trajectory])
-        y_coords = np.array([p.y for p in trajectory])
-        timestamps = np.array([p.timestamp for p in trajectory])
-
-        # Calculate velocities
-        dt = np.diff(timestamps)
-        dt = np.where(dt == 0, 1e-6, dt)  # Avoid division by zero
+        points = np.empty((5, len(trajectory)), dtype=np.float64)
+        for i, p in enumerate(trajectory):
+            points[:, i] = (p.timestamp, p.x, p.y, p.confidence, p.interpolated)
+        return points
 
-        vx = np.diff(x_coords) / dt
-        vy = np.diff(y_coords) / dt
+    def _calculate_smoothness(self, points: np.ndarray) -> float:
+        """Calculate trajectory smoothness score.
 
-        if len(vx) < 2:
-            return 0.5
+        A smooth trajectory has consistent velocity changes (no sudden jumps).
 
-        # Calculate accelerations
-        dt2 = dt[:-1]
-        dt2 = np.where(dt2 == 0, 1e-6, dt2)
+        Args:
+            points: Trajectory array from _trajectory_array()
 
-        ax = np.diff(vx) / dt2
-        ay = np.diff(vy) / dt2
+        Returns:
+            Smoothness score between 0 and 1
+        """
+        if points.shape[1] < 3:
+            return 0.5  # Not enough points to judge
 
         # Smoothness based on acceleration variance
         # Lower variance = smoother trajectory
-        ax_var = np.var(ax) if len(ax) > 0 else 0
-        ay_var = np.var(ay) if len(ay) > 0 else 0
+        ax_var, ay_var = _acceleration_variance(points[0], points[1], points[2])
 
         # Normalize - smaller variance is better
         # Use sigmoid-like transformation with configurable scale
@@ -1337,42 +2435,53 @@ class BallDetector:
 
         return float((smoothness_x + smoothness_y) / 2)
 
-    def _calculate_physics_plausibility(
-        self, trajectory: list[TrajectoryPoint]
-    ) -> float:
+    def _calculate_physics_plausibility(self, points: np.ndarray) -> float:
         """Check if trajectory follows expected golf ball physics.
 
         Golf balls follow parabolic arcs under gravity. This checks if
         the Y-coordinate trajectory roughly matches expected physics.
 
         Args:
-            trajectory: List of trajectory points
+            points: Trajectory array from _trajectory_array()
 
         Returns:
             Physics plausibility score between 0 and 1
         """
-        if len(trajectory) < 4:
+        if points.shape[1] < 4:
             return 0.5  # Not enough points to fit parabola
 
         # Get coordinates
-        x_coords = np.array([p.x for p in trajectory])
-        y_coords = np.array([p.y for p in trajectory])
-        timestamps = np.array([p.timestamp for p in trajectory])
+        timestamps, x_coords, y_coords = points[0], points[1], points[2]
+        n = points.shape[1]
+
+        # Two scratch rows hold every intermediate: normalized time and a
+        # work row, updated in place
+        t_norm, work = np.empty((2, n))
 
         # Normalize time to [0, 1]
-        t_norm = (timestamps - timestamps[0]) / max(
-            timestamps[-1] - timestamps[0], 1e-6
-        )
+        np.subtract(timestamps, timestamps[0], out=t_norm)
+        t_norm /= max(timestamps[-1] - timestamps[0], 1e-6)
 
         try:
             # Fit quadratic to Y vs time (parabolic motion)
-            # y = at^2 + bt + c
-            coeffs = np.polyfit(t_norm, y_coords, 2)
-            y_fitted = np.polyval(coeffs, t_norm)
+            # y = at^2 + bt + c, solved from the 3x3 least-squares normal
+            # equations; t is in [0, 1] so they stay well conditioned
+            t2 = np.multiply(t_norm, t_norm, out=work)
+            s1, s2, s3, s4 = t_norm.sum(), t2.sum(), t2 @ t_norm, t2 @ t2
+            normal = np.array([[s4, s3, s2], [s3, s2, s1], [s2, s1, n]])
+            rhs = np.array([t2 @ y_coords, t_norm @ y_coords, y_coords.sum()])
+            a, b, c = np.linalg.solve(normal, rhs)
+
+            # Residuals of the fit, evaluated by Horner's rule
+            residuals = np.multiply(t_norm, a, out=work)
+            residuals += b
+            residuals *= t_norm
+            residuals += c
+            np.subtract(y_coords, residuals, out=residuals)
 
             # Calculate R-squared
-            ss_res = np.sum((y_coords - y_fitted) ** 2)
-            ss_tot = np.sum((y_coords - np.mean(y_coords)) ** 2)
+            ss_res = residuals @ residuals
+            ss_tot = y_coords.var() * n
 
             if ss_tot == 0:
                 return 0.5
@@ -1380,8 +2489,9 @@ class BallDetector:
             r_squared = 1 - (ss_res / ss_tot)
 
             # Also check X progression (should be roughly monotonic)
-            x_direction = np.sign(np.diff(x_coords))
-            x_consistency = np.sum(x_direction == x_direction[0]) / len(x_direction)
+            x_direction = np.subtract(x_coords[1:], x_coords[:-1], out=work[:-1])
+            np.sign(x_direction, out=x_direction)
+            x_consistency = np.count_nonzero(x_direction == x_direction[0]) / (n - 1)
 
             # Combined score
             physics_score = r_squared * 0.6 + x_consistency * 0.4
@@ -1391,26 +2501,20 @@ class BallDetector:
         except (np.linalg.LinAlgError, ValueError):
             return 0.5
 
-    def _estimate_launch_angle(
-        self, trajectory: list[TrajectoryPoint]
-    ) -> Optional[float]:
+    def _estimate_launch_angle(self, points: np.ndarray) -> Optional[float]:
         """Estimate launch angle from initial trajectory points.
 
         Args:
-            trajectory: List of trajectory points
+            points: Trajectory array from _trajectory_array()
 
         Returns:
             Launch angle in degrees, or None if cannot estimate
         """
-        if len(trajectory) < 2:
+        if points.shape[1] < 2:
             return None
 
         # Use first few points to estimate initial velocity vector
-        n_points = min(3, len(trajectory))
-
-        x_coords = np.array([p.x for p in trajectory[:n_points]])
-        y_coords = np.array([p.y for p in trajectory[:n_points]])
-        timestamps = np.array([p.timestamp for p in trajectory[:n_points]])
+        timestamps, x_coords, y_coords = points[0, :3], points[1, :3], points[2, :3]
 
         # Linear fit to get initial velocity
         dt = timestamps[-1] - timestamps[0]
@@ -1475,7 +2579,8 @@ class BallDetector:
         )
 
         # Early exit if not enough detections
-        valid_detections = [d for d in detections if d["detection"] is not None]
+        summary = self._summarize_detections(detections)
+        valid_detections = summary.valid
         logger.debug(f"Found {len(valid_detections)} ball detections in segment")
 
         if len(valid_detections) < 4:
@@ -1497,13 +2602,19 @@ class BallDetector:
         frame_height = self._frame_height or 1080
 
         # Step 2.5: Filter out stationary detections (ball on tee)
-        # These are detections where the ball doesn't move significantly
-        moving_detections = TrajectoryFilter.filter_stationary_detections(
-            valid_detections,
-            min_movement=0.02,  # 2% of frame (~77px at 4K)
-            frame_width=frame_width,
-            frame_height=frame_height,
-        )
+        # These are detections where the ball doesn't move significantly;
+        # motion-gated frames count towards the tee cluster, then are dropped
+        # with it or on their own as repeated points
+        moving_detections = [
+            d
+            for d in TrajectoryFilter.filter_stationary_detections(
+                detections,
+                min_movement=0.02,  # 2% of frame (~77px at 4K)
+                frame_width=frame_width,
+                frame_height=frame_height,
+            )
+            if not d["static"]
+        ]
 
         if len(moving_detections) < 4:
             logger.debug("Not enough moving detections for trajectory (ball may still be on tee)")
@@ -1539,9 +2650,9 @@ class BallDetector:
             points = [
                 TrajectoryPoint(
                     timestamp=d["timestamp"],
-                    x=d["detection"]["center"][0],
-                    y=d["detection"]["center"][1],
-                    confidence=d["detection"]["confidence"],
+                    x=d["detection"].center[0],
+                    y=d["detection"].center[1],
+                    confidence=d["detection"].confidence,
                     interpolated=False,
                 )
                 for d in segment
@@ -1614,11 +2725,11 @@ class BallDetector:
 
         # Step 5: Interpolate gaps in the best trajectory
         best_trajectory = self._interpolate_trajectory_gaps(
-            best_trajectory, detections, max_gap_frames=5
+            best_trajectory, summary, max_gap_frames=5
         )
 
         # Step 6: Analyze the final trajectory
-        analysis = self._analyze_trajectory(best_trajectory, detections)
+        analysis = self._analyze_trajectory(best_trajectory, summary)
 
         # Override apex point with the one we found during parabola validation
         if best_apex:
@@ -1685,15 +2796,23 @@ class BallDetector:
         Returns:
             True if ball appears to be moving
         """
-        valid = [d for d in detections if d["detection"] is not None]
-        if len(valid) < 2:
+        # Only the first and last detections matter, so find them from each end
+        first_index = next(
+            (i for i, d in enumerate(detections) if d["detection"] is not None), None
+        )
+        if first_index is None:
+            return False
+        last_index = next(
+            i
+            for i in range(len(detections) - 1, -1, -1)
+            if detections[i]["detection"] is not None
+        )
+        if last_index == first_index:
             return False
 
-        # Calculate total displacement
-        first = valid[0]["detection"]["center"]
-        last = valid[-1]["detection"]["center"]
-
-        displacement = np.sqrt((last[0] - first[0]) ** 2 + (last[1] - first[1]) ** 2)
-
-        # Cast to Python bool to avoid returning numpy.bool_
-        return bool(displacement >= min_displacement)
+        # Compare squared total displacement, avoiding the square root
+        first = detections[first_index]["detection"].center
+        last = detections[last_index]["detection"].center
+        dx = last[0] - first[0]
+        dy = last[1] - first[1]
+        return dx * dx + dy * dy >= min_displacement * min_displacement
@@ -1,5 +1,7 @@
 """Main entry point for GolfClip backend."""
 
+import asyncio
+import time
 from contextlib import asynccontextmanager
 
 import uvicorn
@@ -7,11 +9,17 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
-from backend.api.routes import router, _job_cache, _progress_queues, load_jobs_on_startup
+from backend.api.routes import (
+    router,
+    _active_job_ids,
+    _close_progress_queues,
+    _job_cache,
+    load_jobs_on_startup,
+)
 from backend.core.config import settings
 from backend.core.database import init_db, close_db, DB_PATH
 from backend.detection.visual import ensure_model_downloaded, is_model_ready, get_model_status
-from backend.models.job import update_job
+from backend.models.job import count_jobs, flush_job_progress, update_job
 
 
 @asynccontextmanager
@@ -42,17 +50,29 @@ async def lifespan(app: FastAPI):
     logger.info("GolfClip backend shutting down...")
 
     # Cancel any running jobs (update both cache and database)
-    for job_id, job in list(_job_cache.items()):
-        if job["status"] in ("pending", "processing"):
-            job["cancelled"] = True
-            try:
-                await update_job(job_id, cancelled=True, status="cancelled")
-            except Exception as e:
-                logger.warning(f"Failed to update job {job_id} during shutdown: {e}")
-            logger.info(f"Cancelling job {job_id} during shutdown")
-
-    # Clear progress queues
-    _progress_queues.clear()
+    async def cancel_job(job_id: str) -> None:
+        try:
+            await update_job(job_id, cancelled=True, status="cancelled")
+        except Exception as e:
+            logger.warning(f"Failed to update job {job_id} during shutdown: {e}")
+        logger.info(f"Cancelling job {job_id} during shutdown")
+
+    running = [
+        job_id for job_id in list(_active_job_ids)
+        if job_id in _job_cache and _job_cache[job_id]["status"] in ("pending", "processing")
+    ]
+    for job_id in running:
+        _job_cache[job_id]["cancelled"] = True
+    await asyncio.gather(*(cancel_job(job_id) for job_id in running))
+
+    # Clear progress queues, ending any open progress streams
+    _close_progress_queues()
+
+    # Write any buffered job progress before closing the database
+    try:
+        await flush_job_progress()
+    except Exception as e:
+        logger.warning(f"Failed to write buffered job progress during shutdown: {e}")
 
     # Close database connection
     await close_db()
@@ -78,27 +98,49 @@ app.add_middleware(
         "http://127.0.0.1:3000",
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Only what the API routes use, so preflights don't echo arbitrary
+    # request methods and headers back
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type"],
 )
 
 app.include_router(router, prefix="/api")
 
+# Total job count for /health, refreshed at most every _HEALTH_TTL seconds so
+# frequent probes don't each hit the database
+_HEALTH_TTL = 5.0
+_health_cache = {"total": 0, "ts": 0.0}
+
+
+@app.get("/healthz")
+async def healthz():
+    """Liveness probe: answers as long as the process is serving requests.
+
+    Does no database or model work, so it is safe to poll at high frequency.
+    Use /health for the full status.
+    """
+    return {"ok": True}
+
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
-    from backend.models.job import get_all_jobs
-
+    """Health check endpoint with job counts and model readiness."""
     # Get active jobs from cache (faster) and total from database
-    active_jobs = sum(1 for j in _job_cache.values() if j["status"] in ("pending", "processing"))
-    all_jobs = await get_all_jobs(limit=1000, include_shots=False)
+    active_jobs = sum(
+        1 for job_id in list(_active_job_ids)
+        if job_id in _job_cache and _job_cache[job_id]["status"] in ("pending", "processing")
+    )
+
+    now = time.monotonic()
+    if not _health_cache["ts"] or now - _health_cache["ts"] >= _HEALTH_TTL:
+        _health_cache["total"] = await count_jobs()
+        _health_cache["ts"] = now
 
     return {
         "status": "healthy",
         "version": "0.1.0",
         "active_jobs": active_jobs,
-        "total_jobs": len(all_jobs),
+        "total_jobs": _health_cache["total"],
         "model_ready": is_model_ready(),
     }
 
@@ -112,11 +154,18 @@ async def model_status():
 def main():
     """Run the FastAPI server."""
     logger.info(f"Starting GolfClip server on {settings.host}:{settings.port}")
+    # Single worker on purpose: job state, progress queues and the model
+    # cache live in this process. "auto" picks uvloop and httptools when
+    # they are installed (uvicorn[standard]) and falls back otherwise.
     uvicorn.run(
         "backend.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        loop="auto",
+        http="auto",
+        limit_concurrency=settings.limit_concurrency,
+        backlog=settings.backlog,
     )
 
 
@@ -1,51 +1,100 @@
 """Database operations for Job and Shot models."""
 
+import asyncio
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Any, AsyncGenerator, Optional
 
 import aiosqlite
 from loguru import logger
 
-from backend.core.database import get_db, serialize_json, deserialize_json
+from backend.core.database import (
+    get_reader,
+    get_writer,
+    queue_write,
+    serialize_json,
+    submit_write,
+    deserialize_json,
+    pack_detection_features,
+)
+
+
+# Column order expected by job_row_to_dict(); rows are unpacked by position
+_JOB_COLUMNS = (
+    "id, video_path, output_dir, status, progress, current_step, auto_approve, "
+    "video_info_json, created_at, started_at, completed_at, error_json, cancelled, "
+    "total_shots_detected, shots_needing_review"
+)
+
+# Same layout for light job listings, with the JSON blobs read as NULL
+_LIST_COLUMNS = _JOB_COLUMNS.replace(
+    "video_info_json", "NULL AS video_info_json"
+).replace("error_json", "NULL AS error_json")
+
+# Column order expected by shot_row_to_dict()
+_SHOT_COLUMNS = (
+    "shot_number, strike_time, landing_time, clip_start, clip_end, confidence, "
+    "shot_type, audio_confidence, visual_confidence, confidence_reasons_json, "
+    "landing_x, landing_y"
+)
 
 
 def job_row_to_dict(row: aiosqlite.Row) -> dict[str, Any]:
-    """Convert a database row to a job dictionary matching the API schema."""
+    """Convert a database row to a job dictionary matching the API schema.
+
+    The row must start with _JOB_COLUMNS, in order; fields are unpacked by
+    position rather than looked up by name.
+    """
+    (
+        job_id, video_path, output_dir, status, progress, current_step, auto_approve,
+        video_info_json, created_at, started_at, completed_at, error_json, cancelled,
+        total_shots_detected, shots_needing_review, *_,
+    ) = row
     return {
-        "id": row["id"],
-        "video_path": row["video_path"],
-        "output_dir": row["output_dir"],
-        "status": row["status"],
-        "progress": row["progress"],
-        "current_step": row["current_step"],
-        "auto_approve": bool(row["auto_approve"]),
-        "video_info": deserialize_json(row["video_info_json"]),
-        "created_at": row["created_at"],
-        "started_at": row["started_at"],
-        "completed_at": row["completed_at"],
-        "error": deserialize_json(row["error_json"]),
-        "cancelled": bool(row["cancelled"]),
-        "total_shots_detected": row["total_shots_detected"],
-        "shots_needing_review": row["shots_needing_review"],
+        "id": job_id,
+        "video_path": video_path,
+        "output_dir": output_dir,
+        "status": status,
+        "progress": progress,
+        "current_step": current_step,
+        "auto_approve": bool(auto_approve),
+        "video_info": deserialize_json(video_info_json),
+        "created_at": created_at,
+        "started_at": started_at,
+        "completed_at": completed_at,
+        "error": deserialize_json(error_json),
+        "cancelled": bool(cancelled),
+        "total_shots_detected": total_shots_detected,
+        "shots_needing_review": shots_needing_review,
         "shots": [],  # Populated separately
     }
 
 
 def shot_row_to_dict(row: aiosqlite.Row) -> dict[str, Any]:
-    """Convert a database row to a shot dictionary matching the API schema."""
+    """Convert a database row to a shot dictionary matching the API schema.
+
+    The row must start with _SHOT_COLUMNS, in order.
+    """
+    (
+        shot_number, strike_time, landing_time, clip_start, clip_end, confidence,
+        shot_type, audio_confidence, visual_confidence, confidence_reasons_json,
+        landing_x, landing_y, *_,
+    ) = row
     return {
-        "id": row["shot_number"],  # Use shot_number as the API-facing ID
-        "strike_time": row["strike_time"],
-        "landing_time": row["landing_time"],
-        "clip_start": row["clip_start"],
-        "clip_end": row["clip_end"],
-        "confidence": row["confidence"],
-        "shot_type": row["shot_type"],
-        "audio_confidence": row["audio_confidence"],
-        "visual_confidence": row["visual_confidence"],
-        "confidence_reasons": deserialize_json(row["confidence_reasons_json"]) or [],
-        "landing_x": row["landing_x"],
-        "landing_y": row["landing_y"],
+        "id": shot_number,  # Use shot_number as the API-facing ID
+        "strike_time": strike_time,
+        "landing_time": landing_time,
+        "clip_start": clip_start,
+        "clip_end": clip_end,
+        "confidence": confidence,
+        "shot_type": shot_type,
+        "audio_confidence": audio_confidence,
+        "visual_confidence": visual_confidence,
+        "confidence_reasons": deserialize_json(confidence_reasons_json) or [],
+        "landing_x": landing_x,
+        "landing_y": landing_y,
     }
 
 
@@ -68,27 +117,27 @@ async def create_job(
     Returns:
         The created job as a dictionary.
     """
-    db = await get_db()
     created_at = datetime.utcnow().isoformat()
 
-    await db.execute(
-        """
-        INSERT INTO jobs (
-            id, video_path, output_dir, status, progress, current_step,
-            auto_approve, video_info_json, created_at, cancelled,
-            total_shots_detected, shots_needing_review
-        ) VALUES (?, ?, ?, 'pending', 0, 'Initializing', ?, ?, ?, 0, 0, 0)
-        """,
-        (
-            job_id,
-            video_path,
-            output_dir,
-            int(auto_approve),
-            serialize_json(video_info),
-            created_at,
-        ),
-    )
-    await db.commit()
+    async with get_writer() as db:
+        await db.execute(
+            """
+            INSERT INTO jobs (
+                id, video_path, output_dir, status, progress, current_step,
+                auto_approve, video_info_json, created_at, cancelled,
+                total_shots_detected, shots_needing_review
+            ) VALUES (?, ?, ?, 'pending', 0, 'Initializing', ?, ?, ?, 0, 0, 0)
+            """,
+            (
+                job_id,
+                video_path,
+                output_dir,
+                int(auto_approve),
+                serialize_json(video_info),
+                created_at,
+            ),
+        )
+        await db.commit()
 
     logger.debug(f"Created job {job_id} in database")
 
@@ -122,9 +171,9 @@ async def get_job(job_id: str, include_shots: bool = True) -> Optional[dict[str,
     Returns:
         The job as a dictionary, or None if not found.
     """
-    db = await get_db()
-
-    async with db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)) as cursor:
+    async with get_reader() as db, db.execute(
+        f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+    ) as cursor:
         row = await cursor.fetchone()
 
     if not row:
@@ -142,6 +191,7 @@ async def get_all_jobs(
     limit: int = 50,
     status: Optional[str] = None,
     include_shots: bool = False,
+    light: bool = False,
 ) -> list[dict[str, Any]]:
     """Get all jobs with optional filtering.
 
@@ -149,32 +199,67 @@ async def get_all_jobs(
         limit: Maximum number of jobs to return.
         status: Filter by status if provided.
         include_shots: Whether to include shots in each job.
+        light: Skip the video_info and error JSON columns (left as None),
+            for listings that don't show them.
 
     Returns:
         List of jobs as dictionaries.
     """
-    db = await get_db()
-
+    columns = _LIST_COLUMNS if light else _JOB_COLUMNS
     if status:
-        query = "SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?"
+        query = f"SELECT {columns} FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?"
         params = (status, limit)
     else:
-        query = "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?"
+        query = f"SELECT {columns} FROM jobs ORDER BY created_at DESC LIMIT ?"
         params = (limit,)
 
-    async with db.execute(query, params) as cursor:
+    async with get_reader() as db, db.execute(query, params) as cursor:
         rows = await cursor.fetchall()
 
-    jobs = []
-    for row in rows:
-        job = job_row_to_dict(row)
-        if include_shots:
-            job["shots"] = await get_shots_for_job(job["id"])
-        jobs.append(job)
+    jobs = [job_row_to_dict(row) for row in rows]
+
+    if include_shots:
+        shots_by_job = await get_shots_for_jobs([job["id"] for job in jobs])
+        for job in jobs:
+            job["shots"] = shots_by_job.get(job["id"], [])
 
     return jobs
 
 
+async def count_jobs() -> int:
+    """Count all jobs without materializing any rows.
+
+    Returns:
+        Total number of jobs in the database.
+    """
+    async with get_reader() as db, db.execute("SELECT COUNT(*) as count FROM jobs") as cursor:
+        row = await cursor.fetchone()
+
+    return row["count"]
+
+
+async def get_existing_job_ids(job_ids: list[str]) -> set[str]:
+    """Return which of the given job IDs still exist, in one query per 500 IDs.
+
+    Args:
+        job_ids: Job IDs to check.
+
+    Returns:
+        The subset of job_ids present in the jobs table.
+    """
+    existing: set[str] = set()
+    # Chunked to stay under SQLite's 999 bound-parameter limit
+    for start in range(0, len(job_ids), 500):
+        chunk = job_ids[start:start + 500]
+        placeholders = ", ".join("?" * len(chunk))
+        async with get_reader() as db, db.execute(
+            f"SELECT id FROM jobs WHERE id IN ({placeholders})", chunk
+        ) as cursor:
+            existing.update(row[0] for row in await cursor.fetchall())
+
+    return existing
+
+
 # Valid column names for job updates (prevents SQL injection)
 _VALID_JOB_COLUMNS = {
     "video_path", "output_dir", "status", "progress", "current_step",
@@ -184,22 +269,45 @@ _VALID_JOB_COLUMNS = {
 }
 
 
+@lru_cache(maxsize=64)
+def _build_job_update_sql(columns: tuple[str, ...]) -> str:
+    """Build the UPDATE statement for a sorted tuple of job columns."""
+    return f"UPDATE jobs SET {', '.join(f'{c} = ?' for c in columns)} WHERE id = ?"
+
+
+# Progress-only updates are last-write-wins: they are buffered here per job
+# and written every _PROGRESS_FLUSH_INTERVAL seconds, or folded into the
+# job's next other update, instead of each costing a write
+_PROGRESS_COLUMNS = frozenset({"progress", "current_step"})
+_PROGRESS_FLUSH_INTERVAL = 0.5
+_dirty_jobs: dict[str, dict[str, Any]] = {}
+_progress_flush_task: Optional[asyncio.Task] = None
+
+# Buffered progress taken by a flush whose writes haven't finished. Any other
+# update to the job drops its entry, so a failed write is never re-queued
+# over newer values.
+_flushing: dict[str, dict[str, Any]] = {}
+
+
 async def update_job(job_id: str, **updates: Any) -> bool:
     """Update a job in the database.
 
+    Updates that only touch progress and current_step are buffered and
+    written shortly after (see flush_job_progress()); any other update to
+    the job writes the buffered values along with it.
+
     Args:
         job_id: The job ID to update.
         **updates: Fields to update. Special handling for 'error' and 'video_info'
                    which are serialized to JSON.
 
     Returns:
-        True if the job was updated, False if not found.
+        True if the job was updated (or, for buffered progress, exists),
+        False if not found.
 
     Raises:
         ValueError: If an invalid column name is provided.
     """
-    db = await get_db()
-
     # Handle JSON fields
     if "error" in updates:
         updates["error_json"] = serialize_json(updates.pop("error"))
@@ -207,30 +315,95 @@ async def update_job(job_id: str, **updates: Any) -> bool:
         updates["video_info_json"] = serialize_json(updates.pop("video_info"))
 
     # Validate column names to prevent SQL injection
-    for key in updates.keys():
-        if key not in _VALID_JOB_COLUMNS:
-            raise ValueError(f"Invalid column name for job update: {key}")
-
-    # Build update query dynamically
-    set_clauses = []
-    values = []
-    for key, value in updates.items():
-        # Convert booleans to integers for SQLite
-        if isinstance(value, bool):
-            value = int(value)
-        set_clauses.append(f"{key} = ?")
-        values.append(value)
-
-    if not set_clauses:
+    invalid = updates.keys() - _VALID_JOB_COLUMNS
+    if invalid:
+        raise ValueError(f"Invalid column name for job update: {', '.join(sorted(invalid))}")
+
+    if not updates:
         return True  # Nothing to update
 
+    if updates.keys() <= _PROGRESS_COLUMNS:
+        # Buffer before any await so updates keep their order; a job already
+        # buffered was looked up when its first update arrived
+        known = job_id in _dirty_jobs or job_id in _flushing
+        _dirty_jobs.setdefault(job_id, {}).update(updates)
+        _schedule_progress_flush()
+        return known or job_id in await get_existing_job_ids([job_id])
+
+    # Carry any buffered progress along, unless this update overrides it.
+    # Progress already being flushed was queued first, so this update is
+    # written after it either way.
+    pending = _dirty_jobs.pop(job_id, None)
+    _flushing.pop(job_id, None)
+    if pending:
+        updates = {**pending, **updates}
+
+    return await _write_job_update(job_id, updates)
+
+
+def _schedule_progress_flush() -> None:
+    """Start the background progress flush if it isn't already running."""
+    global _progress_flush_task
+    loop = asyncio.get_running_loop()
+    task = _progress_flush_task
+    if task is None or task.done() or task.get_loop() is not loop:
+        _progress_flush_task = loop.create_task(_progress_flush_loop())
+
+
+async def _progress_flush_loop() -> None:
+    while _dirty_jobs:
+        await asyncio.sleep(_PROGRESS_FLUSH_INTERVAL)
+        try:
+            await flush_job_progress()
+        except Exception as e:
+            logger.warning(f"Failed to write buffered job progress: {e}")
+
+
+async def flush_job_progress() -> None:
+    """Write all buffered progress updates now, in one batch.
+
+    The writes are queued before anything else runs, so any later update to
+    the same job is written after them. Entries whose write fails go back in
+    the buffer, unless the job has had another update since.
+
+    Raises:
+        The first write error, after failed entries have been re-queued.
+    """
+    dirty = list(_dirty_jobs.items())
+    _dirty_jobs.clear()
+    _flushing.update(dirty)
+    writes = [_queue_job_update(job_id, u) for job_id, u in dirty]
+    results = await asyncio.gather(*writes, return_exceptions=True)
+
+    error = None
+    for (job_id, u), result in zip(dirty, results):
+        if _flushing.get(job_id) is not u:
+            continue  # Superseded by a later update or flush
+        del _flushing[job_id]
+        if isinstance(result, Exception):
+            # Progress buffered since the flush started is newer, so it wins
+            _dirty_jobs[job_id] = {**u, **_dirty_jobs.get(job_id, {})}
+            error = error or result
+    if error is not None:
+        _schedule_progress_flush()
+        raise error
+
+
+def _queue_job_update(job_id: str, updates: dict[str, Any]) -> asyncio.Future:
+    """Queue validated job column updates; resolves to the rowcount."""
+    # Sorted column order keeps the cached query keyed per set of columns
+    columns = tuple(sorted(updates))
+    # Convert booleans to integers for SQLite
+    values = [int(v) if type(v) is bool else v for v in map(updates.__getitem__, columns)]
     values.append(job_id)
-    query = f"UPDATE jobs SET {', '.join(set_clauses)} WHERE id = ?"
+    query = _build_job_update_sql(columns)
 
-    cursor = await db.execute(query, values)
-    await db.commit()
+    return queue_write(query, values)
 
-    return cursor.rowcount > 0
+
+async def _write_job_update(job_id: str, updates: dict[str, Any]) -> bool:
+    """Write validated job column updates."""
+    return await _queue_job_update(job_id, updates) > 0
 
 
 async def delete_job(job_id: str) -> bool:
@@ -242,11 +415,13 @@ async def delete_job(job_id: str) -> bool:
     Returns:
         True if the job was deleted, False if not found.
     """
-    db = await get_db()
+    _dirty_jobs.pop(job_id, None)
+    _flushing.pop(job_id, None)
 
     # Shots are deleted automatically due to ON DELETE CASCADE
-    cursor = await db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
-    await db.commit()
+    async with get_writer() as db:
+        cursor = await db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        await db.commit()
 
     deleted = cursor.rowcount > 0
     if deleted:
@@ -255,6 +430,10 @@ async def delete_job(job_id: str) -> bool:
     return deleted
 
 
+_SHOT_ROW_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_SHOTS_PER_INSERT = 999 // 11
+
+
 async def create_shots(job_id: str, shots: list[dict[str, Any]]) -> None:
     """Create multiple shots for a job.
 
@@ -262,8 +441,6 @@ async def create_shots(job_id: str, shots: list[dict[str, Any]]) -> None:
         job_id: The job ID these shots belong to.
         shots: List of shot dictionaries from the detection pipeline.
     """
-    db = await get_db()
-
     # Prepare data for batch insert
     shot_data = [
         (
@@ -282,17 +459,26 @@ async def create_shots(job_id: str, shots: list[dict[str, Any]]) -> None:
         for idx, shot in enumerate(shots)
     ]
 
-    await db.executemany(
-        """
-        INSERT INTO shots (
-            job_id, shot_number, strike_time, landing_time,
-            clip_start, clip_end, confidence, shot_type,
-            audio_confidence, visual_confidence, confidence_reasons_json
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        shot_data,
-    )
-    await db.commit()
+    # Multi-row INSERTs, chunked to stay under SQLite's 999 bound-parameter
+    # limit; each chunk is one statement instead of one step per shot
+    async with get_writer() as db:
+        try:
+            for start in range(0, len(shot_data), _SHOTS_PER_INSERT):
+                chunk = shot_data[start:start + _SHOTS_PER_INSERT]
+                await db.execute(
+                    f"""
+                    INSERT INTO shots (
+                        job_id, shot_number, strike_time, landing_time,
+                        clip_start, clip_end, confidence, shot_type,
+                        audio_confidence, visual_confidence, confidence_reasons_json
+                    ) VALUES {", ".join([_SHOT_ROW_PLACEHOLDERS] * len(chunk))}
+                    """,
+                    tuple(chain.from_iterable(chunk)),
+                )
+        except Exception:
+            await db.rollback()
+            raise
+        await db.commit()
 
     logger.debug(f"Created {len(shots)} shots for job {job_id}")
 
@@ -306,10 +492,8 @@ async def get_shots_for_job(job_id: str) -> list[dict[str, Any]]:
     Returns:
         List of shots as dictionaries.
     """
-    db = await get_db()
-
-    async with db.execute(
-        "SELECT * FROM shots WHERE job_id = ? ORDER BY shot_number",
+    async with get_reader() as db, db.execute(
+        f"SELECT {_SHOT_COLUMNS} FROM shots WHERE job_id = ? ORDER BY shot_number",
         (job_id,),
     ) as cursor:
         rows = await cursor.fetchall()
@@ -317,6 +501,33 @@ async def get_shots_for_job(job_id: str) -> list[dict[str, Any]]:
     return [shot_row_to_dict(row) for row in rows]
 
 
+async def get_shots_for_jobs(job_ids: list[str]) -> dict[str, list[dict[str, Any]]]:
+    """Get the shots for several jobs with one query per 500 jobs.
+
+    Args:
+        job_ids: The job IDs to get shots for.
+
+    Returns:
+        Dictionary mapping job ID to its shots, ordered by shot number. Jobs
+        without shots are absent.
+    """
+    shots_by_job: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    # Chunked to stay under SQLite's 999 bound-parameter limit
+    for start in range(0, len(job_ids), 500):
+        chunk = job_ids[start:start + 500]
+        placeholders = ", ".join("?" * len(chunk))
+        async with get_reader() as db, db.execute(
+            f"SELECT {_SHOT_COLUMNS}, job_id FROM shots "
+            f"WHERE job_id IN ({placeholders}) ORDER BY job_id, shot_number",
+            chunk,
+        ) as cursor:
+            rows = await cursor.fetchall()
+        for row in rows:
+            shots_by_job[row[-1]].append(shot_row_to_dict(row))
+
+    return dict(shots_by_job)
+
+
 # Valid column names for shot updates (prevents SQL injection)
 _VALID_SHOT_COLUMNS = {
     "shot_number", "strike_time", "landing_time", "clip_start", "clip_end",
@@ -325,6 +536,15 @@ _VALID_SHOT_COLUMNS = {
 }
 
 
+@lru_cache(maxsize=64)
+def _build_shot_update_sql(columns: tuple[str, ...]) -> str:
+    """Build the UPDATE statement for a sorted tuple of shot columns."""
+    return (
+        f"UPDATE shots SET {', '.join(f'{c} = ?' for c in columns)} "
+        "WHERE job_id = ? AND shot_number = ?"
+    )
+
+
 async def update_shot(job_id: str, shot_id: int, **updates: Any) -> bool:
     """Update a shot in the database.
 
@@ -339,8 +559,6 @@ async def update_shot(job_id: str, shot_id: int, **updates: Any) -> bool:
     Raises:
         ValueError: If an invalid column name is provided.
     """
-    db = await get_db()
-
     # Handle JSON fields
     if "confidence_reasons" in updates:
         updates["confidence_reasons_json"] = serialize_json(updates.pop("confidence_reasons"))
@@ -350,27 +568,19 @@ async def update_shot(job_id: str, shot_id: int, **updates: Any) -> bool:
         updates["shot_number"] = updates.pop("id")
 
     # Validate column names to prevent SQL injection
-    for key in updates.keys():
-        if key not in _VALID_SHOT_COLUMNS:
-            raise ValueError(f"Invalid column name for shot update: {key}")
-
-    # Build update query dynamically
-    set_clauses = []
-    values = []
-    for key, value in updates.items():
-        set_clauses.append(f"{key} = ?")
-        values.append(value)
-
-    if not set_clauses:
+    invalid = updates.keys() - _VALID_SHOT_COLUMNS
+    if invalid:
+        raise ValueError(f"Invalid column name for shot update: {', '.join(sorted(invalid))}")
+
+    if not updates:
         return True  # Nothing to update
 
+    columns = tuple(sorted(updates))
+    values = [updates[c] for c in columns]
     values.extend([job_id, shot_id])
-    query = f"UPDATE shots SET {', '.join(set_clauses)} WHERE job_id = ? AND shot_number = ?"
+    query = _build_shot_update_sql(columns)
 
-    cursor = await db.execute(query, values)
-    await db.commit()
-
-    return cursor.rowcount > 0
+    return await submit_write(query, values) > 0
 
 
 async def update_shot_landing(
@@ -390,13 +600,12 @@ async def update_shot_landing(
     Returns:
         True if the shot was updated, False if not found.
     """
-    db = await get_db()
-
-    cursor = await db.execute(
-        "UPDATE shots SET landing_x = ?, landing_y = ? WHERE job_id = ? AND shot_number = ?",
-        (landing_x, landing_y, job_id, shot_id),
-    )
-    await db.commit()
+    async with get_writer() as db:
+        cursor = await db.execute(
+            "UPDATE shots SET landing_x = ?, landing_y = ? WHERE job_id = ? AND shot_number = ?",
+            (landing_x, landing_y, job_id, shot_id),
+        )
+        await db.commit()
 
     return cursor.rowcount > 0
 
@@ -418,6 +627,15 @@ async def load_jobs_into_memory() -> dict[str, dict[str, Any]]:
 # ============================================================================
 
 
+# Columns read by feedback_row_to_dict(); leaves out detection_features_blob,
+# which only the ML loader reads
+_FEEDBACK_COLUMNS = (
+    "id, job_id, shot_id, feedback_type, notes, confidence_snapshot, "
+    "audio_confidence_snapshot, visual_confidence_snapshot, "
+    "detection_features_json, created_at, environment"
+)
+
+
 def feedback_row_to_dict(row: aiosqlite.Row) -> dict[str, Any]:
     """Convert a database row to a feedback dictionary."""
     return {
@@ -462,38 +680,7 @@ async def create_feedback(
     Returns:
         The created feedback record as a dictionary.
     """
-    db = await get_db()
-    created_at = datetime.utcnow().isoformat()
-
-    cursor = await db.execute(
-        """
-        INSERT INTO shot_feedback (
-            job_id, shot_id, feedback_type, notes,
-            confidence_snapshot, audio_confidence_snapshot,
-            visual_confidence_snapshot, detection_features_json, created_at,
-            environment
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            job_id,
-            shot_id,
-            feedback_type,
-            notes,
-            confidence_snapshot,
-            audio_confidence_snapshot,
-            visual_confidence_snapshot,
-            serialize_json(detection_features),
-            created_at,
-            environment,
-        ),
-    )
-    await db.commit()
-
-    feedback_id = cursor.lastrowid
-    logger.debug(f"Created feedback {feedback_id} for job {job_id}, shot {shot_id}: {feedback_type} (env={environment})")
-
-    return {
-        "id": feedback_id,
+    records = await create_feedback_bulk([{
         "job_id": job_id,
         "shot_id": shot_id,
         "feedback_type": feedback_type,
@@ -502,9 +689,78 @@ async def create_feedback(
         "audio_confidence_snapshot": audio_confidence_snapshot,
         "visual_confidence_snapshot": visual_confidence_snapshot,
         "detection_features": detection_features,
-        "created_at": created_at,
         "environment": environment,
-    }
+    }])
+    return records[0]
+
+
+_INSERT_FEEDBACK_SQL = """
+    INSERT INTO shot_feedback (
+        job_id, shot_id, feedback_type, notes,
+        confidence_snapshot, audio_confidence_snapshot,
+        visual_confidence_snapshot, detection_features_json,
+        detection_features_blob, created_at, environment
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+async def create_feedback_bulk(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Create several feedback records in one transaction.
+
+    Args:
+        items: One dict of create_feedback() keyword arguments per record.
+
+    Returns:
+        The created feedback records as dictionaries, in the order given.
+    """
+    created_at = datetime.utcnow().isoformat()
+
+    records = []
+    async with get_writer() as db:
+        try:
+            for item in items:
+                record = {
+                    "notes": None,
+                    "confidence_snapshot": None,
+                    "audio_confidence_snapshot": None,
+                    "visual_confidence_snapshot": None,
+                    "detection_features": None,
+                    "environment": "prod",
+                    **item,
+                    "created_at": created_at,
+                }
+                cursor = await db.execute(
+                    _INSERT_FEEDBACK_SQL,
+                    (
+                        record["job_id"],
+                        record["shot_id"],
+                        record["feedback_type"],
+                        record["notes"],
+                        record["confidence_snapshot"],
+                        record["audio_confidence_snapshot"],
+                        record["visual_confidence_snapshot"],
+                        serialize_json(record["detection_features"]),
+                        pack_detection_features(record["detection_features"]),
+                        created_at,
+                        record["environment"],
+                    ),
+                )
+                records.append({"id": cursor.lastrowid, **record})
+        except Exception:
+            # Don't leave half a batch pending on the shared writer connection
+            await db.rollback()
+            raise
+
+        # One commit for the whole batch rather than one per record
+        await db.commit()
+
+    for record in records:
+        logger.debug(
+            f"Created feedback {record['id']} for job {record['job_id']}, shot {record['shot_id']}: "
+            f"{record['feedback_type']} (env={record['environment']})"
+        )
+
+    return records
 
 
 async def get_feedback_for_job(job_id: str) -> list[dict[str, Any]]:
@@ -516,10 +772,8 @@ async def get_feedback_for_job(job_id: str) -> list[dict[str, Any]]:
     Returns:
         List of feedback records as dictionaries.
     """
-    db = await get_db()
-
-    async with db.execute(
-        "SELECT * FROM shot_feedback WHERE job_id = ? ORDER BY shot_id",
+    async with get_reader() as db, db.execute(
+        f"SELECT {_FEEDBACK_COLUMNS} FROM shot_feedback WHERE job_id = ? ORDER BY shot_id",
         (job_id,),
     ) as cursor:
         rows = await cursor.fetchall()
@@ -531,63 +785,170 @@ async def get_all_feedback(
     limit: int = 1000,
     offset: int = 0,
     feedback_type: Optional[str] = None,
+    before: Optional[tuple[str, int]] = None,
 ) -> list[dict[str, Any]]:
-    """Get all feedback records with optional filtering.
+    """Get all feedback records with optional filtering, newest first.
+
+    For paging, prefer ``before`` over ``offset``: it seeks straight to the
+    page through the (created_at, id) index, while an offset has SQLite
+    walk and discard every skipped row.
 
     Args:
         limit: Maximum records to return.
         offset: Number of records to skip (for pagination).
         feedback_type: Filter by feedback type if provided.
+        before: (created_at, id) of the last record of the previous page;
+            only older records are returned.
 
     Returns:
         List of feedback records as dictionaries.
     """
-    db = await get_db()
-
+    conditions = []
+    params: list[Any] = []
     if feedback_type:
-        query = """
-            SELECT * FROM shot_feedback
-            WHERE feedback_type = ?
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-        """
-        params = (feedback_type, limit, offset)
-    else:
-        query = """
-            SELECT * FROM shot_feedback
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-        """
-        params = (limit, offset)
-
-    async with db.execute(query, params) as cursor:
+        conditions.append("feedback_type = ?")
+        params.append(feedback_type)
+    if before is not None:
+        conditions.append("(created_at, id) < (?, ?)")
+        params.extend(before)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    params.extend((limit, offset))
+
+    query = f"""
+        SELECT {_FEEDBACK_COLUMNS} FROM shot_feedback
+        {where}
+        ORDER BY created_at DESC, id DESC
+        LIMIT ? OFFSET ?
+    """
+
+    async with get_reader() as db, db.execute(query, params) as cursor:
         rows = await cursor.fetchall()
 
     return [feedback_row_to_dict(row) for row in rows]
 
 
+def _feedback_scan(
+    columns: str,
+    environment: Optional[str],
+    limit: Optional[int],
+) -> tuple[str, tuple[Any, ...]]:
+    """Build the newest-first feedback scan query shared by the streaming readers."""
+    where = "WHERE environment = ?" if environment else ""
+    params = (environment,) if environment else ()
+    query = f"""
+        SELECT {columns} FROM shot_feedback
+        {where}
+        ORDER BY created_at DESC
+        LIMIT ?
+    """
+    # SQLite treats a negative LIMIT as no limit
+    return query, params + (-1 if limit is None else limit,)
+
+
+async def iter_feedback(
+    environment: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Stream feedback records newest first, one row at a time.
+
+    Args:
+        environment: Only yield records tagged with this environment if provided.
+        limit: Maximum records to yield, or None for all.
+
+    Yields:
+        Feedback records as dictionaries.
+    """
+    query, params = _feedback_scan(_FEEDBACK_COLUMNS, environment, limit)
+    async with get_reader() as db, db.execute(query, params) as cursor:
+        async for row in cursor:
+            yield feedback_row_to_dict(row)
+
+
+async def get_feedback_columns(
+    environment: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> dict[str, list[Any]]:
+    """Get the fields the ML analysis needs from all feedback, by column.
+
+    Streams only the type, confidence, environment and timestamp columns
+    into per-column lists, skipping the per-row dicts and feature JSON
+    decoding of get_all_feedback(). created_at comes back as integer Unix
+    seconds (UTC) rather than an ISO string.
+
+    Args:
+        environment: Only include records tagged with this environment if provided.
+        limit: Maximum records to return, or None for all.
+
+    Returns:
+        Dictionary mapping column name to a list of values, newest first.
+    """
+    names = ("feedback_type", "confidence_snapshot", "environment", "created_at")
+    columns = {name: [] for name in names}
+    appends = [columns[name].append for name in names]
+
+    # SQLite parses the ISO timestamps to Unix seconds while scanning, so
+    # callers get plain integers instead of strings to parse in Python
+    select = (
+        "feedback_type, confidence_snapshot, environment, "
+        "CAST(strftime('%s', created_at) AS INTEGER) AS created_at"
+    )
+    query, params = _feedback_scan(select, environment, limit)
+    async with get_reader() as db, db.execute(query, params) as cursor:
+        async for row in cursor:
+            for append, value in zip(appends, row):
+                append(value)
+
+    return columns
+
+
+async def get_feedback_features(
+    environment: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> tuple[list[bytes], list[str]]:
+    """Get packed detection feature vectors and their feedback types.
+
+    Only records with detection features are returned. Each vector is the
+    raw detection_features_blob (see pack_detection_features()), so no JSON
+    is decoded.
+
+    Args:
+        environment: Only include records tagged with this environment if provided.
+        limit: Maximum records to scan, or None for all.
+
+    Returns:
+        Tuple of (packed vectors, feedback types), newest first.
+    """
+    blobs: list[bytes] = []
+    types: list[str] = []
+    query, params = _feedback_scan(
+        "detection_features_blob, feedback_type", environment, limit
+    )
+    async with get_reader() as db, db.execute(query, params) as cursor:
+        async for blob, feedback_type in cursor:
+            if blob is not None:
+                blobs.append(blob)
+                types.append(feedback_type)
+
+    return blobs, types
+
+
 async def get_feedback_stats() -> dict[str, Any]:
     """Get aggregate statistics on collected feedback.
 
+    Reads the trigger-maintained feedback_counters table, so the cost does
+    not grow with the amount of feedback.
+
     Returns:
         Dictionary with total counts and precision metric.
     """
-    db = await get_db()
-
-    async with db.execute(
-        """
-        SELECT
-            COUNT(*) as total,
-            SUM(CASE WHEN feedback_type = 'true_positive' THEN 1 ELSE 0 END) as tp,
-            SUM(CASE WHEN feedback_type = 'false_positive' THEN 1 ELSE 0 END) as fp
-        FROM shot_feedback
-        """
+    async with get_reader() as db, db.execute(
+        "SELECT feedback_type, n FROM feedback_counters"
     ) as cursor:
-        row = await cursor.fetchone()
+        counts = {feedback_type: n for feedback_type, n in await cursor.fetchall()}
 
-    total = row["total"] or 0
-    tp = row["tp"] or 0
-    fp = row["fp"] or 0
+    total = sum(counts.values())
+    tp = counts.get("true_positive", 0)
+    fp = counts.get("false_positive", 0)
 
     # Precision = TP / (TP + FP), handle division by zero
     precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
@@ -1,11 +1,19 @@
 """CRUD operations for shot trajectory data."""
 
+import math
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
 from loguru import logger
 
-from backend.core.database import get_db, serialize_json, deserialize_json
+from backend.core.database import (
+    get_reader,
+    get_writer,
+    serialize_json,
+    deserialize_json,
+    submit_write,
+)
 
 
 async def create_trajectory(
@@ -44,24 +52,149 @@ async def create_trajectory(
     Returns:
         The trajectory record ID
     """
-    db = await get_db()
-
-    # Normalize coordinates if they aren't already
-    normalized_points = []
-    for pt in trajectory_points:
-        x = pt["x"]
-        y = pt["y"]
-        # If coordinates are in pixel space, normalize them
-        if x > 1 or y > 1:
-            x = x / frame_width
-            y = y / frame_height
-        normalized_points.append({
-            "timestamp": pt["timestamp"],
+    row = _trajectory_row(
+        job_id, shot_id, trajectory_points, confidence,
+        smoothness_score, physics_plausibility, apex_point,
+        launch_angle, flight_duration, has_gaps, gap_count,
+        frame_width, frame_height, datetime.utcnow().isoformat(),
+    )
+    async with get_writer() as db:
+        cursor = await db.execute(_UPSERT_TRAJECTORY_SQL, row)
+        await db.commit()
+
+    logger.debug(f"Stored trajectory for job={job_id} shot={shot_id} with {len(trajectory_points)} points")
+    return cursor.lastrowid
+
+
+async def create_trajectories_bulk(trajectories: list[dict]) -> int:
+    """Store several trajectories in one transaction.
+
+    A trajectory whose data can't be turned into a row is skipped. If the
+    batch insert fails, each row is retried on its own so only the rows the
+    database rejects are lost.
+
+    Args:
+        trajectories: One dict of create_trajectory() keyword arguments per
+                      trajectory.
+
+    Returns:
+        Number of trajectories stored.
+    """
+    if not trajectories:
+        return 0
+
+    now = datetime.utcnow().isoformat()
+    rows = []
+    for t in trajectories:
+        try:
+            rows.append(_trajectory_row(
+                t["job_id"], t["shot_id"], t["trajectory_points"], t["confidence"],
+                t.get("smoothness_score"), t.get("physics_plausibility"), t.get("apex_point"),
+                t.get("launch_angle"), t.get("flight_duration"),
+                t.get("has_gaps", False), t.get("gap_count", 0),
+                t.get("frame_width", 1920), t.get("frame_height", 1080), now,
+            ))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(
+                f"Skipping invalid trajectory for job={t.get('job_id')} shot={t.get('shot_id')}: {e}"
+            )
+
+    stored = len(rows)
+    async with get_writer() as db:
+        try:
+            await db.executemany(_UPSERT_TRAJECTORY_SQL, rows)
+        except Exception as e:
+            # Undo the rows before the failing one, then store row by row
+            await db.rollback()
+            logger.warning(f"Batch trajectory insert failed ({e}), retrying per row")
+            stored = 0
+            for row in rows:
+                try:
+                    await db.execute(_UPSERT_TRAJECTORY_SQL, row)
+                    stored += 1
+                except Exception as row_error:
+                    logger.warning(
+                        f"Failed to store trajectory for job={row[0]} shot={row[1]}: {row_error}"
+                    )
+        await db.commit()
+
+    logger.debug(f"Stored {stored} of {len(trajectories)} trajectories")
+    return stored
+
+
+_UPSERT_TRAJECTORY_SQL = """
+    INSERT INTO shot_trajectories (
+        job_id, shot_id, trajectory_json, confidence,
+        smoothness_score, physics_plausibility,
+        apex_x, apex_y, apex_timestamp,
+        launch_angle, flight_duration,
+        has_gaps, gap_count, is_manual_override,
+        frame_width, frame_height, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(job_id, shot_id) DO UPDATE SET
+        trajectory_json = excluded.trajectory_json,
+        confidence = excluded.confidence,
+        smoothness_score = excluded.smoothness_score,
+        physics_plausibility = excluded.physics_plausibility,
+        apex_x = excluded.apex_x,
+        apex_y = excluded.apex_y,
+        apex_timestamp = excluded.apex_timestamp,
+        launch_angle = excluded.launch_angle,
+        flight_duration = excluded.flight_duration,
+        has_gaps = excluded.has_gaps,
+        gap_count = excluded.gap_count,
+        frame_width = excluded.frame_width,
+        frame_height = excluded.frame_height,
+        updated_at = ?
+"""
+
+
+def _trajectory_row(
+    job_id: str,
+    shot_id: int,
+    trajectory_points: list[dict],
+    confidence: float,
+    smoothness_score: Optional[float],
+    physics_plausibility: Optional[float],
+    apex_point: Optional[dict],
+    launch_angle: Optional[float],
+    flight_duration: Optional[float],
+    has_gaps: bool,
+    gap_count: int,
+    frame_width: int,
+    frame_height: int,
+    now: str,
+) -> tuple:
+    """Build the _UPSERT_TRAJECTORY_SQL parameters, normalizing coordinates.
+
+    Points without a finite timestamp and position are dropped: NaN isn't
+    valid JSON, so SQLite couldn't read the stored trajectory back.
+    """
+    txy = np.array(
+        [(pt["timestamp"], pt["x"], pt["y"]) for pt in trajectory_points], dtype=np.float64
+    ).reshape(-1, 3)
+    finite = np.isfinite(txy).all(axis=1)
+    if not finite.all():
+        logger.debug(f"Dropping {int((~finite).sum())} non-finite trajectory points")
+        trajectory_points = [pt for pt, keep in zip(trajectory_points, finite) if keep]
+        txy = txy[finite]
+
+    # Normalize coordinates if they aren't already: points with either
+    # coordinate above 1 are in pixel space and get divided by the frame size
+    xy = txy[:, 1:]
+    in_pixels = (xy > 1).any(axis=1)
+    xy[in_pixels] /= (frame_width, frame_height)
+
+    normalized_points = [
+        {
+            "timestamp": t,
             "x": x,
             "y": y,
-            "confidence": pt.get("confidence", 0),
+            "confidence": _finite_or_zero(pt.get("confidence", 0)),
             "interpolated": pt.get("interpolated", False),
-        })
+        }
+        for pt, (t, x, y) in zip(trajectory_points, txy.tolist())
+    ]
 
     apex_x = None
     apex_y = None
@@ -75,46 +208,20 @@ async def create_trajectory(
             apex_y = apex_y / frame_height
         apex_timestamp = apex_point.get("timestamp")
 
-    cursor = await db.execute(
-        """
-        INSERT INTO shot_trajectories (
-            job_id, shot_id, trajectory_json, confidence,
-            smoothness_score, physics_plausibility,
-            apex_x, apex_y, apex_timestamp,
-            launch_angle, flight_duration,
-            has_gaps, gap_count, is_manual_override,
-            frame_width, frame_height, created_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(job_id, shot_id) DO UPDATE SET
-            trajectory_json = excluded.trajectory_json,
-            confidence = excluded.confidence,
-            smoothness_score = excluded.smoothness_score,
-            physics_plausibility = excluded.physics_plausibility,
-            apex_x = excluded.apex_x,
-            apex_y = excluded.apex_y,
-            apex_timestamp = excluded.apex_timestamp,
-            launch_angle = excluded.launch_angle,
-            flight_duration = excluded.flight_duration,
-            has_gaps = excluded.has_gaps,
-            gap_count = excluded.gap_count,
-            frame_width = excluded.frame_width,
-            frame_height = excluded.frame_height,
-            updated_at = ?
-        """,
-        (
-            job_id, shot_id, serialize_json(normalized_points), confidence,
-            smoothness_score, physics_plausibility,
-            apex_x, apex_y, apex_timestamp,
-            launch_angle, flight_duration,
-            1 if has_gaps else 0, gap_count, 0,
-            frame_width, frame_height, datetime.utcnow().isoformat(),
-            datetime.utcnow().isoformat(),
-        ),
+    return (
+        job_id, shot_id, serialize_json(normalized_points), confidence,
+        smoothness_score, physics_plausibility,
+        apex_x, apex_y, apex_timestamp,
+        launch_angle, flight_duration,
+        1 if has_gaps else 0, gap_count, 0,
+        frame_width, frame_height, now,
+        now,
     )
-    await db.commit()
 
-    logger.debug(f"Stored trajectory for job={job_id} shot={shot_id} with {len(normalized_points)} points")
-    return cursor.lastrowid
+
+def _finite_or_zero(value: float) -> float:
+    """Replace NaN, infinities and non-numbers with 0."""
+    return value if isinstance(value, (int, float)) and math.isfinite(value) else 0
 
 
 async def get_trajectory(job_id: str, shot_id: int) -> Optional[dict]:
@@ -123,9 +230,7 @@ async def get_trajectory(job_id: str, shot_id: int) -> Optional[dict]:
     Returns:
         Dict with trajectory data or None if not found
     """
-    db = await get_db()
-
-    async with db.execute(
+    async with get_reader() as db, db.execute(
         """
         SELECT * FROM shot_trajectories
         WHERE job_id = ? AND shot_id = ?
@@ -146,9 +251,7 @@ async def get_trajectories_for_job(job_id: str) -> list[dict]:
     Returns:
         List of trajectory dicts ordered by shot_id
     """
-    db = await get_db()
-
-    async with db.execute(
+    async with get_reader() as db, db.execute(
         """
         SELECT * FROM shot_trajectories
         WHERE job_id = ?
@@ -161,6 +264,108 @@ async def get_trajectories_for_job(job_id: str) -> list[dict]:
     return [_row_to_dict(row) for row in rows]
 
 
+# One TrajectoryData object per row, built by SQLite. trajectory_json is
+# embedded as-is through json(), so the points are never parsed in Python.
+_TRAJECTORY_DATA_JSON = """
+    json_object(
+        'shot_id', shot_id,
+        'points', json(IFNULL(trajectory_json, '[]')),
+        'confidence', confidence,
+        'smoothness_score', smoothness_score,
+        'physics_plausibility', physics_plausibility,
+        'apex_point', CASE
+            WHEN apex_x IS NOT NULL AND apex_y IS NOT NULL THEN json_object(
+                'timestamp', IFNULL(apex_timestamp, 0),
+                'x', apex_x,
+                'y', apex_y,
+                'confidence', 1.0,
+                'interpolated', json('false')
+            )
+        END,
+        'launch_angle', launch_angle,
+        'flight_duration', flight_duration,
+        'has_gaps', json(CASE WHEN has_gaps THEN 'true' ELSE 'false' END),
+        'gap_count', gap_count,
+        'is_manual_override', json(CASE WHEN is_manual_override THEN 'true' ELSE 'false' END),
+        'frame_width', frame_width,
+        'frame_height', frame_height
+    )
+"""
+
+
+async def get_trajectories_json(job_id: str) -> str:
+    """Get all trajectories for a job as a JSON array, serialized by SQLite.
+
+    Each element has the shape of api.schemas.TrajectoryData, ordered by
+    shot_id. Meant for responses that pass the JSON straight through.
+
+    Rows stored before non-finite points were dropped on write may hold
+    NaN tokens, which SQLite's JSON functions reject; those rows are built
+    in Python instead, without the non-finite points.
+
+    Returns:
+        JSON array text ('[]' if the job has no trajectories)
+    """
+    async with get_reader() as db, db.execute(
+        f"""
+        SELECT shot_id, CASE WHEN json_valid(IFNULL(trajectory_json, '[]'))
+            THEN {_TRAJECTORY_DATA_JSON} END
+        FROM shot_trajectories
+        WHERE job_id = ?
+        ORDER BY shot_id
+        """,
+        (job_id,),
+    ) as cursor:
+        rows = await cursor.fetchall()
+
+    items = []
+    for shot_id, data in rows:
+        if data is None:
+            trajectory = await get_trajectory(job_id, shot_id)
+            if trajectory is None:
+                continue  # Deleted since the query above
+            data = serialize_json(_trajectory_data(trajectory))
+        items.append(data)
+
+    return f"[{','.join(items)}]"
+
+
+def _trajectory_data(trajectory: dict) -> dict:
+    """Shape a _row_to_dict() trajectory like _TRAJECTORY_DATA_JSON does.
+
+    Points without a finite timestamp and position are dropped.
+    """
+    apex = trajectory["apex_point"]
+    return {
+        "shot_id": trajectory["shot_id"],
+        "points": [
+            {**pt, "confidence": _finite_or_zero(pt.get("confidence", 0))}
+            for pt in trajectory["points"]
+            if all(
+                isinstance(pt.get(key), (int, float)) and math.isfinite(pt[key])
+                for key in ("timestamp", "x", "y")
+            )
+        ],
+        "confidence": trajectory["confidence"],
+        "smoothness_score": trajectory["smoothness_score"],
+        "physics_plausibility": trajectory["physics_plausibility"],
+        "apex_point": None if apex is None else {
+            "timestamp": apex["timestamp"] or 0,
+            "x": apex["x"],
+            "y": apex["y"],
+            "confidence": 1.0,
+            "interpolated": False,
+        },
+        "launch_angle": trajectory["launch_angle"],
+        "flight_duration": trajectory["flight_duration"],
+        "has_gaps": trajectory["has_gaps"],
+        "gap_count": trajectory["gap_count"],
+        "is_manual_override": trajectory["is_manual_override"],
+        "frame_width": trajectory["frame_width"],
+        "frame_height": trajectory["frame_height"],
+    }
+
+
 async def update_trajectory(
     job_id: str,
     shot_id: int,
@@ -178,9 +383,7 @@ async def update_trajectory(
     Returns:
         True if updated, False if trajectory not found
     """
-    db = await get_db()
-
-    cursor = await db.execute(
+    rowcount = await submit_write(
         """
         UPDATE shot_trajectories
         SET trajectory_json = ?,
@@ -196,9 +399,8 @@ async def update_trajectory(
             shot_id,
         ),
     )
-    await db.commit()
 
-    return cursor.rowcount > 0
+    return rowcount > 0
 
 
 async def delete_trajectory(job_id: str, shot_id: int) -> bool:
@@ -207,13 +409,12 @@ async def delete_trajectory(job_id: str, shot_id: int) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    db = await get_db()
-
-    cursor = await db.execute(
-        "DELETE FROM shot_trajectories WHERE job_id = ? AND shot_id = ?",
-        (job_id, shot_id),
-    )
-    await db.commit()
+    async with get_writer() as db:
+        cursor = await db.execute(
+            "DELETE FROM shot_trajectories WHERE job_id = ? AND shot_id = ?",
+            (job_id, shot_id),
+        )
+        await db.commit()
 
     return cursor.rowcount > 0
 
@@ -284,33 +485,32 @@ async def create_tracer_feedback(
     Returns:
         Dict with the created feedback record
     """
-    db = await get_db()
-
     created_at = datetime.utcnow().isoformat()
 
-    cursor = await db.execute(
-        """
-        INSERT INTO tracer_feedback (
-            job_id, shot_id, feedback_type,
-            auto_params_json, final_params_json,
-            origin_point_json, landing_point_json, apex_point_json,
-            created_at, environment
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            job_id,
-            shot_id,
-            feedback_type,
-            serialize_json(auto_params),
-            serialize_json(final_params),
-            serialize_json(origin_point),
-            serialize_json(landing_point),
-            serialize_json(apex_point),
-            created_at,
-            environment,
-        ),
-    )
-    await db.commit()
+    async with get_writer() as db:
+        cursor = await db.execute(
+            """
+            INSERT INTO tracer_feedback (
+                job_id, shot_id, feedback_type,
+                auto_params_json, final_params_json,
+                origin_point_json, landing_point_json, apex_point_json,
+                created_at, environment
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                job_id,
+                shot_id,
+                feedback_type,
+                serialize_json(auto_params),
+                serialize_json(final_params),
+                serialize_json(origin_point),
+                serialize_json(landing_point),
+                serialize_json(apex_point),
+                created_at,
+                environment,
+            ),
+        )
+        await db.commit()
 
     feedback_id = cursor.lastrowid
     logger.debug(f"Created tracer feedback {feedback_id} for job={job_id} shot={shot_id} type={feedback_type}")
@@ -339,9 +539,7 @@ async def get_tracer_feedback(feedback_id: int) -> Optional[dict]:
     Returns:
         Dict with feedback data or None if not found
     """
-    db = await get_db()
-
-    async with db.execute(
+    async with get_reader() as db, db.execute(
         "SELECT * FROM tracer_feedback WHERE id = ?",
         (feedback_id,),
     ) as cursor:
@@ -362,9 +560,7 @@ async def get_tracer_feedback_for_job(job_id: str) -> list[dict]:
     Returns:
         List of feedback dicts ordered by shot_id
     """
-    db = await get_db()
-
-    async with db.execute(
+    async with get_reader() as db, db.execute(
         """
         SELECT * FROM tracer_feedback
         WHERE job_id = ?
@@ -388,8 +584,6 @@ async def export_tracer_feedback(environment: Optional[str] = None) -> dict:
         - feedback: List of feedback records with computed deltas
         - stats: Aggregate statistics
     """
-    db = await get_db()
-
     # Build query with optional environment filter
     query = "SELECT * FROM tracer_feedback"
     params = []
@@ -398,7 +592,7 @@ async def export_tracer_feedback(environment: Optional[str] = None) -> dict:
         params.append(environment)
     query += " ORDER BY created_at"
 
-    async with db.execute(query, params) as cursor:
+    async with get_reader() as db, db.execute(query, params) as cursor:
         rows = await cursor.fetchall()
 
     feedback_list = []
@@ -513,8 +707,6 @@ async def create_origin_feedback(
     Returns:
         Dict with the created feedback record
     """
-    db = await get_db()
-
     # Compute error if auto-detection was available
     error_dx = None
     error_dy = None
@@ -526,29 +718,30 @@ async def create_origin_feedback(
 
     created_at = datetime.utcnow().isoformat()
 
-    cursor = await db.execute(
-        """
-        INSERT INTO origin_feedback (
-            job_id, shot_id, video_path, strike_time,
-            frame_width, frame_height,
-            auto_origin_x, auto_origin_y, auto_confidence, auto_method,
-            shaft_score, clubhead_detected,
-            manual_origin_x, manual_origin_y,
-            error_dx, error_dy, error_distance,
-            created_at, environment
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            job_id, shot_id, video_path, strike_time,
-            frame_width, frame_height,
-            auto_origin_x, auto_origin_y, auto_confidence, auto_method,
-            shaft_score, 1 if clubhead_detected else (0 if clubhead_detected is False else None),
-            manual_origin_x, manual_origin_y,
-            error_dx, error_dy, error_distance,
-            created_at, environment,
-        ),
-    )
-    await db.commit()
+    async with get_writer() as db:
+        cursor = await db.execute(
+            """
+            INSERT INTO origin_feedback (
+                job_id, shot_id, video_path, strike_time,
+                frame_width, frame_height,
+                auto_origin_x, auto_origin_y, auto_confidence, auto_method,
+                shaft_score, clubhead_detected,
+                manual_origin_x, manual_origin_y,
+                error_dx, error_dy, error_distance,
+                created_at, environment
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                job_id, shot_id, video_path, strike_time,
+                frame_width, frame_height,
+                auto_origin_x, auto_origin_y, auto_confidence, auto_method,
+                shaft_score, 1 if clubhead_detected else (0 if clubhead_detected is False else None),
+                manual_origin_x, manual_origin_y,
+                error_dx, error_dy, error_distance,
+                created_at, environment,
+            ),
+        )
+        await db.commit()
 
     feedback_id = cursor.lastrowid
     logger.info(
@@ -601,8 +794,6 @@ async def export_origin_feedback(environment: Optional[str] = None) -> dict:
         - records: List of feedback records
         - stats: Aggregate statistics
     """
-    db = await get_db()
-
     # Build query with optional environment filter
     query = "SELECT * FROM origin_feedback"
     params = []
@@ -611,7 +802,7 @@ async def export_origin_feedback(environment: Optional[str] = None) -> dict:
         params.append(environment)
     query += " ORDER BY created_at"
 
-    async with db.execute(query, params) as cursor:
+    async with get_reader() as db, db.execute(query, params) as cursor:
         rows = await cursor.fetchall()
 
     records_list = []
@@ -663,10 +854,10 @@ async def get_origin_feedback_stats() -> dict:
     Returns:
         Dict with statistics including correction rate, mean error, etc.
     """
-    db = await get_db()
-
     # Total feedback count
-    async with db.execute("SELECT COUNT(*) as count FROM origin_feedback") as cursor:
+    async with get_reader() as db, db.execute(
+        "SELECT COUNT(*) as count FROM origin_feedback"
+    ) as cursor:
         row = await cursor.fetchone()
         total = row["count"]
 
@@ -679,14 +870,14 @@ async def get_origin_feedback_stats() -> dict:
         }
 
     # Mean error distance
-    async with db.execute(
+    async with get_reader() as db, db.execute(
         "SELECT AVG(error_distance) as mean_error FROM origin_feedback WHERE error_distance IS NOT NULL"
     ) as cursor:
         row = await cursor.fetchone()
         mean_error = row["mean_error"]
 
     # Stats by detection method
-    async with db.execute(
+    async with get_reader() as db, db.execute(
         """
         SELECT auto_method,
                COUNT(*) as count,
@@ -70,6 +70,28 @@ async def test_create_and_get_job():
         assert retrieved["video_info"]["duration"] == 120
 
 
+@pytest.mark.asyncio
+async def test_job_json_fields_are_not_shared():
+    """Mutating a returned job's JSON field doesn't affect later reads."""
+    with patch("backend.core.database.DB_PATH", TEST_DB_PATH):
+        from backend.models.job import create_job, get_job
+
+        job_id = "test-json-copy"
+        await create_job(
+            job_id=job_id,
+            video_path="/video.mp4",
+            output_dir="/output",
+            auto_approve=True,
+            video_info={"duration": 120},
+        )
+
+        first = await get_job(job_id)
+        first["video_info"]["duration"] = 0
+
+        second = await get_job(job_id)
+        assert second["video_info"]["duration"] == 120
+
+
 @pytest.mark.asyncio
 async def test_update_job():
     """Test updating a job."""
@@ -121,6 +143,98 @@ async def test_update_job_invalid_column():
             await update_job(job_id, malicious_column="DROP TABLE jobs")
 
 
+@pytest.mark.asyncio
+async def test_update_during_progress_flush_is_written_last():
+    """A terminal update made while buffered progress is flushing wins."""
+    with patch("backend.core.database.DB_PATH", TEST_DB_PATH):
+        from backend.models.job import create_job, flush_job_progress, get_job, update_job
+
+        job_id = "test-progress-order"
+        await create_job(job_id, "/video.mp4", "/output", True, None)
+
+        assert await update_job(job_id, progress=50.0, current_step="Tracking") is True
+        flush = asyncio.create_task(flush_job_progress())
+        await asyncio.sleep(0)  # Let the flush queue its write
+
+        await update_job(job_id, status="complete", progress=100.0, current_step="Done")
+        await flush
+
+        job = await get_job(job_id)
+        assert job["status"] == "complete"
+        assert job["progress"] == 100.0
+        assert job["current_step"] == "Done"
+
+
+@pytest.mark.asyncio
+async def test_failed_progress_flush_is_requeued():
+    """Buffered progress survives a failed write and is written on retry."""
+    import sqlite3
+
+    with patch("backend.core.database.DB_PATH", TEST_DB_PATH):
+        from backend.models.job import create_job, flush_job_progress, get_job, update_job
+
+        job_id = "test-progress-retry"
+        await create_job(job_id, "/video.mp4", "/output", True, None)
+        await update_job(job_id, progress=40.0, current_step="Tracking")
+
+        def failing_write(sql, params=()):
+            future = asyncio.get_running_loop().create_future()
+            future.set_exception(sqlite3.OperationalError("database is locked"))
+            return future
+
+        with patch("backend.models.job.queue_write", failing_write):
+            with pytest.raises(sqlite3.OperationalError):
+                await flush_job_progress()
+
+        await flush_job_progress()
+        job = await get_job(job_id)
+        assert job["progress"] == 40.0
+        assert job["current_step"] == "Tracking"
+
+
+@pytest.mark.asyncio
+async def test_progress_update_for_missing_job():
+    """A progress-only update reports a job that doesn't exist."""
+    with patch("backend.core.database.DB_PATH", TEST_DB_PATH):
+        from backend.models.job import flush_job_progress, update_job
+
+        assert await update_job("no-such-job", progress=10.0) is False
+        await flush_job_progress()
+
+
+@pytest.mark.asyncio
+async def test_failed_transaction_does_not_roll_back_other_writes():
+    """A rollback on the writer connection only undoes its own transaction."""
+    with patch("backend.core.database.DB_PATH", TEST_DB_PATH):
+        from backend.models.job import (
+            create_feedback_bulk,
+            create_job,
+            get_feedback_for_job,
+            get_job,
+            update_job,
+        )
+
+        job_id = "test-serialized-writes"
+        await create_job(job_id, "/video.mp4", "/output", True, None)
+
+        # The second item is missing feedback_type, so the bulk insert fails
+        # after its first row and rolls back
+        bad_batch = create_feedback_bulk([
+            {"job_id": job_id, "shot_id": 1, "feedback_type": "true_positive"},
+            {"job_id": job_id, "shot_id": 2},
+        ])
+        results = await asyncio.gather(
+            bad_batch,
+            update_job(job_id, status="processing"),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], KeyError)
+        assert results[1] is True
+        assert (await get_job(job_id))["status"] == "processing"
+        assert await get_feedback_for_job(job_id) == []
+
+
 @pytest.mark.asyncio
 async def test_create_and_get_shots():
     """Test creating and retrieving shots."""
@@ -255,6 +369,33 @@ async def test_delete_job_cascades_shots():
         assert len(shots) == 0
 
 
+@pytest.mark.asyncio
+async def test_bulk_trajectories_skip_bad_rows():
+    """One bad trajectory doesn't keep the others from being stored."""
+    with patch("backend.core.database.DB_PATH", TEST_DB_PATH):
+        from backend.models.job import create_job
+        from backend.models.trajectory import create_trajectories_bulk, get_trajectories_for_job
+
+        job_id = "test-bulk-trajectories"
+        await create_job(job_id, "/video.mp4", "/output", True, None)
+
+        point = {"timestamp": 1.0, "x": 0.5, "y": 0.4, "confidence": 0.9}
+        stored = await create_trajectories_bulk([
+            {"job_id": job_id, "shot_id": 1, "trajectory_points": [point], "confidence": 0.8},
+            # Point without coordinates: can't be normalized
+            {"job_id": job_id, "shot_id": 2, "trajectory_points": [{"timestamp": 1.0}],
+             "confidence": 0.8},
+            # Unknown job: rejected by the foreign key
+            {"job_id": "no-such-job", "shot_id": 1, "trajectory_points": [point],
+             "confidence": 0.8},
+            {"job_id": job_id, "shot_id": 3, "trajectory_points": [point], "confidence": 0.7},
+        ])
+
+        assert stored == 2
+        trajectories = await get_trajectories_for_job(job_id)
+        assert [t["shot_id"] for t in trajectories] == [1, 3]
+
+
 @pytest.mark.asyncio
 async def test_get_all_jobs():
     """Test listing all jobs."""
@@ -355,7 +496,7 @@ async def test_database_stats():
         # Get stats
         stats = await get_database_stats()
 
-        assert stats["schema_version"] == 7
+        assert stats["schema_version"] == 11
         assert stats["total_jobs"] == 2
         assert stats["total_shots"] == 1
         assert "complete" in stats["jobs_by_status"]
@@ -370,7 +511,63 @@ async def test_schema_version():
 
         version = await get_schema_version()
         assert version == SCHEMA_VERSION
-        assert version == 7
+        assert version == 11
+
+
+
+def test_json_round_trip_with_nan():
+    """Stored JSON round-trips, including non-string keys and NaN values."""
+    import math
+
+    from backend.core.database import deserialize_json, serialize_json
+
+    data = {1: [0.5, 1.5], "x": float("nan")}
+    loaded = deserialize_json(serialize_json(data))
+    assert loaded["1"] == [0.5, 1.5]
+    # Non-finite values are stored as null whichever codec is installed
+    assert loaded["x"] is None
+
+    # Rows stored by older versions may hold bare NaN tokens
+    legacy = deserialize_json('{"x": NaN, "y": [Infinity]}')
+    assert math.isnan(legacy["x"])
+    assert legacy["y"] == [float("inf")]
+
+
+def test_json_codecs_store_non_finite_values_alike():
+    """The stdlib and orjson codecs write NaN/Infinity the same way."""
+    import math
+
+    orjson = pytest.importorskip("orjson")
+
+    from backend.core.database import _json_dumps, _orjson_dumps
+
+    payload = {
+        "points": [{"x": float("nan"), "y": 1.5}, {"x": float("inf"), "y": -float("inf")}],
+        "apex": (2.0, float("nan")),
+        "ok": [1, 2.5, None, True],
+    }
+
+    stdlib_text = _json_dumps(payload)
+    assert stdlib_text == _orjson_dumps(payload)
+    assert orjson.loads(stdlib_text)["points"][1] == {"x": None, "y": None}
+    # The caller's data is left as it was
+    assert math.isnan(payload["points"][0]["x"])
+
+
+def test_json_codecs_write_the_same_text():
+    """Stored JSON doesn't depend on whether orjson is installed."""
+    pytest.importorskip("orjson")
+    np = pytest.importorskip("numpy")
+
+    from backend.core.database import _json_dumps, _orjson_dumps
+
+    payload = {
+        1: "Drive – 250 yd ⛳",
+        "trajectory": [{"x": 0.25, "y": float("-inf"), "interpolated": False}],
+        "numpy": {"x": np.float32(0.5), "n": np.int64(3), "row": np.array([1.5, np.nan])},
+    }
+
+    assert _json_dumps(payload) == _orjson_dumps(payload)
 
 
 if __name__ == "__main__":
@@ -397,6 +397,39 @@ class TestFeedbackExport:
         for record in data["records"]:
             assert record["feedback_type"] == "false_positive"
 
+    def test_export_pages_with_cursor(self, client: TestClient):
+        """Following next_before_* should page through every record exactly once."""
+        job_id = "test-export-pages"
+        job = _create_job_in_db(job_id)
+        jobs[job_id] = job
+
+        client.post(
+            f"/api/feedback/{job_id}",
+            json={
+                "feedback": [
+                    {"shot_id": 1, "feedback_type": "true_positive", "notes": None},
+                    {"shot_id": 2, "feedback_type": "false_positive", "notes": None},
+                ]
+            },
+        )
+
+        all_ids = [r["id"] for r in client.get("/api/feedback/export").json()["records"]]
+
+        paged_ids = []
+        params = {"limit": 2}
+        while True:
+            data = client.get("/api/feedback/export", params=params).json()
+            paged_ids.extend(r["id"] for r in data["records"])
+            if data["next_before_id"] is None:
+                break
+            params = {
+                "limit": 2,
+                "before_created_at": data["next_before_created_at"],
+                "before_id": data["next_before_id"],
+            }
+
+        assert paged_ids == all_ids
+
     def test_export_invalid_type_filter(self, client: TestClient):
         """Exporting with invalid type filter should return 400."""
         response = client.get("/api/feedback/export?feedback_type=invalid")
@@ -53,6 +53,13 @@ class TestHealthCheck:
         assert "total_jobs" in data
         assert "model_ready" in data
 
+    def test_healthz_returns_ok(self, client: TestClient):
+        """Liveness probe should answer without any status details."""
+        response = client.get("/healthz")
+
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
+
 
 class TestModelStatusEndpoint:
     """Test the /api/model-status endpoint."""
@@ -355,6 +362,71 @@ class TestJobsEndpoint:
         assert job_id not in jobs
 
 
+class TestTrajectoriesEndpoint:
+    """Test the GET /api/trajectories/{job_id} endpoint."""
+
+    def test_trajectories_match_pydantic_serialization(self, client: TestClient):
+        """The SQLite-built response equals the TrajectoryData serialization."""
+        import json
+        import math
+
+        from backend.api.schemas import TrajectoryData
+        from backend.core.database import get_db
+        from backend.models.job import create_job
+        from backend.models.trajectory import create_trajectories_bulk, get_trajectories_for_job
+
+        job_id = "test-trajectories-json"
+        points = [
+            {"timestamp": 1.0, "x": 0.2, "y": 0.8, "confidence": 0.9, "interpolated": False},
+            {"timestamp": 1.1, "x": 0.3, "y": 0.6, "confidence": 0.45, "interpolated": True},
+        ]
+
+        async def setup():
+            await create_job(job_id, "/video.mp4", "/output", True, None)
+            await create_trajectories_bulk([
+                {"job_id": job_id, "shot_id": 1, "trajectory_points": points,
+                 "confidence": 0.8, "apex_point": {"timestamp": 1.1, "x": 0.3, "y": 0.6},
+                 "has_gaps": True, "gap_count": 1},
+                {"job_id": job_id, "shot_id": 2, "trajectory_points": points,
+                 "confidence": 0.6, "launch_angle": 12.5},
+            ])
+            # A row stored with a NaN point, which SQLite's json() rejects
+            db = await get_db()
+            nan_point = {"timestamp": 1.2, "x": float("nan"), "y": 0.5}
+            await db.execute(
+                "UPDATE shot_trajectories SET trajectory_json = ? WHERE job_id = ? AND shot_id = 2",
+                (json.dumps(points + [nan_point]), job_id),
+            )
+            await db.commit()
+            return await get_trajectories_for_job(job_id)
+
+        loop = asyncio.new_event_loop()
+        try:
+            stored = loop.run_until_complete(setup())
+        finally:
+            loop.close()
+
+        expected = []
+        for t in stored:
+            apex = t["apex_point"]
+            expected.append(TrajectoryData(
+                shot_id=t["shot_id"],
+                points=[p for p in t["points"] if math.isfinite(p["x"])],
+                apex_point=apex and {**apex, "timestamp": apex["timestamp"] or 0, "confidence": 1.0},
+                **{key: t[key] for key in (
+                    "confidence", "smoothness_score", "physics_plausibility",
+                    "launch_angle", "flight_duration", "has_gaps", "gap_count",
+                    "is_manual_override", "frame_width", "frame_height",
+                )},
+            ).model_dump(mode="json"))
+
+        response = client.get(f"/api/trajectories/{job_id}")
+
+        assert response.status_code == 200
+        assert response.json() == {"job_id": job_id, "trajectories": expected}
+        assert len(expected[1]["points"]) == 2
+
+
 class TestVideoInfoEndpoint:
     """Test the /api/video-info endpoint."""
 
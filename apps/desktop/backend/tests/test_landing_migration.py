@@ -27,7 +27,7 @@ def test_migration_adds_landing_columns():
 
                 # Check schema version (v6 includes tracer feedback table)
                 version = loop.run_until_complete(db_module.get_schema_version())
-                assert version == 7, f"Expected schema v7, got v{version}"
+                assert version == 11, f"Expected schema v11, got v{version}"
 
                 # Verify columns exist by inserting a shot with landing coords
                 async def verify_columns():
@@ -2,6 +2,7 @@
 
 import importlib
 import json
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
@@ -59,3 +60,51 @@ class TestMLConfig:
             # Check backup exists
             backups = list(tmp_path.glob("ml_config.backup.*.json"))
             assert len(backups) >= 1
+
+    def test_failed_save_keeps_config_and_cleans_up(self, tmp_path):
+        """A save that fails mid-write leaves the old config and no temp file."""
+        config_path = tmp_path / "ml_config.json"
+
+        import backend.ml.config
+        importlib.reload(backend.ml.config)
+
+        with patch.object(backend.ml.config, "ML_CONFIG_PATH", config_path):
+            config = backend.ml.config.load_ml_config()
+            backend.ml.config.save_ml_config(config)
+
+            config["confidence_threshold"] = 0.90
+            with patch.object(backend.ml.config.json, "dump", side_effect=OSError("disk full")):
+                with pytest.raises(OSError):
+                    backend.ml.config.save_ml_config(config)
+
+            assert list(tmp_path.glob("*.tmp")) == []
+            assert backend.ml.config.load_ml_config()["confidence_threshold"] == 0.70
+
+    def test_concurrent_saves_publish_whole_configs(self, tmp_path):
+        """Concurrent saves never publish a torn or mixed config."""
+        config_path = tmp_path / "ml_config.json"
+
+        import backend.ml.config
+        importlib.reload(backend.ml.config)
+
+        with patch.object(backend.ml.config, "ML_CONFIG_PATH", config_path):
+            thresholds = [0.5 + i / 100 for i in range(8)]
+
+            def save(threshold: float) -> None:
+                config = backend.ml.config.load_ml_config()
+                config["confidence_threshold"] = threshold
+                config["update_history"] = [{"threshold": threshold}] * 200
+                backend.ml.config.save_ml_config(config)
+
+            threads = [threading.Thread(target=save, args=(t,)) for t in thresholds]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            saved = json.loads(config_path.read_text())
+            assert saved["confidence_threshold"] in thresholds
+            assert {h["threshold"] for h in saved["update_history"]} == {
+                saved["confidence_threshold"]
+            }
+            assert list(tmp_path.glob("*.tmp")) == []
@@ -3,7 +3,15 @@
 import numpy as np
 import pytest
 
-from backend.ml.stages import analyze_calibration, analyze_threshold, analyze_weights
+from backend.core.database import DETECTION_FEATURE_KEYS, pack_detection_features
+from backend.ml.columns import FeedbackColumns
+from backend.ml.stages import (
+    FEATURE_KEY_MAP,
+    analyze_calibration,
+    analyze_feature_matrix,
+    analyze_threshold,
+    analyze_weights,
+)
 
 
 class TestThresholdTuning:
@@ -71,6 +79,22 @@ class TestThresholdTuning:
         assert result["recommended_threshold"] >= 0.75  # At or above highest FP score
 
 
+    def test_columns_match_records(self):
+        """Column view should give the same result as feedback dicts."""
+        feedback = [
+            {"feedback_type": "true_positive", "confidence_snapshot": 0.85, "created_at": "2024-01-01T00:00:00"},
+            {"feedback_type": "true_positive", "confidence_snapshot": None, "created_at": "2024-01-01T00:00:00"},
+            {"feedback_type": "true_positive", "confidence_snapshot": 0.74, "created_at": "2024-01-01T00:00:00"},
+            {"feedback_type": "false_positive", "confidence_snapshot": 0.71, "created_at": "2024-01-01T00:00:00"},
+            {"feedback_type": "false_positive", "confidence_snapshot": 0.62, "created_at": "2024-01-01T00:00:00"},
+        ]
+
+        from_records = analyze_threshold(feedback, current_threshold=0.60)
+        from_columns = analyze_threshold(FeedbackColumns.from_records(feedback), current_threshold=0.60)
+
+        assert from_columns == from_records
+
+
 class TestWeightOptimization:
     """Tests for Stage 2: Feature weight optimization."""
 
@@ -113,6 +137,30 @@ class TestWeightOptimization:
         weights = result["learned_weights"]
         assert weights["decay"] > weights["flatness"]  # decay is more important
 
+    def test_packed_features_match_records(self):
+        """Packed feature vectors should train the same weights as the dicts."""
+        assert DETECTION_FEATURE_KEYS == tuple(FEATURE_KEY_MAP)
+
+        rng = np.random.default_rng(0)
+        feedback = [
+            {
+                "feedback_type": "true_positive" if i % 3 else "false_positive",
+                "detection_features": {
+                    "peak_height": float(rng.random()),
+                    "decay_ratio": (0.8 if i % 3 else 0.3) + float(rng.normal(0, 0.05)),
+                    "frequency_centroid": 3500 + float(rng.normal(0, 200)),
+                },
+            }
+            for i in range(60)
+        ]
+        blobs = [pack_detection_features(f["detection_features"]) for f in feedback]
+        X = np.frombuffer(b"".join(blobs), dtype="<f8").reshape(len(feedback), -1)
+        y = np.array([f["feedback_type"] == "true_positive" for f in feedback], dtype=np.int8)
+
+        assert analyze_feature_matrix(X, y) == analyze_weights(feedback)
+        assert pack_detection_features({}) is None
+        assert pack_detection_features(["not", "a", "dict"]) is None
+
     def test_handles_insufficient_samples(self):
         """Should return None weights with insufficient samples."""
         feedback = [
@@ -0,0 +1,774 @@
+"""Tests for BallDetector frame sampling, inference batching and trajectory kernels."""
+
+import queue
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+import torch
+
+from backend.detection.visual import (
+    BallDetection,
+    BallDetector,
+    TrajectoryPoint,
+    _SampleGap,
+    _acceleration_variance,
+    _acceleration_variance_numpy,
+)
+
+
+class FakeCapture:
+    """Minimal cv2.VideoCapture stand-in playing back in-memory frames."""
+
+    def __init__(self, frames: list[np.ndarray], fps: float = 30.0):
+        self.frames = frames
+        self.fps = fps
+        self.pos = 0
+
+    def isOpened(self) -> bool:
+        return True
+
+    def get(self, prop: int) -> float:
+        return self.fps if prop == cv2.CAP_PROP_FPS else self.pos
+
+    def set(self, prop: int, value: float) -> None:
+        self.pos = int(value)
+
+    def grab(self) -> bool:
+        if self.pos >= len(self.frames):
+            return False
+        self.pos += 1
+        return True
+
+    def retrieve(self, image=None) -> tuple[bool, np.ndarray]:
+        return True, self.frames[self.pos - 1].copy()
+
+    def release(self) -> None:
+        pass
+
+
+def _grass_frame() -> np.ndarray:
+    """A uniform 1080p frame."""
+    return np.full((1080, 1920, 3), (40, 120, 40), dtype=np.uint8)
+
+
+def _frame_with_ball(center: tuple[int, int]) -> np.ndarray:
+    """A 1080p frame with a white ball of the smallest accepted size."""
+    frame = _grass_frame()
+    radius = int(np.ceil(BallDetector.MIN_BALL_SIZE_RATIO * 1920 / 2))
+    cv2.circle(frame, center, radius, (255, 255, 255), -1)
+    return frame
+
+
+class StubPredictor:
+    """Stands in for the Ultralytics predictor, recording each input batch."""
+
+    def __init__(self):
+        self.model = SimpleNamespace(fp16=False)
+        self.args = SimpleNamespace(iou=0.7, max_det=300)
+        self.batch_shapes: list[tuple[int, ...]] = []
+        self.running = 0
+        self.max_running = 0
+
+    def inference(self, batch: torch.Tensor) -> torch.Tensor:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        time.sleep(0.01)  # Leave time for another thread to overlap
+        self.batch_shapes.append(tuple(batch.shape))
+        self.running -= 1
+        return batch
+
+
+def _stub_nms(preds, conf, iou, classes=None, max_det=300):
+    """One 24px ball box per frame, centered at (960, 540) of a 1080p frame."""
+    return [torch.tensor([[316.0, 316.0, 324.0, 324.0, 0.9, 32.0]]) for _ in range(len(preds))]
+
+
+@pytest.fixture
+def detector() -> BallDetector:
+    return BallDetector(batch_size=4)
+
+
+@pytest.fixture
+def stub_predictor(detector: BallDetector):
+    """Load a StubPredictor into the detector in place of YOLO."""
+    predictor = StubPredictor()
+    detector.model = object()
+    detector._predictor = predictor
+    detector.device = "cpu"
+    with patch("backend.detection.visual.non_max_suppression", _stub_nms):
+        yield predictor
+
+
+def _frame_with_noise(n_pixels: int) -> np.ndarray:
+    """A 1080p frame where n_pixels separate gate-thumbnail pixels changed."""
+    frame = _grass_frame()
+    scale = 1920 // BallDetector.MOTION_GATE_SIZE[0]
+    for i in range(n_pixels):
+        # 3x3 blocks aligned to the thumbnail grid, well apart
+        y, x = scale * (10 + 20 * (i // 20)), scale * (10 + 20 * (i % 20))
+        frame[y : y + scale, x : x + scale] = 255
+    return frame
+
+
+class TestMotionGate:
+    """Sampled frames with no motion skip inference and repeat the last result."""
+
+    def _read(self, detector: BallDetector, frames: list[np.ndarray]) -> list[tuple]:
+        emitted = []
+        detector._read_sampled_frames(
+            FakeCapture(frames),
+            0,
+            len(frames),
+            list(range(len(frames))),
+            lambda *item: emitted.append(item),
+            threading.Event(),
+        )
+        return emitted
+
+    def test_static_frames_are_gated(self, detector: BallDetector):
+        emitted = self._read(detector, [_grass_frame() for _ in range(3)])
+
+        assert [frame_index for _, frame_index, _ in emitted] == [0, 1, 2]
+        assert emitted[0][2] is not None
+        assert emitted[1][2] is None
+        assert emitted[2][2] is None
+
+    def test_smallest_ball_passes_gate(self, detector: BallDetector):
+        emitted = self._read(
+            detector, [_grass_frame(), _frame_with_ball((960, 400)), _frame_with_ball((990, 380))]
+        )
+
+        assert all(frame is not None for _, _, frame in emitted)
+
+    def test_noise_below_ball_area_is_gated(self, detector: BallDetector):
+        # The threshold is the thumbnail area of the smallest accepted ball
+        ball_diameter = BallDetector.MIN_BALL_SIZE_RATIO * BallDetector.MOTION_GATE_SIZE[0]
+        assert BallDetector.MOTION_MIN_PIXELS == int(np.pi / 4 * ball_diameter**2) > 1
+
+        emitted = self._read(
+            detector,
+            [
+                _grass_frame(),
+                _frame_with_noise(BallDetector.MOTION_MIN_PIXELS - 1),
+                _frame_with_noise(BallDetector.MOTION_MIN_PIXELS),
+            ],
+        )
+
+        assert emitted[1][2] is None
+        assert emitted[2][2] is not None
+
+    def test_gated_frames_keep_last_detection(self, detector: BallDetector):
+        frames = [_frame_with_ball((960, 400)) for _ in range(4)]
+        hit = BallDetection(
+            bbox=(955.0, 395.0, 965.0, 405.0),
+            confidence=0.9,
+            center=(960.0, 400.0),
+            size=(10.0, 10.0),
+        )
+
+        def fake_detect_batch(batch, last_hits):
+            return {(key, frame_index): hit for key, frame_index, _ in batch}
+
+        detector.model = object()  # Skip loading YOLO
+        with patch.object(detector, "_get_capture", return_value=FakeCapture(frames)), \
+                patch.object(detector, "_detect_batch", side_effect=fake_detect_batch):
+            detections = detector.detect_ball_in_video_segment(
+                Path("video.mp4"), 0.0, len(frames) / 30.0, sample_fps=30.0
+            )
+
+        assert [d["frame"] for d in detections] == [0, 1, 2, 3]
+        # Nothing moved after the first frame: the ball is still present
+        # (as at address), marked static so it is not a trajectory point
+        assert all(d["detection"] is hit for d in detections)
+        assert [d["static"] for d in detections] == [False, True, True, True]
+
+        summary = detector._summarize_detections(detections)
+        assert summary.valid == detections[:1]
+        assert summary.miss_timestamps == []
+        assert summary.detection_ratio == 1.0
+
+
+class TestAdaptiveSampling:
+    """A tracked ball is sampled about every ADAPTIVE_TARGET_PIXELS of travel."""
+
+    def test_gap_follows_ball_speed(self, detector: BallDetector):
+        last_hit = (10, (500.0, 500.0))
+
+        assert detector._adaptive_gap(None, 12, (520.0, 500.0), 30.0) == 1
+        # 5 px/frame: 4 frames per 20px
+        assert detector._adaptive_gap(last_hit, 12, (510.0, 500.0), 30.0) == 4
+        # Faster than 20 px/frame: every frame
+        assert detector._adaptive_gap(last_hit, 11, (540.0, 500.0), 30.0) == 1
+        # At rest: capped at ADAPTIVE_MIN_FPS
+        assert detector._adaptive_gap(last_hit, 12, (500.0, 500.0), 30.0) == 15
+
+    def test_reader_skips_samples_within_gap(self, detector: BallDetector):
+        frames = [_frame_with_ball((100 + 40 * i, 400)) for i in range(12)]
+        sample_gap = _SampleGap()
+        sample_gap.set(3)
+        emitted = []
+
+        detector._read_sampled_frames(
+            FakeCapture(frames),
+            0,
+            len(frames),
+            list(range(len(frames))),
+            lambda *item: emitted.append(item),
+            threading.Event(),
+            sample_gap,
+        )
+
+        assert [frame_index for _, frame_index, _ in emitted] == [0, 3, 6, 9]
+
+    def test_inference_updates_segment_gap(self, detector: BallDetector):
+        sample_gaps = {0: _SampleGap(), 1: _SampleGap()}
+        centers = {0: (500.0, 500.0), 2: (510.0, 500.0)}
+
+        def fake_detect_batch(batch, last_hits):
+            return {
+                (key, frame_index): None if key else BallDetection(
+                    bbox=(0.0, 0.0, 10.0, 10.0),
+                    confidence=0.9,
+                    center=centers[frame_index],
+                    size=(10.0, 10.0),
+                )
+                for key, frame_index, _ in batch
+            }
+
+        frame_queue: queue.Queue = queue.Queue()
+        for item in [(0, 0, 0, _grass_frame()), (1, 0, 0, _grass_frame()),
+                     (0, 2, 2, _grass_frame()), None, None]:
+            frame_queue.put(item)
+
+        with patch.object(detector, "_detect_batch", side_effect=fake_detect_batch):
+            detector._detect_queued_frames(frame_queue, 2, 30.0, sample_gaps=sample_gaps)
+
+        # Segment 0's ball moved 5 px/frame; segment 1 never found one
+        assert sample_gaps[0].get() == 4
+        assert sample_gaps[1].get() == 1
+
+
+class TestDetectBallInSegments:
+    """Several segments decoded together match one segment at a time."""
+
+    def test_matches_per_segment_detection(self, detector: BallDetector):
+        frames = [_frame_with_ball((100 + 40 * i, 400)) for i in range(30)]
+        # Frames 10-12 repeat frame 9, so the motion gate skips them
+        frames[10:13] = [frames[9]] * 3
+        segments = [(0.0, 0.5), (0.25, 0.75), (0.75, 1.0)]
+
+        def fake_detect_batch(batch, last_hits):
+            # A ball at each frame's own position, missed on every 4th frame
+            return {
+                (key, frame_index): None if frame_index % 4 == 0 else BallDetection(
+                    bbox=(0.0, 0.0, 10.0, 10.0),
+                    confidence=0.9,
+                    center=(float(frame_index), 400.0),
+                    size=(10.0, 10.0),
+                )
+                for key, frame_index, _ in batch
+            }
+
+        detector.model = object()  # Skip loading YOLO
+        progress: list[float] = []
+        with patch.object(detector, "_get_capture", side_effect=lambda _: FakeCapture(frames)), \
+                patch.object(detector, "_open_capture", side_effect=lambda _: FakeCapture(frames)), \
+                patch.object(detector, "_detect_batch", side_effect=fake_detect_batch):
+            together = detector.detect_ball_in_segments(
+                Path("video.mp4"), segments, sample_fps=30.0, progress_callback=progress.append
+            )
+            one_by_one = [
+                detector.detect_ball_in_video_segment(Path("video.mp4"), start, end, 30.0)
+                for start, end in segments
+            ]
+
+        assert together == one_by_one
+        assert [[d["frame"] for d in seg] for seg in together] == [
+            list(range(0, 15)), list(range(7, 22)), list(range(22, 30))
+        ]
+        assert [d["static"] for d in together[0][10:13]] == [True, True, True]
+        assert progress[-1] == pytest.approx(100.0)
+
+
+class TestLetterbox:
+    """Model input keeps the frame's aspect ratio; boxes map back exactly."""
+
+    def test_resize_pads_to_square(self, detector: BallDetector):
+        frame = _grass_frame()
+        dst = np.zeros((640, 640, 3), dtype=np.uint8)
+
+        detector._resize(frame, 640, dst)
+
+        # 1920x1080 scales to 640x360, centered with 140 rows of padding
+        assert detector._input_transform(frame, 640) == (1 / 3, 0, 140)
+        assert (dst[:140] == BallDetector.LETTERBOX_COLOR).all()
+        assert (dst[500:] == BallDetector.LETTERBOX_COLOR).all()
+        assert (dst[140:500] == (40, 120, 40)).all()
+
+    def test_boxes_map_back_to_frame_pixels(self, detector: BallDetector):
+        frame = _grass_frame()
+        # A 24px ball centered at (960, 540) in the frame, in model coordinates
+        boxes = np.array([[316.0, 316.0, 324.0, 324.0, 0.9, 32.0]])
+
+        (hit,) = detector._ball_detections(boxes, frame)
+
+        assert hit.center == pytest.approx((960.0, 540.0))
+        assert hit.size == pytest.approx((24.0, 24.0))
+
+    def test_roi_boxes_map_back_to_frame_pixels(self, detector: BallDetector):
+        frame = _grass_frame()
+        roi = (800, 400, 1056, 656)
+        # 256px crop run at 640: gain 2.5, no padding
+        boxes = np.array([[300.0, 300.0, 330.0, 330.0, 0.9, 32.0]])
+
+        (hit,) = detector._ball_detections(boxes, frame, 640, roi)
+
+        assert hit.center == pytest.approx((800 + 126.0, 400 + 126.0))
+        assert hit.size == pytest.approx((12.0, 12.0))
+
+
+class TestStaticBatchEngines:
+    """Engines exported for a single frame never get a larger batch."""
+
+    def test_static_engine_gets_one_frame_per_call(
+        self, detector: BallDetector, stub_predictor: StubPredictor
+    ):
+        detector.backend = "coreml"
+
+        results = detector._predict([_grass_frame()] * 3, conf=0.25, classes=[32])
+
+        assert stub_predictor.batch_shapes == [(1, 3, 640, 640)] * 3
+        assert [len(boxes) for boxes in results] == [1, 1, 1]
+
+    def test_dynamic_engine_gets_whole_batch(
+        self, detector: BallDetector, stub_predictor: StubPredictor
+    ):
+        detector.backend = "pytorch"
+
+        results = detector._predict([_grass_frame()] * 3, conf=0.25, classes=[32])
+
+        assert stub_predictor.batch_shapes == [(3, 3, 640, 640)]
+        assert [len(boxes) for boxes in results] == [1, 1, 1]
+
+
+class TestSharedModelLocking:
+    """Detectors sharing a model never run it from two threads at once."""
+
+    def test_concurrent_predicts_are_serialized(
+        self, detector: BallDetector, stub_predictor: StubPredictor
+    ):
+        detector.backend = "pytorch"
+        other = BallDetector(batch_size=4)
+        other.model, other._predictor, other.device = detector.model, stub_predictor, "cpu"
+        other.backend, other._predict_lock = "pytorch", detector._predict_lock
+
+        threads = [
+            threading.Thread(target=d._predict, args=([_grass_frame()], 0.25, [32]))
+            for d in (detector, other, detector, other)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(stub_predictor.batch_shapes) == 4
+        assert stub_predictor.max_running == 1
+
+
+class TestSharedModelLoading:
+    """A slow model build only blocks detectors waiting for that same model."""
+
+    @pytest.fixture
+    def slow_build(self):
+        """Make _build_model block until released, counting the builds."""
+        started, release = threading.Event(), threading.Event()
+        builds: list[Path] = []
+
+        def fake_build(self, model_path):
+            builds.append(model_path)
+            started.set()
+            assert release.wait(5)
+            self.model, self._predictor = object(), object()
+            self.backend, self._half = "pytorch", False
+
+        with patch.dict("backend.detection.visual._shared_models", clear=True), \
+                patch.dict("backend.detection.visual._shared_model_build_locks", clear=True), \
+                patch.object(BallDetector, "_build_model", fake_build):
+            yield started, release, builds
+
+    def test_loaded_model_not_blocked_by_other_build(self, tmp_path: Path, slow_build):
+        started, release, builds = slow_build
+        loaded = BallDetector(model_path=tmp_path / "loaded.pt", batch_size=4)
+        release.set()
+        loaded.load_model()  # Built once up front
+        started.clear()
+        release.clear()
+
+        building = threading.Thread(
+            target=BallDetector(model_path=tmp_path / "slow.pt", batch_size=4).load_model
+        )
+        building.start()
+        assert started.wait(5)
+
+        other = BallDetector(model_path=tmp_path / "loaded.pt", batch_size=4)
+        done = threading.Thread(target=other.load_model)
+        done.start()
+        done.join(timeout=1)
+        blocked = done.is_alive()
+
+        release.set()
+        building.join()
+        done.join()
+        assert not blocked
+        assert other.model is loaded.model
+        assert builds == [tmp_path / "loaded.pt", tmp_path / "slow.pt"]
+
+    def test_same_model_is_built_once(self, tmp_path: Path, slow_build):
+        started, release, builds = slow_build
+        detectors = [BallDetector(model_path=tmp_path / "yolo.pt", batch_size=4) for _ in range(3)]
+
+        threads = [threading.Thread(target=d.load_model) for d in detectors]
+        for thread in threads:
+            thread.start()
+        assert started.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(builds) == 1
+        assert all(d.model is detectors[0].model for d in detectors)
+        assert all(d._predict_lock is detectors[0]._predict_lock for d in detectors)
+
+
+class TestDetectBatch:
+    """A batch of several frames splits between ROI and full-frame passes."""
+
+    @staticmethod
+    def _nms_by_input_size(preds, conf, iou, classes=None, max_det=300):
+        # ROI crops (256px): a 12px ball at the crop center; full frames
+        # (640px): the 24px ball of _stub_nms
+        if preds.shape[-1] == BallDetector.ROI_SIZE:
+            box = [122.0, 122.0, 134.0, 134.0, 0.8, 32.0]
+        else:
+            box = [316.0, 316.0, 324.0, 324.0, 0.9, 32.0]
+        return [torch.tensor([box]) for _ in range(len(preds))]
+
+    def test_batch_of_frames(self, detector: BallDetector, stub_predictor: StubPredictor):
+        detector.backend = "pytorch"
+        batch = [(0, frame_index, _grass_frame()) for frame_index in (10, 20, 50, 60)]
+
+        with patch("backend.detection.visual.non_max_suppression", self._nms_by_input_size):
+            found = detector._detect_batch(batch, {0: (5, (960.0, 540.0))})
+
+        # Frames within ROI_MAX_FRAME_GAP of the hit run together as crops,
+        # the rest together on the full frame
+        assert stub_predictor.batch_shapes == [(2, 3, 256, 256), (2, 3, 640, 640)]
+        assert sorted(found) == [(0, 10), (0, 20), (0, 50), (0, 60)]
+        for frame_index in (10, 20):
+            assert found[(0, frame_index)].center == pytest.approx((960.0, 540.0))
+            assert found[(0, frame_index)].size == pytest.approx((12.0, 12.0))
+            assert found[(0, frame_index)].confidence == pytest.approx(0.8)
+        for frame_index in (50, 60):
+            assert found[(0, frame_index)].center == pytest.approx((960.0, 540.0))
+            assert found[(0, frame_index)].size == pytest.approx((24.0, 24.0))
+            assert found[(0, frame_index)].confidence == pytest.approx(0.9)
+
+    def test_roi_uses_each_segments_own_hit(
+        self, detector: BallDetector, stub_predictor: StubPredictor
+    ):
+        detector.backend = "pytorch"
+        batch = [(0, 10, _grass_frame()), (1, 10, _grass_frame())]
+
+        with patch("backend.detection.visual.non_max_suppression", self._nms_by_input_size):
+            found = detector._detect_batch(batch, {0: (5, (960.0, 540.0))})
+
+        # Only segment 0 has a recent hit; segment 1 runs on the full frame
+        assert stub_predictor.batch_shapes == [(1, 3, 256, 256), (1, 3, 640, 640)]
+        assert found[(0, 10)].size == pytest.approx((12.0, 12.0))
+        assert found[(1, 10)].size == pytest.approx((24.0, 24.0))
+
+    def test_roi_misses_fall_back_to_full_frame(
+        self, detector: BallDetector, stub_predictor: StubPredictor
+    ):
+        detector.backend = "pytorch"
+        batch = [(0, frame_index, _grass_frame()) for frame_index in (10, 11, 12)]
+
+        # _stub_nms's box is 8px at ROI scale: too small, so every crop misses
+        found = detector._detect_batch(batch, {0: (5, (960.0, 540.0))})
+
+        assert stub_predictor.batch_shapes == [(3, 3, 256, 256), (3, 3, 640, 640)]
+        assert all(found[(0, i)].size == pytest.approx((24.0, 24.0)) for i in (10, 11, 12))
+
+
+# Reference implementations of the original per-item kernels, which the
+# vectorized versions must reproduce
+
+
+def _baseline_is_valid_ball(bbox: tuple, frame_width: int) -> bool:
+    x1, y1, x2, y2 = bbox
+    width = x2 - x1
+    height = y2 - y1
+
+    size_ratio = max(width, height) / frame_width
+    if size_ratio < BallDetector.MIN_BALL_SIZE_RATIO:
+        return False
+    if size_ratio > BallDetector.MAX_BALL_SIZE_RATIO:
+        return False
+
+    if width > 0 and height > 0:
+        aspect_ratio = width / height
+        if (
+            aspect_ratio < BallDetector.MIN_ASPECT_RATIO
+            or aspect_ratio > BallDetector.MAX_ASPECT_RATIO
+        ):
+            return False
+
+    return True
+
+
+def _baseline_sample_frames(fps: float, start_frame: int, end_frame: int, sample_fps: float):
+    frame_interval = max(1, int(fps / sample_fps))
+    return [
+        frame for frame in range(start_frame, end_frame)
+        if (frame - start_frame) % frame_interval == 0
+    ]
+
+
+def _baseline_interpolate(
+    trajectory: list[TrajectoryPoint], all_detections: list[dict], max_gap_frames: int
+) -> list[TrajectoryPoint]:
+    if len(trajectory) < 2:
+        return trajectory
+
+    detection_timestamps = {d["timestamp"] for d in all_detections if d["detection"]}
+    all_timestamps = sorted(d["timestamp"] for d in all_detections)
+
+    result = []
+    for current, next_point in zip(trajectory, trajectory[1:]):
+        result.append(current)
+        gap_timestamps = [
+            t for t in all_timestamps
+            if current.timestamp < t < next_point.timestamp and t not in detection_timestamps
+        ]
+        if 0 < len(gap_timestamps) <= max_gap_frames:
+            for gap_ts in gap_timestamps:
+                t_ratio = (gap_ts - current.timestamp) / (next_point.timestamp - current.timestamp)
+                result.append(
+                    TrajectoryPoint(
+                        timestamp=gap_ts,
+                        x=current.x + t_ratio * (next_point.x - current.x),
+                        y=current.y + t_ratio * (next_point.y - current.y),
+                        confidence=min(current.confidence, next_point.confidence) * 0.5,
+                        interpolated=True,
+                    )
+                )
+    result.append(trajectory[-1])
+    result.sort(key=lambda p: p.timestamp)
+    return result
+
+
+def _baseline_physics_plausibility(trajectory: list[TrajectoryPoint]) -> float:
+    if len(trajectory) < 4:
+        return 0.5
+
+    x_coords = np.array([p.x for p in trajectory])
+    y_coords = np.array([p.y for p in trajectory])
+    timestamps = np.array([p.timestamp for p in trajectory])
+    t_norm = (timestamps - timestamps[0]) / max(timestamps[-1] - timestamps[0], 1e-6)
+
+    coeffs = np.polyfit(t_norm, y_coords, 2)
+    y_fitted = np.polyval(coeffs, t_norm)
+    ss_res = np.sum((y_coords - y_fitted) ** 2)
+    ss_tot = np.sum((y_coords - np.mean(y_coords)) ** 2)
+    if ss_tot == 0:
+        return 0.5
+    r_squared = 1 - (ss_res / ss_tot)
+
+    x_direction = np.sign(np.diff(x_coords))
+    x_consistency = np.sum(x_direction == x_direction[0]) / len(x_direction)
+    return float(max(0, min(1, r_squared * 0.6 + x_consistency * 0.4)))
+
+
+def _flight(n: int, seed: int, zigzag: bool = False) -> list[TrajectoryPoint]:
+    """A noisy parabolic flight sampled at irregular times."""
+    rng = np.random.default_rng(seed)
+    timestamps = np.cumsum(rng.uniform(0.02, 0.1, n))
+    t = timestamps - timestamps[0]
+    x = 200 + 900 * t + rng.normal(0, 3, n)
+    if zigzag:
+        x[1::2] -= 200
+    y = 900 - 1200 * t + 800 * t**2 + rng.normal(0, 8, n)
+    return [
+        TrajectoryPoint(timestamp=float(ts), x=float(px), y=float(py), confidence=0.8)
+        for ts, px, py in zip(timestamps, x, y)
+    ]
+
+
+class TestBallValidation:
+    """Vectorized box validation matches the original per-box checks."""
+
+    def _boxes(self) -> np.ndarray:
+        rng = np.random.default_rng(0)
+        n = 500
+        widths = rng.uniform(0, 60, n)
+        heights = widths * rng.uniform(0.5, 1.6, n)
+        # Boundary cases: exact size and aspect limits, zero and negative extents
+        edge_sizes = np.array([
+            [640 * BallDetector.MIN_BALL_SIZE_RATIO, 640 * BallDetector.MIN_BALL_SIZE_RATIO],
+            [640 * BallDetector.MAX_BALL_SIZE_RATIO, 640 * BallDetector.MAX_BALL_SIZE_RATIO],
+            [14.0, 14.0 / BallDetector.MIN_ASPECT_RATIO],
+            [14.0, 14.0 / BallDetector.MAX_ASPECT_RATIO],
+            [0.0, 20.0],
+            [20.0, 0.0],
+            [-5.0, 20.0],
+            [0.0, 0.0],
+        ])
+        widths = np.concatenate([widths, edge_sizes[:, 0]])
+        heights = np.concatenate([heights, edge_sizes[:, 1]])
+        x1 = rng.uniform(0, 500, len(widths))
+        y1 = rng.uniform(0, 500, len(widths))
+        conf = np.sort(rng.uniform(0.25, 1.0, len(widths)))[::-1]
+        return np.column_stack([x1, y1, x1 + widths, y1 + heights, conf, np.full_like(conf, 32)])
+
+    def test_valid_ball_mask_matches_baseline(self, detector: BallDetector):
+        boxes = self._boxes()
+
+        mask = detector._valid_ball_mask(boxes[:, 2] - boxes[:, 0], boxes[:, 3] - boxes[:, 1], 640)
+
+        expected = [_baseline_is_valid_ball(tuple(box[:4]), 640) for box in boxes]
+        assert mask.tolist() == expected
+        assert 0 < sum(expected) < len(expected)
+
+    def test_ball_detections_match_baseline(self, detector: BallDetector):
+        # A square frame at the model size: model and frame pixels coincide
+        frame = np.zeros((640, 640, 3), dtype=np.uint8)
+        boxes = self._boxes()
+        expected = [tuple(box[:4]) for box in boxes if _baseline_is_valid_ball(tuple(box[:4]), 640)]
+
+        hits = detector._ball_detections(boxes.copy(), frame)
+
+        np.testing.assert_allclose([hit.bbox for hit in hits], expected)
+
+        (best,) = detector._ball_detections(boxes.copy(), frame, best_only=True)
+        assert best.bbox == pytest.approx(expected[0])
+
+
+class TestSampleFrames:
+    """Frame sampling matches the original integer interval where it was exact."""
+
+    @pytest.mark.parametrize(
+        "fps, start, end, sample_fps",
+        [(30.0, 0, 300, 10.0), (60.0, 17, 421, 10.0), (30.0, 5, 95, 30.0), (24.0, 0, 50, 60.0)],
+    )
+    def test_integer_ratios_match_baseline(self, detector, fps, start, end, sample_fps):
+        assert detector._sample_frames(fps, start, end, sample_fps) == _baseline_sample_frames(
+            fps, start, end, sample_fps
+        )
+
+    def test_fractional_ratio_keeps_sample_rate(self, detector: BallDetector):
+        fps, sample_fps = 29.97, 10.0
+
+        frames = detector._sample_frames(fps, 100, 100 + 2997, sample_fps)
+
+        # 100 seconds at 10fps, rather than the baseline's 15fps from an
+        # interval truncated to 2
+        assert len(frames) == 1000
+        assert frames == [round(100 + k * (fps / sample_fps)) for k in range(1000)]
+        assert set(np.diff(frames).tolist()) == {2, 3}
+
+
+class TestInterpolateTrajectoryGaps:
+    """Single-cursor gap filling matches the original per-gap scan."""
+
+    def test_matches_baseline(self, detector: BallDetector):
+        fps = 30.0
+        # Gaps of 1, 2 and 5 missed frames, then a trailing miss
+        hit_frames = {0, 1, 3, 6, 12, 13}
+        detections = []
+        for frame in range(15):
+            hit = None
+            if frame in hit_frames:
+                hit = BallDetection(
+                    bbox=(0.0, 0.0, 10.0, 10.0),
+                    confidence=0.5 + frame / 100,
+                    center=(100.0 + 20 * frame, 800.0 - 15 * frame + frame**2),
+                    size=(10.0, 10.0),
+                )
+            detections.append(
+                {"timestamp": frame / fps, "frame": frame, "detection": hit, "static": False}
+            )
+        trajectory = [
+            TrajectoryPoint(
+                timestamp=d["timestamp"],
+                x=d["detection"].center[0],
+                y=d["detection"].center[1],
+                confidence=d["detection"].confidence,
+            )
+            for d in detections
+            if d["detection"] is not None
+        ]
+        summary = detector._summarize_detections(detections)
+
+        for max_gap_frames in (0, 1, 2, 5):
+            result = detector._interpolate_trajectory_gaps(trajectory, summary, max_gap_frames)
+            assert result == _baseline_interpolate(trajectory, detections, max_gap_frames)
+
+        filled = detector._interpolate_trajectory_gaps(trajectory, summary, 2)
+        assert [p.timestamp * fps for p in filled if p.interpolated] == pytest.approx([2, 4, 5])
+
+
+class TestTrajectoryScores:
+    """Compiled and closed-form scoring match the NumPy baselines."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_acceleration_variance_matches_numpy(self, seed: int):
+        rng = np.random.default_rng(seed)
+        n = int(rng.integers(3, 200))
+        timestamps = np.cumsum(rng.uniform(0.01, 0.2, n))
+        timestamps[n // 2] = timestamps[n // 2 - 1]  # A repeated timestamp
+        x = rng.uniform(0, 1920, n)
+        y = rng.uniform(0, 1080, n)
+
+        assert _acceleration_variance(timestamps, x, y) == pytest.approx(
+            _acceleration_variance_numpy(timestamps, x, y), rel=1e-7
+        )
+
+    def test_acceleration_variance_of_three_points(self):
+        timestamps = np.array([0.0, 0.1, 0.2])
+        x = np.array([0.0, 10.0, 30.0])
+        y = np.array([0.0, -5.0, -5.0])
+
+        assert _acceleration_variance(timestamps, x, y) == pytest.approx((0.0, 0.0))
+
+    @pytest.mark.parametrize(
+        "trajectory",
+        [
+            _flight(4, seed=1),
+            _flight(12, seed=2),
+            _flight(60, seed=3),
+            _flight(30, seed=4, zigzag=True),
+        ],
+    )
+    def test_physics_plausibility_matches_polyfit(
+        self, detector: BallDetector, trajectory: list[TrajectoryPoint]
+    ):
+        points = detector._trajectory_array(trajectory)
+
+        assert detector._calculate_physics_plausibility(points) == pytest.approx(
+            _baseline_physics_plausibility(trajectory), abs=1e-9
+        )
+
+    def test_physics_plausibility_degenerate_inputs(self, detector: BallDetector):
+        flat = [TrajectoryPoint(timestamp=i / 10, x=100.0 * i, y=500.0, confidence=0.8) for i in range(6)]
+        short = _flight(3, seed=5)
+
+        for trajectory in (flat, short):
+            points = detector._trajectory_array(trajectory)
+            assert detector._calculate_physics_plausibility(points) == 0.5
+            assert _baseline_physics_plausibility(trajectory) == 0.5
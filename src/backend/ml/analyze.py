@@ -2,14 +2,17 @@
 
 import argparse
 import asyncio
-from typing import Optional
+import io
+import sys
+from functools import partial
+from typing import Callable, Optional
 
 from loguru import logger
 
 from backend.core.database import init_db
-from backend.models.job import get_all_feedback
+from backend.ml.columns import load_feature_matrix, load_feedback_columns
 from backend.ml.config import load_ml_config, save_ml_config
-from backend.ml.stages import analyze_threshold, analyze_weights, analyze_calibration
+from backend.ml.stages import analyze_threshold, analyze_feature_matrix, analyze_calibration
 
 
 async def run_analysis(
@@ -19,6 +22,9 @@ async def run_analysis(
 ) -> dict:
     """Run ML analysis for a specific stage.
 
+    The report is collected in memory and written to stdout in one go once
+    the analysis finishes, rather than line by line.
+
     Args:
         stage: Stage number (1, 2, or 3).
         env_filter: Environment filter ('prod', 'dev', 'all').
@@ -27,19 +33,35 @@ async def run_analysis(
     Returns:
         Analysis results.
     """
+    out = io.StringIO()
+    try:
+        return await _run_analysis(stage, env_filter, dry_run, partial(print, file=out))
+    finally:
+        sys.stdout.write(out.getvalue())
+
+
+async def _run_analysis(
+    stage: int,
+    env_filter: str,
+    dry_run: bool,
+    emit: Callable[..., None],
+) -> dict:
+    """Body of run_analysis(); report lines go through ``emit``."""
     logger.info(f"Starting ML analysis: stage={stage}, env={env_filter}, dry_run={dry_run}")
 
     await init_db()
 
-    # Get feedback data
-    all_feedback = await get_all_feedback(limit=10000)
-
-    # Filter by environment
-    if env_filter != "all":
-        all_feedback = [f for f in all_feedback if f.get("environment", "prod") == env_filter]
+    # Load feedback filtered by environment in the query; stage 2 only needs
+    # the packed feature vectors, stages 1 and 3 work on the column view
+    if stage == 2:
+        X, y = await load_feature_matrix(env_filter=env_filter)
+        n_samples = len(y)
+    else:
+        all_feedback = await load_feedback_columns(env_filter=env_filter)
+        n_samples = len(all_feedback)
 
-    print(f"\nAnalyzing {len(all_feedback)} feedback samples ({env_filter} environment)")
-    logger.info(f"Loaded {len(all_feedback)} feedback samples for analysis")
+    emit(f"\nAnalyzing {n_samples} feedback samples ({env_filter} environment)")
+    logger.info(f"Loaded {n_samples} feedback samples for analysis")
 
     config = load_ml_config()
 
@@ -47,13 +69,13 @@ async def run_analysis(
         if stage == 1:
             result = analyze_threshold(all_feedback, current_threshold=config["confidence_threshold"])
 
-            print(f"\n=== Stage 1: Threshold Tuning ===")
-            print(f"Samples analyzed: {result['samples_analyzed']}")
-            print(f"Current threshold: {result['current_threshold']}")
-            print(f"Recommended threshold: {result['recommended_threshold']}")
-            print(f"\nProjected impact:")
-            print(f"  FP rate: {result['current_fp_rate']:.1%} → {result['projected_fp_rate']:.1%}")
-            print(f"  TP retention: {result['projected_tp_retention']:.1%}")
+            emit(f"\n=== Stage 1: Threshold Tuning ===")
+            emit(f"Samples analyzed: {result['samples_analyzed']}")
+            emit(f"Current threshold: {result['current_threshold']}")
+            emit(f"Recommended threshold: {result['recommended_threshold']}")
+            emit(f"\nProjected impact:")
+            emit(f"  FP rate: {result['current_fp_rate']:.1%} → {result['projected_fp_rate']:.1%}")
+            emit(f"  TP retention: {result['projected_tp_retention']:.1%}")
 
             if not dry_run and result["recommended_threshold"] != config["confidence_threshold"]:
                 old_threshold = config["confidence_threshold"]
@@ -65,22 +87,22 @@ async def run_analysis(
                 })
                 save_ml_config(config)
                 logger.info(f"Applied confidence_threshold: {old_threshold} -> {result['recommended_threshold']}")
-                print(f"\n✓ Applied: confidence_threshold updated to {result['recommended_threshold']}")
+                emit(f"\n✓ Applied: confidence_threshold updated to {result['recommended_threshold']}")
             elif dry_run:
-                print(f"\nTo apply: python -m backend.ml.analyze analyze --stage 1 --apply")
+                emit(f"\nTo apply: python -m backend.ml.analyze analyze --stage 1 --apply")
 
         elif stage == 2:
-            result = analyze_weights(all_feedback)
+            result = analyze_feature_matrix(X, y)
 
-            print(f"\n=== Stage 2: Weight Optimization ===")
-            print(f"Samples analyzed: {result['samples_analyzed']}")
+            emit(f"\n=== Stage 2: Weight Optimization ===")
+            emit(f"Samples analyzed: {result['samples_analyzed']}")
 
             if result["learned_weights"]:
-                print(f"Model accuracy: {result['model_accuracy']:.1%}")
-                print(f"\nLearned weights:")
+                emit(f"Model accuracy: {result['model_accuracy']:.1%}")
+                emit(f"\nLearned weights:")
                 for name, weight in result["learned_weights"].items():
                     current = config["feature_weights"].get(name, "N/A")
-                    print(f"  {name}: {current} → {weight}")
+                    emit(f"  {name}: {current} → {weight}")
 
                 if not dry_run:
                     old_weights = config["feature_weights"].copy()
@@ -92,23 +114,23 @@ async def run_analysis(
                     })
                     save_ml_config(config)
                     logger.info(f"Applied feature_weights update")
-                    print(f"\n✓ Applied: feature_weights updated")
+                    emit(f"\n✓ Applied: feature_weights updated")
                 elif dry_run:
-                    print(f"\nTo apply: python -m backend.ml.analyze analyze --stage 2 --apply")
+                    emit(f"\nTo apply: python -m backend.ml.analyze analyze --stage 2 --apply")
             else:
-                print(f"Error: {result.get('error', 'Unknown error')}")
+                emit(f"Error: {result.get('error', 'Unknown error')}")
 
         elif stage == 3:
             result = analyze_calibration(all_feedback)
 
-            print(f"\n=== Stage 3: Confidence Recalibration ===")
-            print(f"Samples analyzed: {result['samples_analyzed']}")
+            emit(f"\n=== Stage 3: Confidence Recalibration ===")
+            emit(f"Samples analyzed: {result['samples_analyzed']}")
 
             if result["calibration_map"]:
-                print(f"\nSample calibrations:")
+                emit(f"\nSample calibrations:")
                 for conf in ["0.60", "0.70", "0.80", "0.90"]:
                     if conf in result["calibration_map"]:
-                        print(f"  Raw {conf} → Calibrated {result['calibration_map'][conf]}")
+                        emit(f"  Raw {conf} → Calibrated {result['calibration_map'][conf]}")
 
                 if not dry_run:
                     config["calibration_model"] = result["calibration_map"]
@@ -119,11 +141,11 @@ async def run_analysis(
                     })
                     save_ml_config(config)
                     logger.info(f"Applied calibration_model update")
-                    print(f"\n✓ Applied: calibration_model updated")
+                    emit(f"\n✓ Applied: calibration_model updated")
                 elif dry_run:
-                    print(f"\nTo apply: python -m backend.ml.analyze analyze --stage 3 --apply")
+                    emit(f"\nTo apply: python -m backend.ml.analyze analyze --stage 3 --apply")
             else:
-                print(f"Error: {result.get('error', 'Unknown error')}")
+                emit(f"Error: {result.get('error', 'Unknown error')}")
 
         else:
             logger.error(f"Invalid stage: {stage}")
@@ -131,7 +153,7 @@ async def run_analysis(
 
     except Exception as e:
         logger.error(f"Analysis failed: {e}")
-        print(f"\nError: Analysis failed - {e}")
+        emit(f"\nError: Analysis failed - {e}")
         return {"error": str(e)}
 
     return result
@@ -0,0 +1,129 @@
+"""Column-oriented view of feedback records for the ML analysis stages."""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from backend.core.database import DETECTION_FEATURE_KEYS
+from backend.models.job import get_feedback_columns, get_feedback_features
+
+
+def _to_datetime64(created_at: list[str] | list[int]) -> np.ndarray:
+    """Convert timestamps to second-resolution datetime64 values.
+
+    Integers are taken as Unix seconds and converted without any parsing.
+    ISO strings are compared as naive UTC, so fractional seconds and any
+    timezone suffix past the first 19 characters are dropped.
+    """
+    if created_at and isinstance(created_at[0], int):
+        return np.array(created_at, dtype=np.int64).astype("datetime64[s]")
+    return np.array([s[:19] for s in created_at], dtype="datetime64[s]")
+
+
+@dataclass
+class FeedbackColumns:
+    """Feedback records stored as parallel arrays, one entry per record.
+
+    Attributes:
+        confidence: Confidence snapshot per record, NaN where missing.
+        is_tp: True for true-positive feedback.
+        is_fp: True for false-positive feedback.
+        environment: Environment tag per record ('prod', 'dev', ...).
+        created_at: Creation time per record as datetime64[s].
+    """
+
+    confidence: np.ndarray
+    is_tp: np.ndarray
+    is_fp: np.ndarray
+    environment: np.ndarray
+    created_at: np.ndarray
+
+    @classmethod
+    def from_columns(
+        cls,
+        feedback_type: list[str],
+        confidence_snapshot: list[float | None],
+        environment: list[str],
+        created_at: list[str] | list[int],
+    ) -> "FeedbackColumns":
+        """Build from per-column value lists, as returned by get_feedback_columns()."""
+        types = np.array(feedback_type, dtype=object)
+        return cls(
+            confidence=np.array(confidence_snapshot, dtype=np.float64),
+            is_tp=types == "true_positive",
+            is_fp=types == "false_positive",
+            environment=np.array(environment, dtype=object),
+            created_at=_to_datetime64(created_at),
+        )
+
+    @classmethod
+    def from_records(cls, feedback: list[dict[str, Any]]) -> "FeedbackColumns":
+        """Build from feedback dicts, as returned by get_all_feedback()."""
+        return cls.from_columns(
+            feedback_type=[f["feedback_type"] for f in feedback],
+            confidence_snapshot=[f.get("confidence_snapshot") for f in feedback],
+            environment=[f.get("environment", "prod") for f in feedback],
+            created_at=[f.get("created_at") or "NaT" for f in feedback],
+        )
+
+    def __len__(self) -> int:
+        return len(self.is_tp)
+
+    def select(self, mask: np.ndarray) -> "FeedbackColumns":
+        """Return the records where ``mask`` is True."""
+        return FeedbackColumns(
+            confidence=self.confidence[mask],
+            is_tp=self.is_tp[mask],
+            is_fp=self.is_fp[mask],
+            environment=self.environment[mask],
+            created_at=self.created_at[mask],
+        )
+
+    def for_environment(self, env_filter: str) -> "FeedbackColumns":
+        """Return the records tagged ``env_filter``, or all of them for 'all'."""
+        if env_filter == "all":
+            return self
+        return self.select(self.environment == env_filter)
+
+
+async def load_feedback_columns(
+    env_filter: str = "all",
+    limit: int | None = None,
+) -> FeedbackColumns:
+    """Stream feedback from the database straight into column form.
+
+    Args:
+        env_filter: 'prod', 'dev', or 'all'; filtered in the query.
+        limit: Maximum records to load, or None for all.
+
+    Returns:
+        FeedbackColumns for the newest ``limit`` matching records.
+    """
+    environment = None if env_filter == "all" else env_filter
+    return FeedbackColumns.from_columns(
+        **await get_feedback_columns(environment=environment, limit=limit)
+    )
+
+
+async def load_feature_matrix(
+    env_filter: str = "all",
+    limit: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Load detection feature vectors for weight training without JSON decoding.
+
+    The packed vectors are joined and viewed as one float64 matrix, so the
+    rows come out in DETECTION_FEATURE_KEYS order with no per-row work.
+
+    Args:
+        env_filter: 'prod', 'dev', or 'all'; filtered in the query.
+        limit: Maximum records to scan, or None for all.
+
+    Returns:
+        Tuple of (X, y): the feature matrix and int8 labels (1 = true positive).
+    """
+    environment = None if env_filter == "all" else env_filter
+    blobs, types = await get_feedback_features(environment=environment, limit=limit)
+    X = np.frombuffer(b"".join(blobs), dtype="<f8").reshape(-1, len(DETECTION_FEATURE_KEYS))
+    y = (np.array(types, dtype=object) == "true_positive").astype(np.int8)
+    return X, y
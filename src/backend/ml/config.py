@@ -2,6 +2,10 @@
 
 import copy
 import json
+import os
+import shutil
+import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -11,23 +15,38 @@ from loguru import logger
 # Config file location
 ML_CONFIG_PATH = Path.home() / ".golfclip" / "ml_config.json"
 
+
+def _fresh_defaults() -> dict[str, Any]:
+    """Build a new default configuration.
+
+    Constructed from literals on each call, which is much cheaper than
+    deep-copying a shared template and can't leak mutations between callers.
+    """
+    return {
+        "version": 1,
+        "confidence_threshold": 0.70,
+        "feature_weights": {
+            "height": 0.20,
+            "flatness": 0.10,
+            "centroid": 0.15,
+            "prominence": 0.15,
+            "rise": 0.10,
+            "decay": 0.20,
+            "zcr": 0.10,
+        },
+        "calibration_model": None,
+        "updated_at": None,
+        "update_history": [],
+    }
+
+
 # Default configuration
-DEFAULT_CONFIG = {
-    "version": 1,
-    "confidence_threshold": 0.70,
-    "feature_weights": {
-        "height": 0.20,
-        "flatness": 0.10,
-        "centroid": 0.15,
-        "prominence": 0.15,
-        "rise": 0.10,
-        "decay": 0.20,
-        "zcr": 0.10,
-    },
-    "calibration_model": None,
-    "updated_at": None,
-    "update_history": [],
-}
+DEFAULT_CONFIG = _fresh_defaults()
+
+# Last parsed config, keyed by path and file mtime so edits on disk are
+# picked up while repeated loads skip the JSON parse
+_cfg_cache: tuple[Path, int, dict[str, Any]] | None = None
+_cfg_lock = threading.Lock()
 
 
 def load_ml_config() -> dict[str, Any]:
@@ -36,16 +55,27 @@ def load_ml_config() -> dict[str, Any]:
     Returns:
         Configuration dictionary.
     """
-    if ML_CONFIG_PATH.exists():
+    global _cfg_cache
+
+    try:
+        mtime = ML_CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return _fresh_defaults()
+
+    with _cfg_lock:
+        if _cfg_cache is not None and _cfg_cache[:2] == (ML_CONFIG_PATH, mtime):
+            return copy.deepcopy(_cfg_cache[2])
+
         try:
             with open(ML_CONFIG_PATH) as f:
                 config = json.load(f)
                 logger.debug(f"Loaded ML config from {ML_CONFIG_PATH}")
-                return config
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(f"Failed to load ML config: {e}, using defaults")
+            return _fresh_defaults()
 
-    return copy.deepcopy(DEFAULT_CONFIG)
+        _cfg_cache = (ML_CONFIG_PATH, mtime, config)
+        return copy.deepcopy(config)
 
 
 def save_ml_config(config: dict[str, Any]) -> None:
@@ -54,21 +84,39 @@ def save_ml_config(config: dict[str, Any]) -> None:
     Args:
         config: Configuration dictionary to save.
     """
-    ML_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    global _cfg_cache
 
-    # Create backup if file exists
-    if ML_CONFIG_PATH.exists():
-        timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H-%M-%S")
-        backup_path = ML_CONFIG_PATH.parent / f"ml_config.backup.{timestamp}.json"
-        ML_CONFIG_PATH.rename(backup_path)
-        logger.info(f"Created backup: {backup_path}")
+    ML_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     # Update timestamp
     config["updated_at"] = datetime.utcnow().isoformat()
 
-    # Save
-    with open(ML_CONFIG_PATH, "w") as f:
-        json.dump(config, f, indent=2)
+    with _cfg_lock:
+        # Write to a temp file first so the config is swapped in atomically and
+        # a crash never leaves it missing or half-written; the file is unique
+        # and written under the lock, so concurrent saves can't interleave
+        f = tempfile.NamedTemporaryFile(
+            "w", dir=ML_CONFIG_PATH.parent, prefix="ml_config.", suffix=".tmp", delete=False
+        )
+        tmp_path = Path(f.name)
+        try:
+            with f:
+                json.dump(config, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Create backup if file exists
+            if ML_CONFIG_PATH.exists():
+                timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H-%M-%S")
+                backup_path = ML_CONFIG_PATH.parent / f"ml_config.backup.{timestamp}.json"
+                shutil.copy2(ML_CONFIG_PATH, backup_path)
+                logger.info(f"Created backup: {backup_path}")
+
+            os.replace(tmp_path, ML_CONFIG_PATH)
+            _cfg_cache = None
+        finally:
+            # Only left behind if something above failed
+            tmp_path.unlink(missing_ok=True)
 
     logger.info(f"Saved ML config to {ML_CONFIG_PATH}")
 
@@ -1,12 +1,13 @@
 """Feedback statistics and trend analysis."""
 
 import asyncio
-from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
 from loguru import logger
 
+from backend.ml.columns import FeedbackColumns, load_feedback_columns
 from backend.models.job import get_all_feedback
 
 
@@ -20,28 +21,45 @@ async def get_feedback_summary(env_filter: str = "all") -> dict[str, Any]:
         Summary dictionary with counts by environment.
     """
     all_feedback = await get_all_feedback(limit=10000)
+    return get_feedback_summary_from(FeedbackColumns.from_records(all_feedback), env_filter)
 
-    # Filter if needed
-    if env_filter != "all":
-        all_feedback = [f for f in all_feedback if f.get("environment", "prod") == env_filter]
+
+def get_feedback_summary_from(
+    columns: FeedbackColumns, env_filter: str = "all"
+) -> dict[str, Any]:
+    """Summarize already-loaded feedback, optionally filtered by environment.
+
+    Args:
+        columns: Feedback to summarize.
+        env_filter: 'prod', 'dev', or 'all'
+
+    Returns:
+        Summary dictionary with counts by environment.
+    """
+    columns = columns.for_environment(env_filter)
 
     # Count by environment
     summary = {
-        "total": len(all_feedback),
+        "total": len(columns),
         "prod": {"total": 0, "tp": 0, "fp": 0},
         "dev": {"total": 0, "tp": 0, "fp": 0},
     }
 
-    for f in all_feedback:
-        env = f.get("environment", "prod")
-        if env not in summary:
-            summary[env] = {"total": 0, "tp": 0, "fp": 0}
-
-        summary[env]["total"] += 1
-        if f["feedback_type"] == "true_positive":
-            summary[env]["tp"] += 1
-        else:
-            summary[env]["fp"] += 1
+    def count(in_env: np.ndarray) -> dict[str, int]:
+        total = int(in_env.sum())
+        tp = int((in_env & columns.is_tp).sum())
+        return {"total": total, "tp": tp, "fp": total - tp}
+
+    # prod and dev are counted straight from masks; only records tagged with
+    # anything else need their environments collected
+    in_prod = columns.environment == "prod"
+    in_dev = columns.environment == "dev"
+    if in_prod.any():
+        summary["prod"] = count(in_prod)
+    if in_dev.any():
+        summary["dev"] = count(in_dev)
+    for env in dict.fromkeys(columns.environment[~(in_prod | in_dev)]):
+        summary[env] = count(columns.environment == env)
 
     return summary
 
@@ -90,46 +108,46 @@ async def get_weekly_trend(weeks: int = 4, env_filter: str = "prod") -> list[dic
         List of weekly stats, oldest first.
     """
     all_feedback = await get_all_feedback(limit=10000)
+    return get_weekly_trend_from(FeedbackColumns.from_records(all_feedback), weeks, env_filter)
 
-    # Filter by environment
-    if env_filter != "all":
-        all_feedback = [f for f in all_feedback if f.get("environment", "prod") == env_filter]
 
-    # Group by week
-    weekly = defaultdict(lambda: {"tp": 0, "fp": 0})
-    now = datetime.utcnow()
+def get_weekly_trend_from(
+    columns: FeedbackColumns, weeks: int = 4, env_filter: str = "prod"
+) -> list[dict[str, Any]]:
+    """Get weekly FP rate trend from already-loaded feedback.
 
-    for f in all_feedback:
-        # Strip timezone suffix for naive datetime comparison
-        created_str = f["created_at"]
-        if created_str.endswith("Z"):
-            created_str = created_str[:-1]
-        elif "+" in created_str:
-            created_str = created_str.split("+")[0]
-        created = datetime.fromisoformat(created_str)
-        days_ago = (now - created).days
-        week_num = days_ago // 7
-
-        if week_num < weeks:
-            if f["feedback_type"] == "true_positive":
-                weekly[week_num]["tp"] += 1
-            else:
-                weekly[week_num]["fp"] += 1
+    Args:
+        columns: Feedback to bucket.
+        weeks: Number of weeks to include.
+        env_filter: Environment to filter by.
+
+    Returns:
+        List of weekly stats, oldest first.
+    """
+    columns = columns.for_environment(env_filter)
+
+    # Group by week: whole weeks since creation, counted with bincount
+    now = datetime.utcnow()
+    weeks_ago = (np.datetime64(now, "s") - columns.created_at) // np.timedelta64(7, "D")
+    in_range = (weeks_ago >= 0) & (weeks_ago < weeks)
+    tp_counts = np.bincount(weeks_ago[in_range & columns.is_tp], minlength=weeks)
+    fp_counts = np.bincount(weeks_ago[in_range & ~columns.is_tp], minlength=weeks)
 
     # Build trend list
     trend = []
     for week_num in range(weeks - 1, -1, -1):
-        data = weekly[week_num]
-        total = data["tp"] + data["fp"]
-        fp_rate = data["fp"] / total if total > 0 else 0
+        tp = int(tp_counts[week_num])
+        fp = int(fp_counts[week_num])
+        total = tp + fp
+        fp_rate = fp / total if total > 0 else 0
 
         week_start = now - timedelta(days=(week_num + 1) * 7)
 
         trend.append({
             "week_of": week_start.strftime("%Y-%m-%d"),
             "total": total,
-            "tp": data["tp"],
-            "fp": data["fp"],
+            "tp": tp,
+            "fp": fp,
             "fp_rate": round(fp_rate, 3),
         })
 
@@ -174,12 +192,15 @@ async def main(show_trend: bool = False, env_filter: str = "prod") -> None:
 
     await init_db()
 
-    summary = await get_feedback_summary()
+    # Load once and share between the summary and the trend
+    columns = await load_feedback_columns()
+
+    summary = get_feedback_summary_from(columns)
     stages = get_available_stages(summary)
 
     trend = None
     if show_trend:
-        trend = await get_weekly_trend(env_filter=env_filter)
+        trend = get_weekly_trend_from(columns, env_filter=env_filter)
 
     print_stats(summary, stages, trend)
 
@@ -4,8 +4,8 @@ from typing import Any
 
 import numpy as np
 from sklearn.isotonic import IsotonicRegression
-from sklearn.linear_model import LogisticRegression
-from sklearn.preprocessing import StandardScaler
+
+from backend.ml.columns import FeedbackColumns
 
 
 # Feature names in order
@@ -22,16 +22,97 @@ FEATURE_KEY_MAP = {
     "zero_crossing_rate": "zcr",
 }
 
+# Extraction order for detection_features, bound once at import
+_FEATURE_KEYS = tuple(FEATURE_KEY_MAP)
+_FEATURE_KEY_NAMES = tuple(FEATURE_KEY_MAP.values())
+
+
+def _threshold_sweep_numpy(
+    tp_sorted: np.ndarray,
+    fp_sorted: np.ndarray,
+    thresholds: np.ndarray,
+    target_tp_retention: float,
+    current_fp_rate: float,
+) -> tuple[int, float, float]:
+    """Find the threshold with the lowest FP rate that keeps enough TPs.
+
+    Scores must be sorted ascending, so the number passing each threshold is
+    the count not left of its insertion point. Ties go to the lowest
+    threshold, and a threshold must beat current_fp_rate to be picked.
+
+    Returns:
+        (index into thresholds or -1 if none improves, FP rate, TP retention)
+    """
+    tp_passing = len(tp_sorted) - np.searchsorted(tp_sorted, thresholds, side="left")
+    fp_passing = len(fp_sorted) - np.searchsorted(fp_sorted, thresholds, side="left")
+
+    # Calculate rates
+    tp_retention = tp_passing / len(tp_sorted) if len(tp_sorted) else np.ones_like(thresholds)
+    new_total = tp_passing + fp_passing
+    new_fp_rate = np.divide(
+        fp_passing, new_total, out=np.zeros_like(thresholds), where=new_total > 0
+    )
+
+    # argmin takes the first minimum among thresholds that keep enough TPs
+    new_fp_rate[tp_retention < target_tp_retention] = np.inf
+    best = int(np.argmin(new_fp_rate))
+    if not new_fp_rate[best] < current_fp_rate:
+        return -1, current_fp_rate, 1.0
+    return best, float(new_fp_rate[best]), float(tp_retention[best])
+
+
+try:
+    from numba import njit
+except ImportError:
+    _threshold_sweep = _threshold_sweep_numpy
+else:
+
+    @njit(cache=True)
+    def _threshold_sweep(tp_sorted, fp_sorted, thresholds, target_tp_retention, current_fp_rate):
+        """Compiled equivalent of _threshold_sweep_numpy.
+
+        Thresholds ascend, so one pointer per score array only moves forward:
+        the whole sweep is a single merge-style pass with no temporaries.
+        """
+        n_tp = len(tp_sorted)
+        n_fp = len(fp_sorted)
+        i_tp = 0
+        i_fp = 0
+
+        best = -1
+        best_fp_rate = current_fp_rate
+        best_tp_retention = 1.0
+        for k in range(len(thresholds)):
+            thresh = thresholds[k]
+            while i_tp < n_tp and tp_sorted[i_tp] < thresh:
+                i_tp += 1
+            while i_fp < n_fp and fp_sorted[i_fp] < thresh:
+                i_fp += 1
+            tp_passing = n_tp - i_tp
+            fp_passing = n_fp - i_fp
+
+            tp_retention = tp_passing / n_tp if n_tp > 0 else 1.0
+            new_total = tp_passing + fp_passing
+            new_fp_rate = fp_passing / new_total if new_total > 0 else 0.0
+
+            if tp_retention >= target_tp_retention and new_fp_rate < best_fp_rate:
+                best = k
+                best_fp_rate = new_fp_rate
+                best_tp_retention = tp_retention
+
+        return best, best_fp_rate, best_tp_retention
+
 
 def analyze_threshold(
-    feedback: list[dict[str, Any]],
+    feedback: list[dict[str, Any]] | FeedbackColumns,
     current_threshold: float = 0.70,
     target_tp_retention: float = 0.95,
 ) -> dict[str, Any]:
     """Stage 1: Analyze feedback to find optimal confidence threshold.
 
     Args:
-        feedback: List of feedback records with confidence_snapshot.
+        feedback: Feedback records with confidence_snapshot, as dicts or
+            FeedbackColumns.
         current_threshold: Current confidence threshold.
         target_tp_retention: Minimum TP retention rate to maintain.
 
@@ -49,19 +130,40 @@ def analyze_threshold(
             "projected_tp_retention": 1.0,
         }
 
-    # Extract confidence scores by type
-    tp_scores = [
-        f["confidence_snapshot"]
+    # Extract confidence scores by type in a single pass
+    if isinstance(feedback, FeedbackColumns):
+        has_score = ~np.isnan(feedback.confidence)
+        tp_scores = feedback.confidence[feedback.is_tp & has_score]
+        fp_scores = feedback.confidence[feedback.is_fp & has_score]
+        n_tp, n_fp = len(tp_scores), len(fp_scores)
+    elif not any(
+        f["feedback_type"] == "false_positive" and f.get("confidence_snapshot") is not None
         for f in feedback
-        if f["feedback_type"] == "true_positive" and f.get("confidence_snapshot") is not None
-    ]
-    fp_scores = [
-        f["confidence_snapshot"]
-        for f in feedback
-        if f["feedback_type"] == "false_positive" and f.get("confidence_snapshot") is not None
-    ]
-
-    total = len(tp_scores) + len(fp_scores)
+    ):
+        # No scored FPs (common with early data) leaves nothing to tune, so
+        # only count the TPs instead of collecting their scores
+        n_tp = sum(
+            1 for f in feedback
+            if f["feedback_type"] == "true_positive" and f.get("confidence_snapshot") is not None
+        )
+        n_fp = 0
+    else:
+        tp_scores = []
+        fp_scores = []
+        tp_append = tp_scores.append
+        fp_append = fp_scores.append
+        for f in feedback:
+            score = f.get("confidence_snapshot")
+            if score is None:
+                continue
+            feedback_type = f["feedback_type"]
+            if feedback_type == "true_positive":
+                tp_append(score)
+            elif feedback_type == "false_positive":
+                fp_append(score)
+        n_tp, n_fp = len(tp_scores), len(fp_scores)
+
+    total = n_tp + n_fp
     if total == 0:
         return {
             "samples_analyzed": 0,
@@ -74,11 +176,11 @@ def analyze_threshold(
         }
 
     # Current rates (assuming all samples passed current threshold)
-    current_fp_rate = len(fp_scores) / total
-    current_tp_rate = len(tp_scores) / total
+    current_fp_rate = n_fp / total
+    current_tp_rate = n_tp / total
 
     # If no FPs, keep current threshold
-    if len(fp_scores) == 0:
+    if n_fp == 0:
         return {
             "samples_analyzed": total,
             "current_threshold": current_threshold,
@@ -91,25 +193,13 @@ def analyze_threshold(
 
     # Search for optimal threshold
     # Try thresholds from 0.50 to 0.95 in 0.01 increments
-    best_threshold = current_threshold
-    best_fp_rate = current_fp_rate
-    best_tp_retention = 1.0
-
-    for thresh in np.arange(0.50, 0.96, 0.01):
-        # Count how many would pass at this threshold
-        tp_passing = sum(1 for s in tp_scores if s >= thresh)
-        fp_passing = sum(1 for s in fp_scores if s >= thresh)
-
-        # Calculate rates
-        tp_retention = tp_passing / len(tp_scores) if tp_scores else 1.0
-        new_total = tp_passing + fp_passing
-        new_fp_rate = fp_passing / new_total if new_total > 0 else 0
-
-        # Check if this threshold meets our constraints and improves FP rate
-        if tp_retention >= target_tp_retention and new_fp_rate < best_fp_rate:
-            best_threshold = thresh
-            best_fp_rate = new_fp_rate
-            best_tp_retention = tp_retention
+    thresholds = np.arange(0.50, 0.96, 0.01)
+    tp_sorted = np.sort(np.asarray(tp_scores, dtype=np.float64))
+    fp_sorted = np.sort(np.asarray(fp_scores, dtype=np.float64))
+    best, best_fp_rate, best_tp_retention = _threshold_sweep(
+        tp_sorted, fp_sorted, thresholds, target_tp_retention, current_fp_rate
+    )
+    best_threshold = float(thresholds[best]) if best >= 0 else current_threshold
 
     return {
         "samples_analyzed": total,
@@ -122,6 +212,53 @@ def analyze_threshold(
     }
 
 
+def _fit_logistic_newton(
+    X: np.ndarray,
+    y: np.ndarray,
+    l2: float = 1.0,
+    max_iter: int = 50,
+    tol: float = 1e-8,
+) -> tuple[np.ndarray, float]:
+    """Fit L2-regularized logistic regression by Newton's method (IRLS).
+
+    Minimizes the same objective as scikit-learn's default
+    LogisticRegression(C=1/l2): summed log-loss plus l2/2 * ||coef||^2, with
+    an unpenalized intercept. With only a handful of features the Hessian
+    solve is tiny, and Newton converges in a few iterations where lbfgs
+    needs many line-search steps.
+
+    Args:
+        X: Feature matrix, shape (n_samples, n_features).
+        y: Labels in {0, 1}, shape (n_samples,).
+        l2: Regularization strength on the coefficients.
+        max_iter: Maximum Newton iterations.
+        tol: Stop once no parameter moves by more than this.
+
+    Returns:
+        Tuple of (coefficients, intercept).
+    """
+    n_samples, n_features = X.shape
+    # Intercept as a trailing column of ones
+    A = np.empty((n_samples, n_features + 1))
+    A[:, :n_features] = X
+    A[:, n_features] = 1.0
+    reg = np.full(n_features + 1, l2)
+    reg[n_features] = 0.0
+
+    w = np.zeros(n_features + 1)
+    for _ in range(max_iter):
+        p = 0.5 * (1.0 + np.tanh(0.5 * (A @ w)))  # Overflow-free sigmoid
+        grad = A.T @ (p - y) + reg * w
+        hess = (A.T * (p * (1.0 - p))) @ A
+        hess[np.diag_indices_from(hess)] += reg
+        step = np.linalg.solve(hess, grad)
+        w -= step
+        if np.abs(step).max() < tol:
+            break
+
+    return w[:n_features], float(w[n_features])
+
+
 def analyze_weights(
     feedback: list[dict[str, Any]],
     min_samples: int = 50,
@@ -142,64 +279,85 @@ def analyze_weights(
     ]
 
     if len(valid_feedback) < min_samples:
-        return {
-            "samples_analyzed": len(valid_feedback),
-            "learned_weights": None,
-            "error": f"Insufficient samples: {len(valid_feedback)} < {min_samples} required",
-        }
+        return _insufficient_weight_samples(len(valid_feedback), min_samples)
 
-    # Build feature matrix and labels
-    X = []
-    y = []
+    # Build feature matrix and labels, filled in place
+    keys = _FEATURE_KEYS
+    X = np.empty((len(valid_feedback), len(keys)), dtype=np.float64)
+    y = np.empty(len(valid_feedback), dtype=np.int8)
 
-    for f in valid_feedback:
-        features = f["detection_features"]
+    for i, f in enumerate(valid_feedback):
+        get = f["detection_features"].get
 
-        # Extract features in consistent order
-        row = []
-        for key, name in FEATURE_KEY_MAP.items():
-            value = features.get(key, 0.5)  # Default to 0.5 if missing
-            row.append(value)
+        # Extract features in consistent order, defaulting to 0.5 if missing
+        X[i] = [get(key, 0.5) for key in keys]
+        y[i] = f["feedback_type"] == "true_positive"
 
-        X.append(row)
-        y.append(1 if f["feedback_type"] == "true_positive" else 0)
+    return analyze_feature_matrix(X, y, min_samples=min_samples)
 
-    X = np.array(X)
-    y = np.array(y)
 
-    # Standardize features
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
+def _insufficient_weight_samples(n: int, min_samples: int) -> dict[str, Any]:
+    """Stage 2 result for too few samples with detection features."""
+    return {
+        "samples_analyzed": n,
+        "learned_weights": None,
+        "error": f"Insufficient samples: {n} < {min_samples} required",
+    }
+
+
+def analyze_feature_matrix(
+    X: np.ndarray,
+    y: np.ndarray,
+    min_samples: int = 50,
+) -> dict[str, Any]:
+    """Stage 2 on a prebuilt feature matrix, e.g. from load_feature_matrix().
+
+    Args:
+        X: Feature matrix, one row per sample in FEATURE_KEY_MAP order.
+        y: Labels, 1 for true positives and 0 for false positives.
+        min_samples: Minimum samples required for training.
+
+    Returns:
+        Analysis results with learned weights, as analyze_weights().
+    """
+    if len(y) < min_samples:
+        return _insufficient_weight_samples(len(y), min_samples)
+
+    if y.min() == y.max():
+        raise ValueError("Weight optimization needs both true and false positive samples")
+
+    # Standardize features (constant columns are only centered)
+    std = X.std(axis=0)
+    std[std == 0] = 1.0
+    X_scaled = (X - X.mean(axis=0)) / std
 
     # Train logistic regression
-    model = LogisticRegression(max_iter=1000, random_state=42)
-    model.fit(X_scaled, y)
+    coef, intercept = _fit_logistic_newton(X_scaled, y)
 
     # Convert coefficients to weights (normalize to sum to 1)
-    coefs = np.abs(model.coef_[0])
+    coefs = np.abs(coef)
     weights = coefs / coefs.sum()
 
     # Build weight dictionary
-    learned_weights = {}
-    for i, name in enumerate(FEATURE_KEY_MAP.values()):
-        learned_weights[name] = round(float(weights[i]), 3)
+    learned_weights = {
+        name: round(float(w), 3) for name, w in zip(_FEATURE_KEY_NAMES, weights)
+    }
 
     # Calculate model accuracy on training data
-    accuracy = model.score(X_scaled, y)
+    accuracy = float(np.mean((X_scaled @ coef + intercept > 0) == y))
 
     return {
-        "samples_analyzed": len(valid_feedback),
+        "samples_analyzed": len(y),
         "learned_weights": learned_weights,
         "model_accuracy": round(accuracy, 3),
         "feature_importances": {
-            name: round(float(coefs[i]), 3)
-            for i, name in enumerate(FEATURE_KEY_MAP.values())
+            name: round(float(c), 3) for name, c in zip(_FEATURE_KEY_NAMES, coefs)
         },
     }
 
 
 def analyze_calibration(
-    feedback: list[dict[str, Any]],
+    feedback: list[dict[str, Any]] | FeedbackColumns,
     min_samples: int = 200,
 ) -> dict[str, Any]:
     """Stage 3: Learn confidence calibration using isotonic regression.
@@ -208,29 +366,33 @@ def analyze_calibration(
     actual TP rate at each confidence level.
 
     Args:
-        feedback: List of feedback records with confidence_snapshot.
+        feedback: Feedback records with confidence_snapshot, as dicts or
+            FeedbackColumns.
         min_samples: Minimum samples required for calibration.
 
     Returns:
         Analysis results with calibration mapping.
     """
     # Filter to samples with confidence
-    valid_feedback = [
-        f for f in feedback
-        if f.get("confidence_snapshot") is not None
-    ]
-
-    if len(valid_feedback) < min_samples:
+    if isinstance(feedback, FeedbackColumns):
+        has_score = ~np.isnan(feedback.confidence)
+        confidences = feedback.confidence[has_score]
+        labels = feedback.is_tp[has_score].astype(int)
+    else:
+        valid_feedback = [
+            f for f in feedback
+            if f.get("confidence_snapshot") is not None
+        ]
+        confidences = np.array([f["confidence_snapshot"] for f in valid_feedback])
+        labels = np.array([1 if f["feedback_type"] == "true_positive" else 0 for f in valid_feedback])
+
+    if len(confidences) < min_samples:
         return {
-            "samples_analyzed": len(valid_feedback),
+            "samples_analyzed": len(confidences),
             "calibration_map": None,
-            "error": f"Insufficient samples: {len(valid_feedback)} < {min_samples} required",
+            "error": f"Insufficient samples: {len(confidences)} < {min_samples} required",
         }
 
-    # Build arrays
-    confidences = np.array([f["confidence_snapshot"] for f in valid_feedback])
-    labels = np.array([1 if f["feedback_type"] == "true_positive" else 0 for f in valid_feedback])
-
     # Fit isotonic regression
     iso_reg = IsotonicRegression(out_of_bounds="clip")
     iso_reg.fit(confidences, labels)
@@ -257,7 +419,7 @@ def analyze_calibration(
             bin_accuracies.append(0)
 
     return {
-        "samples_analyzed": len(valid_feedback),
+        "samples_analyzed": len(confidences),
         "calibration_map": calibration_map,
         "bin_counts": bin_counts,
         "bin_accuracies": bin_accuracies,
@@ -4,13 +4,16 @@ Analyzes user corrections to auto-generated trajectory parameters
 to suggest better defaults and identify patterns.
 """
 
-from collections import Counter, defaultdict
+from collections import defaultdict
+from operator import itemgetter
 from typing import Any, Optional
 
 
 # Height ordinal mapping for computing change direction
 HEIGHT_ORDINAL = {"low": 0, "medium": 1, "high": 2}
 
+_NUMERIC = (int, float)
+
 
 def compute_delta(
     auto_params: Optional[dict[str, Any]],
@@ -43,42 +46,104 @@ def compute_delta(
     if auto_params is None or final_params is None:
         return None
 
+    # A key missing from either side counts as None. Keys in auto_params are
+    # compared in one pass; keys only in final_params can only differ from
+    # that implicit None.
     deltas = {}
-    all_keys = set(auto_params.keys()) | set(final_params.keys())
-
-    for key in all_keys:
-        auto_val = auto_params.get(key)
+    for key, auto_val in auto_params.items():
         final_val = final_params.get(key)
+        if auto_val != final_val:
+            deltas[key] = _delta_entry(key, auto_val, final_val)
 
-        if auto_val == final_val:
-            continue  # No change
+    for key in final_params.keys() - auto_params.keys():
+        final_val = final_params[key]
+        if final_val is not None:
+            deltas[key] = _delta_entry(key, None, final_val)
 
-        delta_entry: dict[str, Any] = {
-            "from": auto_val,
-            "to": final_val,
-        }
+    return deltas
+
+
+def _delta_entry(key: str, auto_val: Any, final_val: Any) -> dict[str, Any]:
+    """Describe one changed parameter for compute_delta()."""
+    delta_entry: dict[str, Any] = {
+        "from": auto_val,
+        "to": final_val,
+    }
 
-        # Compute ordinal change for height
-        if key == "height" and auto_val in HEIGHT_ORDINAL and final_val in HEIGHT_ORDINAL:
-            change = HEIGHT_ORDINAL[final_val] - HEIGHT_ORDINAL[auto_val]
-            delta_entry["change"] = f"+{change}" if change > 0 else str(change)
+    # Compute ordinal change for height
+    if key == "height" and auto_val in HEIGHT_ORDINAL and final_val in HEIGHT_ORDINAL:
+        change = HEIGHT_ORDINAL[final_val] - HEIGHT_ORDINAL[auto_val]
+        delta_entry["change"] = f"+{change}" if change > 0 else str(change)
+
+    # Compute numeric change for flight_time
+    elif key == "flight_time" and isinstance(auto_val, _NUMERIC) and isinstance(final_val, _NUMERIC):
+        delta_entry["change"] = round(final_val - auto_val, 2)
+
+    return delta_entry
+
+
+def _mode(values: list[Any]) -> tuple[Any, int]:
+    """Most frequent value and its count; ties go to the first seen.
+
+    A plain counting pass and one max(), without Counter.most_common()'s
+    heap selection.
+    """
+    counts: dict[Any, int] = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return max(counts.items(), key=itemgetter(1))
 
-        # Compute numeric change for flight_time
-        elif key == "flight_time" and isinstance(auto_val, (int, float)) and isinstance(final_val, (int, float)):
-            delta_entry["change"] = round(final_val - auto_val, 2)
 
-        deltas[key] = delta_entry
+def _height_step(from_val: Any, to_val: Any) -> int:
+    """Ordinal height change, or 0 if either side is not a known height."""
+    if from_val in HEIGHT_ORDINAL and to_val in HEIGHT_ORDINAL:
+        return HEIGHT_ORDINAL[to_val] - HEIGHT_ORDINAL[from_val]
+    return 0
 
+
+def _numeric_step(from_val: Any, to_val: Any) -> float:
+    """Numeric change, or 0 if either side is not a number."""
+    if isinstance(from_val, _NUMERIC) and isinstance(to_val, _NUMERIC):
+        return to_val - from_val
+    return 0
+
+
+# Direction of a change for the params that have one (positive = up)
+_DIRECTION_STEPS = {"height": _height_step, "flight_time": _numeric_step}
+
+
+def compute_deltas(feedback_records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Compute the non-empty parameter deltas for a batch of feedback records.
+
+    Records that were auto-accepted or left unchanged are skipped. Pass the
+    result to analyze_common_adjustments() and suggest_default_params() via
+    their ``deltas`` argument to compute it only once when running both.
+
+    Args:
+        feedback_records: List of feedback records with auto_params and final_params.
+
+    Returns:
+        List of compute_delta() results, one per changed record.
+    """
+    deltas = []
+    for record in feedback_records:
+        delta = compute_delta(record.get("auto_params"), record.get("final_params"))
+        if delta:
+            deltas.append(delta)
     return deltas
 
 
-def analyze_common_adjustments(feedback_records: list[dict[str, Any]]) -> dict[str, Any]:
+def analyze_common_adjustments(
+    feedback_records: list[dict[str, Any]],
+    deltas: Optional[list[dict[str, Any]]] = None,
+) -> dict[str, Any]:
     """Analyze patterns in how users adjust auto-generated params.
 
     Args:
         feedback_records: List of feedback records, each containing:
             - auto_params: The auto-generated parameters
             - final_params: The user's final parameters (None if auto-accepted)
+        deltas: Precomputed compute_deltas(feedback_records), if available.
 
     Returns:
         Dict with per-parameter statistics:
@@ -98,17 +163,13 @@ def analyze_common_adjustments(feedback_records: list[dict[str, Any]]) -> dict[s
 
         Returns empty dict if no changes found.
     """
+    if deltas is None:
+        deltas = compute_deltas(feedback_records)
+
     # Track changes per parameter
     param_changes: dict[str, list[tuple[Any, Any]]] = defaultdict(list)
 
-    for record in feedback_records:
-        auto_params = record.get("auto_params")
-        final_params = record.get("final_params")
-
-        delta = compute_delta(auto_params, final_params)
-        if delta is None or not delta:
-            continue
-
+    for delta in deltas:
         for param_name, change_info in delta.items():
             from_val = change_info["from"]
             to_val = change_info["to"]
@@ -121,38 +182,34 @@ def analyze_common_adjustments(feedback_records: list[dict[str, Any]]) -> dict[s
 
     for param_name, changes in param_changes.items():
         total_changes = len(changes)
+        step = _DIRECTION_STEPS.get(param_name)
+
+        # Count transition patterns, and direction for ordinal/numeric params,
+        # in one pass over the changes
+        counts: dict[tuple[Any, Any], int] = {}
+        if step is None:
+            for change in changes:
+                counts[change] = counts.get(change, 0) + 1
+        else:
+            changes_up = 0
+            changes_down = 0
+            for change in changes:
+                counts[change] = counts.get(change, 0) + 1
+                direction = step(*change)
+                if direction > 0:
+                    changes_up += 1
+                elif direction < 0:
+                    changes_down += 1
 
-        # Count transition patterns
-        transition_counts = Counter(changes)
-        most_common_transition = transition_counts.most_common(1)[0]
-        most_common = (
-            most_common_transition[0][0],  # from
-            most_common_transition[0][1],  # to
-            most_common_transition[1],     # count
-        )
+        (from_val, to_val), count = max(counts.items(), key=itemgetter(1))
+        most_common = (from_val, to_val, count)
 
         param_result: dict[str, Any] = {
             "total_changes": total_changes,
             "most_common": most_common,
         }
 
-        # Compute direction for ordinal/numeric params
-        if param_name == "height":
-            changes_up = 0
-            changes_down = 0
-            for from_val, to_val in changes:
-                if from_val in HEIGHT_ORDINAL and to_val in HEIGHT_ORDINAL:
-                    change = HEIGHT_ORDINAL[to_val] - HEIGHT_ORDINAL[from_val]
-                    if change > 0:
-                        changes_up += 1
-                    elif change < 0:
-                        changes_down += 1
-            param_result["changes_up"] = changes_up
-            param_result["changes_down"] = changes_down
-
-        elif param_name == "flight_time":
-            changes_up = sum(1 for f, t in changes if isinstance(f, (int, float)) and isinstance(t, (int, float)) and t > f)
-            changes_down = sum(1 for f, t in changes if isinstance(f, (int, float)) and isinstance(t, (int, float)) and t < f)
+        if step is not None:
             param_result["changes_up"] = changes_up
             param_result["changes_down"] = changes_down
 
@@ -164,6 +221,7 @@ def analyze_common_adjustments(feedback_records: list[dict[str, Any]]) -> dict[s
 def suggest_default_params(
     feedback_records: list[dict[str, Any]],
     min_samples: int = 10,
+    deltas: Optional[list[dict[str, Any]]] = None,
 ) -> dict[str, Any]:
     """Suggest better default params based on user feedback patterns.
 
@@ -173,6 +231,7 @@ def suggest_default_params(
     Args:
         feedback_records: List of feedback records with auto_params and final_params.
         min_samples: Minimum number of samples needed for a confident suggestion.
+        deltas: Precomputed compute_deltas(feedback_records), if available.
 
     Returns:
         Suggested defaults with confidence for each parameter:
@@ -184,20 +243,15 @@ def suggest_default_params(
 
         Returns empty dict if insufficient samples or no clear patterns.
     """
-    if not feedback_records:
-        return {}
+    if deltas is None:
+        if not feedback_records:
+            return {}
+        deltas = compute_deltas(feedback_records)
 
     # Track what values users change parameters TO
     param_target_values: dict[str, list[Any]] = defaultdict(list)
 
-    for record in feedback_records:
-        auto_params = record.get("auto_params")
-        final_params = record.get("final_params")
-
-        delta = compute_delta(auto_params, final_params)
-        if delta is None or not delta:
-            continue
-
+    for delta in deltas:
         for param_name, change_info in delta.items():
             to_val = change_info["to"]
             param_target_values[param_name].append(to_val)
@@ -216,8 +270,7 @@ def suggest_default_params(
 
         # For numeric params (flight_time), compute most common value
         if param_name == "flight_time":
-            value_counts = Counter(target_values)
-            most_common_val, most_common_count = value_counts.most_common(1)[0]
+            most_common_val, most_common_count = _mode(target_values)
             confidence = most_common_count / samples
             suggestions[param_name] = {
                 "value": most_common_val,
@@ -226,8 +279,7 @@ def suggest_default_params(
             }
         else:
             # For categorical params, use mode (most common value)
-            value_counts = Counter(target_values)
-            most_common_val, most_common_count = value_counts.most_common(1)[0]
+            most_common_val, most_common_count = _mode(target_values)
             confidence = most_common_count / samples
 
             suggestions[param_name] = {